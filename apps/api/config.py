@@ -5,12 +5,15 @@ Loads configuration from environment variables with sensible defaults.
 """
 
 import os
-from typing import Literal
-from pydantic_settings import BaseSettings
+from typing import Any, Dict, Literal, Optional, Tuple, Type, TypeVar
 from functools import lru_cache
 
+import msgspec
+from msgspec.structs import fields, force_setattr
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+
+class Settings(msgspec.Struct, frozen=True):
     """
     Application settings loaded from environment variables.
 
@@ -28,6 +31,8 @@ class Settings(BaseSettings):
         BATCH_SIZE: Max spans per batch (default: 1000)
         BATCH_TIMEOUT: Max seconds before flush (default: 5.0)
         MAX_QUEUE_SIZE: Max spans in queue (default: 10000)
+        MAX_VALIDATION_ERRORS: Max errors reported per 422 response (default: 100)
+        HEALTH_CACHE_TTL: Seconds a health/metrics response is reused (default: 0.25)
     """
 
     # API Server
@@ -41,6 +46,7 @@ class Settings(BaseSettings):
 
     # CORS
     cors_origins: str = "*"  # Comma-separated origins
+    cors_origins_list: Tuple[str, ...] = ()  # Derived from cors_origins
 
     # Storage
     storage_backend: Literal["local", "s3"] = "local"
@@ -57,21 +63,21 @@ class Settings(BaseSettings):
     batch_timeout: float = 5.0  # Seconds
     max_queue_size: int = 10000  # Max spans in queue
 
+    # Validation
+    max_validation_errors: int = 100  # Max errors reported per 422 response
+
     # Metrics
     enable_metrics: bool = True
     metrics_port: int = 9090
+    health_cache_ttl: float = 0.25  # Seconds
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        env_prefix = ""
-
-    @property
-    def cors_origins_list(self) -> list[str]:
-        """Get CORS origins as a list."""
+    def __post_init__(self) -> None:
+        """Split CORS origins once so callers can share the parsed tuple."""
         if self.cors_origins == "*":
-            return ["*"]
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+            origins: Tuple[str, ...] = ("*",)
+        else:
+            origins = tuple(origin.strip() for origin in self.cors_origins.split(","))
+        force_setattr(self, "cors_origins_list", origins)
 
     def validate_config(self) -> None:
         """
@@ -92,6 +98,102 @@ class Settings(BaseSettings):
         if self.max_queue_size <= 0:
             raise ValueError("MAX_QUEUE_SIZE must be positive")
 
+        if self.max_validation_errors <= 0:
+            raise ValueError("MAX_VALIDATION_ERRORS must be positive")
+
+
+class AuditSettings(msgspec.Struct, frozen=True):
+    """
+    Audit subsystem settings loaded from environment variables.
+
+    Environment variables:
+        AUDIT_STORAGE_BACKEND: Audit storage backend, local or s3 (default: local)
+        AUDIT_STORAGE_PATH: Path for local audit storage (default: ./audit_logs)
+        AUDIT_S3_BUCKET: S3 bucket for audit logs (default: agenttrace-audit-logs)
+        AUDIT_S3_REGION: S3 region (default: us-east-1)
+        AWS_ACCESS_KEY_ID: AWS access key (default: default credential chain)
+        AWS_SECRET_ACCESS_KEY: AWS secret key (default: default credential chain)
+        AUDIT_RETENTION_DAYS: S3 Object Lock retention in days (default: 2555)
+        AUDIT_BATCH_SIZE: Events per batch write (default: 100)
+        AUDIT_BATCH_INTERVAL: Seconds between batch writes (default: 5.0)
+        AUDIT_ENABLE_DEDUPLICATION: Deduplicate repeated events (default: true)
+        AUDIT_DEDUPLICATION_WINDOW: Deduplication window in seconds (default: 60)
+        AUDIT_CAPTURE_API_ACCESS: Log every API request (default: true)
+    """
+
+    # Storage
+    audit_storage_backend: Literal["local", "s3"] = "local"
+    audit_storage_path: str = "./audit_logs"
+
+    # S3 Configuration (if using S3 backend)
+    audit_s3_bucket: str = "agenttrace-audit-logs"
+    audit_s3_region: str = "us-east-1"
+    aws_access_key_id: Optional[str] = None
+    aws_secret_access_key: Optional[str] = None
+    audit_retention_days: int = 2555  # 7 years for compliance
+
+    # Batch Processing
+    audit_batch_size: int = 100
+    audit_batch_interval: float = 5.0  # Seconds
+
+    # Deduplication
+    audit_enable_deduplication: bool = True
+    audit_deduplication_window: int = 60  # Seconds
+
+    # Middleware
+    audit_capture_api_access: bool = True
+
+
+# Fields computed in __post_init__ rather than read from the environment
+_DERIVED_FIELDS = frozenset({"cors_origins_list"})
+
+_S = TypeVar("_S", bound=msgspec.Struct)
+
+# Boolean spellings accepted from the environment (compared lower-cased),
+# mapped to the "true"/"false" text msgspec coerces
+_BOOL_STRINGS = {
+    **dict.fromkeys(("1", "true", "t", "yes", "y", "on"), "true"),
+    **dict.fromkeys(("0", "false", "f", "no", "n", "off"), "false"),
+}
+
+
+@lru_cache()
+def _merge_env_file(env_file: str = ".env") -> None:
+    """
+    Merge ``env_file`` into ``os.environ`` once per process.
+
+    Variables that are already set are not overridden.
+    """
+    for key, value in dotenv_values(env_file).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+
+def _load_from_env(settings_type: Type[_S]) -> _S:
+    """
+    Build a settings struct from the process environment.
+
+    Each field is read from the variable of the same name, matched
+    case-insensitively, and coerced to the declared field type by msgspec.
+    Boolean fields also accept yes/no, on/off, y/n and t/f.
+
+    Raises:
+        msgspec.ValidationError: If a value cannot be coerced
+    """
+    _merge_env_file()
+
+    environ = {key.lower(): value for key, value in os.environ.items()}
+    raw: Dict[str, Any] = {}
+    for field in fields(settings_type):
+        name = field.name
+        if name in _DERIVED_FIELDS or name not in environ:
+            continue
+        value = environ[name]
+        if field.type is bool:
+            value = _BOOL_STRINGS.get(value.strip().lower(), value)
+        raw[name] = value
+    return msgspec.convert(raw, settings_type, strict=False)
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -103,6 +205,17 @@ def get_settings() -> Settings:
     Returns:
         Settings: Application settings
     """
-    settings = Settings()
+    settings = _load_from_env(Settings)
     settings.validate_config()
     return settings
+
+
+@lru_cache()
+def get_audit_settings() -> AuditSettings:
+    """
+    Get cached audit settings instance.
+
+    Returns:
+        AuditSettings: Audit subsystem settings
+    """
+    return _load_from_env(AuditSettings)
@@ -4,25 +4,44 @@ Example: Complete Audit System Integration
 This example shows how to integrate the audit system into a FastAPI application.
 """
 
-import os
+import csv
+import io
+import random
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, Depends, HTTPException
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
+from apps.api.config import get_audit_settings
 from apps.api.models.audit import (
+    AuditEvent,
+    AuditEventFilter,
     EventCategory,
+    Severity,
     Action,
     ActorType,
     DataEventTypes,
     ConfigEventTypes,
+    EVENT_JSON_OPTIONS,
 )
-from apps.api.services.audit_storage import LocalAuditStorage, S3AuditStorage
 from apps.api.services.audit import AuditService, set_audit_service, get_audit_service
 from apps.api.services.audit_helpers import AuditHelper
 from apps.api.middleware import AuditMiddleware, get_audit_context_dependency, RequestContext
 
 
+# Trace IDs are display identifiers, not secrets, so they come from the
+# process-wide PRNG rather than a per-request os.urandom() syscall. The
+# random module reseeds itself in forked children, so workers don't collide.
+_randbits = random.getrandbits
+
+
 # Global audit helper
 _audit_helper: AuditHelper = None
 
@@ -32,34 +51,44 @@ def get_audit_helper() -> AuditHelper:
     return _audit_helper
 
 
+def audit_service_dep() -> AuditService:
+    """Dependency to get the audit service, resolved once per request."""
+    return get_audit_service()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     global _audit_helper
 
-    # Initialize storage backend
-    storage_backend = os.getenv("AUDIT_STORAGE_BACKEND", "local")
+    settings = get_audit_settings()
+
+    # Storage backends are imported on demand so the S3 path (and boto3)
+    # is only loaded when it is actually configured
+    if settings.audit_storage_backend == "s3":
+        from apps.api.services.audit_storage import S3AuditStorage
 
-    if storage_backend == "s3":
         storage = S3AuditStorage(
-            bucket_name=os.getenv("AUDIT_S3_BUCKET", "agenttrace-audit-logs"),
-            region=os.getenv("AUDIT_S3_REGION", "us-east-1"),
-            access_key=os.getenv("AWS_ACCESS_KEY_ID"),
-            secret_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            retention_days=int(os.getenv("AUDIT_RETENTION_DAYS", "2555"))
+            bucket_name=settings.audit_s3_bucket,
+            region=settings.audit_s3_region,
+            access_key=settings.aws_access_key_id,
+            secret_key=settings.aws_secret_access_key,
+            retention_days=settings.audit_retention_days
         )
     else:
+        from apps.api.services.audit_storage import LocalAuditStorage
+
         storage = LocalAuditStorage(
-            base_path=os.getenv("AUDIT_STORAGE_PATH", "./audit_logs")
+            base_path=settings.audit_storage_path
         )
 
     # Initialize audit service
     audit_service = AuditService(
         storage=storage,
-        batch_size=int(os.getenv("AUDIT_BATCH_SIZE", "100")),
-        batch_interval=float(os.getenv("AUDIT_BATCH_INTERVAL", "5.0")),
-        enable_deduplication=os.getenv("AUDIT_ENABLE_DEDUPLICATION", "true").lower() == "true",
-        deduplication_window=int(os.getenv("AUDIT_DEDUPLICATION_WINDOW", "60"))
+        batch_size=settings.audit_batch_size,
+        batch_interval=settings.audit_batch_interval,
+        enable_deduplication=settings.audit_enable_deduplication,
+        deduplication_window=settings.audit_deduplication_window
     )
 
     # Start the service
@@ -99,16 +128,15 @@ app.add_middleware(
 app.add_middleware(
     AuditMiddleware,
     audit_service=None,  # Will be set from global
-    capture_api_access=os.getenv("AUDIT_CAPTURE_API_ACCESS", "true").lower() == "true",
-    exclude_paths=["/health", "/metrics", "/docs", "/openapi.json"]
+    capture_api_access=get_audit_settings().audit_capture_api_access,
+    exclude_paths=["/health", "/metrics", "/docs", "/docs/*", "/openapi.json"]
 )
 
 
 # Health check (excluded from audit)
 @app.get("/health")
-async def health():
+async def health(audit_service: AuditService = Depends(audit_service_dep)):
     """Health check endpoint."""
-    audit_service = get_audit_service()
     return {
         "status": "healthy",
         "audit_system": {
@@ -131,7 +159,7 @@ async def create_trace(
     This example shows automatic audit capture using the helper.
     """
     # Simulate trace creation
-    trace_id = "trace-" + os.urandom(8).hex()
+    trace_id = f"trace-{_randbits(64):016x}"
     organization_id = trace_data.get("organization_id", "org-demo")
     project_id = trace_data.get("project_id", "proj-demo")
 
@@ -178,10 +206,7 @@ async def get_trace(
         organization_id=trace["organization_id"],
         project_id=trace["project_id"],
         trace_id=trace_id,
-        metadata={
-            "request_id": audit_ctx.request_id,
-            "actor": audit_ctx.actor_email or audit_ctx.actor_id
-        }
+        metadata=audit_ctx.base_metadata
     )
 
     return trace
@@ -215,8 +240,8 @@ async def delete_trace(
         trace_id=trace_id,
         trace_data=trace,  # Capture what was deleted
         metadata={
-            "reason": "User requested deletion",
-            "request_id": audit_ctx.request_id
+            **audit_ctx.base_metadata,
+            "reason": "User requested deletion"
         }
     )
 
@@ -251,10 +276,7 @@ async def export_trace(
         project_id=trace["project_id"],
         trace_id=trace_id,
         export_format=format,
-        metadata={
-            "request_id": audit_ctx.request_id,
-            "actor": audit_ctx.actor_email or audit_ctx.actor_id
-        }
+        metadata=audit_ctx.base_metadata
     )
 
     # Perform export
@@ -268,7 +290,8 @@ async def export_trace(
 async def update_project(
     project_id: str,
     updates: dict,
-    audit_ctx: RequestContext = Depends(get_audit_context_dependency)
+    audit_ctx: RequestContext = Depends(get_audit_context_dependency),
+    audit_service: AuditService = Depends(audit_service_dep)
 ):
     """
     Update a project with manual audit capture using context manager.
@@ -290,7 +313,7 @@ async def update_project(
 
     # Capture audit event with before/after state
     async with audit_context(
-        audit_service=get_audit_service(),
+        audit_service=audit_service,
         organization_id="org-demo",
         event_category=EventCategory.CONFIG,
         event_type=ConfigEventTypes.PROJECT_UPDATED,
@@ -314,37 +337,64 @@ async def update_project(
 
 
 # Example: Query audit events
+_QUERY_CACHE_TTL = 2.0  # Seconds
+_QUERY_CACHE_MAXSIZE = 1024
+
+# (organization_id, event_category, limit, offset) -> (expires_at, version, events)
+_query_cache: Dict[Tuple, Tuple[float, int, List[AuditEvent]]] = {}
+
+
+@lru_cache(maxsize=256)
+def _make_filter(
+    organization_id: str,
+    event_category: Optional[str],
+    limit: int,
+    offset: int
+) -> AuditEventFilter:
+    """
+    Build (and memoize) the filter for a query.
+
+    The returned filter is shared between requests and must not be mutated.
+    """
+    return AuditEventFilter(
+        organization_id=organization_id,
+        event_category=EventCategory(event_category) if event_category else None,
+        limit=limit,
+        offset=offset
+    )
+
+
 @app.get("/audit/events")
 async def query_audit_events(
     organization_id: str,
     event_category: str = None,
     limit: int = 100,
     offset: int = 0,
-    audit_ctx: RequestContext = Depends(get_audit_context_dependency)
+    audit_ctx: RequestContext = Depends(get_audit_context_dependency),
+    audit_service: AuditService = Depends(audit_service_dep)
 ):
     """
     Query audit events.
 
     This endpoint itself generates an audit event for viewing audit logs.
     """
-    from apps.api.models.audit import AuditEventFilter, EventCategory as EC
+    filter = _make_filter(organization_id, event_category, limit, offset)
 
-    audit_service = get_audit_service()
+    # Dashboards poll with identical parameters; reuse the last result while
+    # it is fresh and no event has been captured for the org since
+    cache_key = (organization_id, event_category, limit, offset)
+    version = audit_service.get_org_version(organization_id)
+    now = time.monotonic()
+    cached = _query_cache.get(cache_key)
 
-    # Create filter
-    filter_dict = {
-        "organization_id": organization_id,
-        "limit": limit,
-        "offset": offset
-    }
-
-    if event_category:
-        filter_dict["event_category"] = EC(event_category)
-
-    filter = AuditEventFilter(**filter_dict)
-
-    # Query events
-    events = await audit_service.query_events(filter)
+    if cached and cached[0] > now and cached[1] == version:
+        events = cached[2]
+    else:
+        events = await audit_service.query_events(filter)
+        if cache_key not in _query_cache and len(_query_cache) >= _QUERY_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _query_cache[next(iter(_query_cache))]
+        _query_cache[cache_key] = (now + _QUERY_CACHE_TTL, version, events)
 
     # Log that audit logs were viewed (meta!)
     await audit_service.capture_event(
@@ -364,43 +414,85 @@ async def query_audit_events(
         }
     )
 
-    return {
-        "events": [e.to_dict() for e in events],
-        "total": len(events),
-        "limit": limit,
-        "offset": offset
-    }
+    # Encode the events directly with orjson instead of building a list
+    # of to_dict() copies for FastAPI to re-encode
+    return Response(
+        content=orjson.dumps(
+            {
+                "events": events,
+                "total": len(events),
+                "limit": limit,
+                "offset": offset
+            },
+            default=str,
+            option=EVENT_JSON_OPTIONS
+        ),
+        media_type="application/json"
+    )
 
 
 # Example: Export audit events
+async def _ndjson_lines(events: AsyncIterator[AuditEvent]) -> AsyncIterator[bytes]:
+    """Encode events as newline-delimited JSON, one event per chunk."""
+    async for event in events:
+        yield event.to_json_bytes() + b"\n"
+
+
+async def _csv_lines(events: AsyncIterator[AuditEvent]) -> AsyncIterator[bytes]:
+    """Encode events as CSV, emitting the header with the first row."""
+    buffer = io.StringIO()
+    writer = None
+
+    async for event in events:
+        row = event.to_dict()
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow(row)
+
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+
 @app.post("/audit/export")
 async def export_audit_events(
     organization_id: str,
     format: str = "json",
-    audit_ctx: RequestContext = Depends(get_audit_context_dependency)
+    audit_ctx: RequestContext = Depends(get_audit_context_dependency),
+    audit_service: AuditService = Depends(audit_service_dep)
 ):
     """
     Export audit events for compliance reporting.
 
+    The events are streamed as they are read (NDJSON for "json", CSV for
+    "csv"), so memory use does not grow with the size of the export.
+
     This generates a CRITICAL severity audit event.
     """
-    from apps.api.models.audit import AuditEventFilter
-    from datetime import datetime, timedelta
+    if format not in ("json", "csv"):
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {format}")
 
-    audit_service = get_audit_service()
-
-    # Create filter for last 30 days
+    # Create filter for last 30 days. The stream pages by offset over
+    # newest-first results, so pin the end time to keep events captured
+    # mid-export from shifting the pages
+    now = datetime.now(timezone.utc)
     filter = AuditEventFilter(
         organization_id=organization_id,
-        start_time=datetime.now() - timedelta(days=30),
+        start_time=now - timedelta(days=30),
+        end_time=now,
         limit=10000
     )
 
-    # Export events
-    export_data = await audit_service.export_events(filter, format=format)
+    events = audit_service.stream_events(filter)
+    if format == "json":
+        body, media_type = _ndjson_lines(events), "application/x-ndjson"
+    else:
+        body, media_type = _csv_lines(events), "text/csv"
 
-    # Log the export with CRITICAL severity
-    await audit_service.capture_event(
+    # Log the export with CRITICAL severity once the body has been sent
+    log_export = BackgroundTask(
+        audit_service.capture_event,
         organization_id=organization_id,
         event_category=EventCategory.ADMIN,
         event_type="audit_log.exported",
@@ -418,26 +510,26 @@ async def export_audit_events(
         }
     )
 
-    return {
-        "format": format,
-        "data": export_data,
-        "organization_id": organization_id
-    }
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"X-Organization-ID": organization_id},
+        background=log_export
+    )
 
 
 # Example: Verify audit integrity
 @app.get("/audit/verify")
 async def verify_audit_integrity(
     organization_id: str,
-    audit_ctx: RequestContext = Depends(get_audit_context_dependency)
+    audit_ctx: RequestContext = Depends(get_audit_context_dependency),
+    audit_service: AuditService = Depends(audit_service_dep)
 ):
     """
     Verify the integrity of the audit chain.
 
     This is important for compliance and detecting tampering.
     """
-    audit_service = get_audit_service()
-
     # Verify integrity
     result = await audit_service.verify_integrity(organization_id)
 
@@ -6,6 +6,12 @@ High-performance async API for ingesting AI agent traces with:
 - Background processing
 - Multiple storage backends
 - Health checks and metrics
+
+Settings are parsed once at import and bound to ``SETTINGS``. Run under a
+preloading server (e.g. ``gunicorn --preload -k uvicorn.workers.UvicornWorker
+"ingestion_api:create_app()"``) so the master parses them and forked workers
+share the already-built struct via copy-on-write instead of re-reading the
+environment and ``.env`` themselves.
 """
 
 import logging
@@ -14,7 +20,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
@@ -31,6 +37,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Parsed once per process (or once in the master when preloaded)
+SETTINGS = get_settings()
+
 # Global ingestion service
 ingestion_service: IngestionService = None
 
@@ -45,30 +54,28 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting AgentTrace Ingestion API")
 
-    settings = get_settings()
-
     # Update log level from settings
-    logging.getLogger().setLevel(settings.log_level.upper())
-    logger.info(f"Log level set to {settings.log_level}")
+    logging.getLogger().setLevel(SETTINGS.log_level.upper())
+    logger.info(f"Log level set to {SETTINGS.log_level}")
 
     # Create storage backend
-    logger.info(f"Initializing {settings.storage_backend} storage backend")
+    logger.info(f"Initializing {SETTINGS.storage_backend} storage backend")
     storage = create_storage_backend(
-        backend_type=settings.storage_backend,
-        storage_path=settings.storage_path,
-        s3_bucket=settings.s3_bucket,
-        s3_region=settings.s3_region,
-        s3_access_key=settings.s3_access_key,
-        s3_secret_key=settings.s3_secret_key,
+        backend_type=SETTINGS.storage_backend,
+        storage_path=SETTINGS.storage_path,
+        s3_bucket=SETTINGS.s3_bucket,
+        s3_region=SETTINGS.s3_region,
+        s3_access_key=SETTINGS.s3_access_key,
+        s3_secret_key=SETTINGS.s3_secret_key,
     )
 
     # Create ingestion service
     global ingestion_service
     ingestion_service = IngestionService(
         storage=storage,
-        batch_size=settings.batch_size,
-        flush_interval=settings.batch_timeout,
-        max_queue_size=settings.max_queue_size,
+        batch_size=SETTINGS.batch_size,
+        flush_interval=SETTINGS.batch_timeout,
+        max_queue_size=SETTINGS.max_queue_size,
     )
 
     # Set ingestion service in routers
@@ -93,61 +100,38 @@ async def lifespan(app: FastAPI):
     logger.info("AgentTrace Ingestion API shutdown complete")
 
 
-# Create FastAPI app
-app = FastAPI(
-    title="AgentTrace Ingestion API",
-    description="High-performance API for ingesting AI agent traces",
-    version="1.0.0",
-    lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-)
-
-# Get settings
-settings = get_settings()
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
 # Exception handlers
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """
     Handle validation errors with detailed error messages.
 
     Returns structured error response with field-level details.
     """
-    errors = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"])
-        errors.append(
-            {
-                "field": field,
-                "message": error["msg"],
-                "type": error["type"],
-            }
-        )
-
-    logger.warning(f"Validation error on {request.url.path}: {errors}")
-
-    return JSONResponse(
+    raw_errors = exc.errors()
+
+    # Only format the first few errors; a huge invalid batch can report
+    # thousands and the client only needs enough to fix its payload
+    errors = [
+        {
+            "field": ".".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+        }
+        for error in raw_errors[: SETTINGS.max_validation_errors]
+    ]
+
+    logger.warning("Validation error on %s: %s", request.url.path, errors)
+
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
             "errors": errors,
+            "error_count": len(raw_errors),
         },
     )
 
 
-@app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """
     Handle unexpected errors.
@@ -156,22 +140,16 @@ async def general_exception_handler(request: Request, exc: Exception):
     """
     logger.error(f"Unexpected error on {request.url.path}: {exc}", exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
-            "message": str(exc) if settings.log_level == "debug" else None,
+            "message": str(exc) if SETTINGS.log_level == "debug" else None,
         },
     )
 
 
-# Register routers
-app.include_router(traces.router)
-app.include_router(health.router)
-
-
 # Root endpoint
-@app.get("/", include_in_schema=False)
 async def root():
     """
     Root endpoint.
@@ -188,14 +166,61 @@ async def root():
     }
 
 
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application.
+
+    Uses the module-level ``SETTINGS`` so that every app instance (and every
+    forked worker of a preloading server) shares one parsed configuration.
+
+    Returns:
+        FastAPI: Configured application
+    """
+    app = FastAPI(
+        title="AgentTrace Ingestion API",
+        description="High-performance API for ingesting AI agent traces",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+    )
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=SETTINGS.cors_origins_list,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Exception handlers
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(Exception, general_exception_handler)
+
+    # Register routers
+    app.include_router(traces.router)
+    app.include_router(health.router)
+    app.add_api_route("/", root, methods=["GET"], include_in_schema=False)
+
+    return app
+
+
+# Create FastAPI app
+app = create_app()
+
+
 # For development
 if __name__ == "__main__":
     import uvicorn
 
     uvicorn.run(
-        "ingestion_api:app",
-        host=settings.api_host,
-        port=settings.api_port,
-        reload=settings.api_reload,
-        log_level=settings.log_level,
+        "ingestion_api:create_app",
+        factory=True,
+        host=SETTINGS.api_host,
+        port=SETTINGS.api_port,
+        reload=SETTINGS.api_reload,
+        log_level=SETTINGS.log_level,
     )
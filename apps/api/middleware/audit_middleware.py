@@ -6,51 +6,113 @@ from HTTP requests. It extracts request context (IP, user agent, user info)
 and makes it available to route handlers.
 """
 
-from contextvars import ContextVar
-from typing import Optional, Dict, Any, Callable
-from uuid import uuid4
+import asyncio
+import logging
+import re
+from contextvars import Context, ContextVar
+from dataclasses import dataclass, field
+from secrets import token_hex
+from typing import Optional, Dict, Any, Callable, Iterable, Tuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ..models.audit import ActorType, EventCategory, Severity, Action
-from ..services.audit import AuditService
+from ..services.audit import AuditService, set_current_request_id
 
+logger = logging.getLogger(__name__)
 
-# Context variables for request-scoped data
-_request_id: ContextVar[str] = ContextVar('request_id', default='')
-_actor_id: ContextVar[str] = ContextVar('actor_id', default='system')
-_actor_type: ContextVar[ActorType] = ContextVar('actor_type', default=ActorType.SYSTEM)
-_actor_email: ContextVar[Optional[str]] = ContextVar('actor_email', default=None)
-_actor_ip: ContextVar[Optional[str]] = ContextVar('actor_ip', default=None)
-_actor_user_agent: ContextVar[Optional[str]] = ContextVar('actor_user_agent', default=None)
-_organization_id: ContextVar[Optional[str]] = ContextVar('organization_id', default=None)
-_session_id: ContextVar[Optional[str]] = ContextVar('session_id', default=None)
 
+# Paths excluded from API access auditing when none are configured
+DEFAULT_EXCLUDE_PATHS = ("/health", "/metrics", "/docs", "/docs/*", "/openapi.json")
 
+# Audit action recorded for each HTTP method; anything else is a READ
+_METHOD_TO_ACTION = {
+    "POST": Action.CREATE,
+    "GET": Action.READ,
+    "PUT": Action.UPDATE,
+    "PATCH": Action.UPDATE,
+    "DELETE": Action.DELETE,
+}
+
+# Above this many wildcard prefixes, one compiled regex beats the linear
+# str.startswith(tuple) scan
+_PREFIX_REGEX_THRESHOLD = 8
+
+# Raw ASGI header names (lower-cased bytes, as they appear in scope["headers"])
+_X_FORWARDED_FOR = b"x-forwarded-for"
+_X_REAL_IP = b"x-real-ip"
+_USER_AGENT = b"user-agent"
+_AUTHORIZATION = b"authorization"
+_X_API_KEY = b"x-api-key"
+_X_REQUEST_ID = b"x-request-id"
+
+# The request headers the middleware reads
+_AUDIT_HEADERS = frozenset(
+    (_X_FORWARDED_FOR, _X_REAL_IP, _USER_AGENT, _AUTHORIZATION, _X_API_KEY)
+)
+
+
+def _audit_headers(raw_headers: Iterable[Tuple[bytes, bytes]]) -> Dict[bytes, bytes]:
+    """
+    Collect the headers the middleware needs in one pass over the scope.
+
+    Like Starlette's Headers.get, the first occurrence of a repeated header
+    wins (for X-Forwarded-For that is the line nearest the client).
+
+    Args:
+        raw_headers: ASGI scope headers as (lower-cased name, value) pairs
+
+    Returns:
+        Mapping of the wanted header names to their raw values
+    """
+    headers = {}
+    for name, value in raw_headers:
+        if name in _AUDIT_HEADERS and name not in headers:
+            headers[name] = value
+    return headers
+
+
+@dataclass(frozen=True, slots=True)
 class RequestContext:
-    """Container for request context data."""
+    """
+    Container for request context data.
 
-    def __init__(
-        self,
-        request_id: str,
-        actor_id: str = "system",
-        actor_type: ActorType = ActorType.SYSTEM,
-        actor_email: Optional[str] = None,
-        actor_ip: Optional[str] = None,
-        actor_user_agent: Optional[str] = None,
-        organization_id: Optional[str] = None,
-        session_id: Optional[str] = None
-    ):
-        self.request_id = request_id
-        self.actor_id = actor_id
-        self.actor_type = actor_type
-        self.actor_email = actor_email
-        self.actor_ip = actor_ip
-        self.actor_user_agent = actor_user_agent
-        self.organization_id = organization_id
-        self.session_id = session_id
+    Immutable, so one instance can be shared by everything that handles the
+    request.
+    """
+
+    request_id: str
+    actor_id: str = "system"
+    actor_type: ActorType = ActorType.SYSTEM
+    actor_email: Optional[str] = None
+    actor_ip: Optional[str] = None
+    actor_user_agent: Optional[str] = None
+    organization_id: Optional[str] = None
+    session_id: Optional[str] = None
+    _base_metadata: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def actor(self) -> str:
+        """Actor label for logging: email when known, otherwise the actor ID."""
+        return self.actor_email or self.actor_id
+
+    @property
+    def base_metadata(self) -> Dict[str, Any]:
+        """
+        Metadata common to every audit event logged for this request.
+
+        Built once per request; extend it with ``{**ctx.base_metadata, ...}``
+        rather than mutating it.
+        """
+        if self._base_metadata is None:
+            object.__setattr__(
+                self, "_base_metadata",
+                {"request_id": self.request_id, "actor": self.actor}
+            )
+        return self._base_metadata
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -66,6 +128,13 @@ class RequestContext:
         }
 
 
+# The current request's context, set once per request by AuditMiddleware.
+# Outside of a request it falls back to an empty system context.
+_request_ctx: ContextVar[RequestContext] = ContextVar(
+    'request_ctx', default=RequestContext(request_id="")
+)
+
+
 def get_request_context() -> RequestContext:
     """
     Get the current request context.
@@ -75,32 +144,29 @@ def get_request_context() -> RequestContext:
     Returns:
         RequestContext with current request information
     """
-    return RequestContext(
-        request_id=_request_id.get(),
-        actor_id=_actor_id.get(),
-        actor_type=_actor_type.get(),
-        actor_email=_actor_email.get(),
-        actor_ip=_actor_ip.get(),
-        actor_user_agent=_actor_user_agent.get(),
-        organization_id=_organization_id.get(),
-        session_id=_session_id.get(),
-    )
+    return _request_ctx.get()
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
+class AuditMiddleware:
     """
-    FastAPI middleware for automatic audit event capture.
+    ASGI middleware for automatic audit event capture.
 
     This middleware:
     1. Extracts request context (IP, user agent, authentication)
-    2. Stores context in request-scoped context variables
+    2. Stores context in a request-scoped context variable
     3. Optionally captures API access events
     4. Adds request_id to response headers
 
+    It is implemented as plain ASGI rather than on BaseHTTPMiddleware, so
+    no Request/Response objects, task group or body stream are created
+    per request; headers are read straight from the ASGI scope.
+
     Configuration:
         audit_service: AuditService instance
         capture_api_access: Whether to log all API access (default: False)
-        exclude_paths: List of paths to exclude from audit (e.g., health checks)
+        exclude_paths: Paths to exclude from audit (e.g., health checks).
+            Entries match exactly; an entry ending in "/*" excludes
+            everything under that prefix.
         user_extractor: Custom function to extract user info from request
     """
 
@@ -109,31 +175,55 @@ class AuditMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         audit_service: Optional[AuditService] = None,
         capture_api_access: bool = False,
-        exclude_paths: Optional[list] = None,
-        user_extractor: Optional[Callable] = None
+        exclude_paths: Optional[Iterable[str]] = None,
+        user_extractor: Optional[Callable] = None,
+        max_pending_captures: int = 1000
     ):
         """
         Initialize the audit middleware.
 
         Args:
-            app: FastAPI application
+            app: ASGI application to wrap
             audit_service: AuditService instance for logging events
             capture_api_access: Whether to log all API access
-            exclude_paths: List of paths to exclude from audit
-            user_extractor: Function to extract user info from request
+            exclude_paths: Exact paths, or "/*"-suffixed prefixes, to exclude
+            user_extractor: Function to extract user info from request. It
+                receives a Starlette HTTPConnection, which exposes the same
+                headers/client/url attributes as a Request.
+            max_pending_captures: Maximum number of API access captures
+                queued for the background worker. When the queue is full,
+                requests wait for space before completing, applying
+                backpressure instead of dropping audit events.
         """
-        super().__init__(app)
+        self.app = app
         self.audit_service = audit_service
         self.capture_api_access = capture_api_access
-        self.exclude_paths = exclude_paths or ["/health", "/metrics", "/docs", "/openapi.json"]
-        self.user_extractor = user_extractor or self._default_user_extractor
-
-    def _default_user_extractor(self, request: Request) -> Dict[str, Any]:
+        exclude_paths = tuple(exclude_paths or DEFAULT_EXCLUDE_PATHS)
+        # Exact paths get an O(1) set lookup; wildcard prefixes are checked
+        # with a single str.startswith(tuple) call
+        self.exclude_paths = frozenset(p for p in exclude_paths if not p.endswith("/*"))
+        self._exclude_prefixes = tuple(p[:-1] for p in exclude_paths if p.endswith("/*"))
+        self._exclude_prefix_re = None
+        if len(self._exclude_prefixes) > _PREFIX_REGEX_THRESHOLD:
+            self._exclude_prefix_re = re.compile(
+                "|".join(re.escape(prefix) for prefix in self._exclude_prefixes)
+            )
+        self.user_extractor = user_extractor
+        self.max_pending_captures = max_pending_captures
+        # API access captures are handed to a single worker task through a
+        # bounded queue; both are created on first use inside the event loop
+        self._capture_queue: Optional[asyncio.Queue] = None
+        self._capture_worker: Optional[asyncio.Task] = None
+
+    def _default_user_extractor(self, headers: Dict[bytes, bytes]) -> Dict[str, Any]:
         """
-        Default user extraction from request.
+        Default user extraction from raw request headers.
 
-        Override this with a custom extractor that understands your
-        authentication system (JWT, API keys, sessions, etc.).
+        Pass a custom user_extractor that understands your authentication
+        system (JWT, API keys, sessions, etc.) to replace this.
+
+        Args:
+            headers: Lower-cased raw header names mapped to raw values
 
         Returns:
             Dictionary with user information:
@@ -144,9 +234,11 @@ class AuditMiddleware(BaseHTTPMiddleware):
             - session_id: Optional[str]
         """
         # Check for API key in headers
-        api_key = request.headers.get("x-api-key") or request.headers.get("authorization")
+        api_key = headers.get(_X_API_KEY) or headers.get(_AUTHORIZATION)
 
         if api_key:
+            api_key = api_key.decode("latin-1")
+
             # Extract bearer token
             if api_key.startswith("Bearer "):
                 api_key = api_key[7:]
@@ -176,122 +268,225 @@ class AuditMiddleware(BaseHTTPMiddleware):
             "session_id": None
         }
 
-    def _get_client_ip(self, request: Request) -> Optional[str]:
+    def _get_client_ip(self, scope: Scope, headers: Dict[bytes, bytes]) -> Optional[str]:
         """
-        Extract client IP address from request.
+        Extract client IP address from the ASGI scope.
 
         Handles X-Forwarded-For header for proxied requests.
         """
         # Check X-Forwarded-For header first
-        forwarded_for = request.headers.get("x-forwarded-for")
+        forwarded_for = headers.get(_X_FORWARDED_FOR)
         if forwarded_for:
-            # Take the first IP in the chain
-            return forwarded_for.split(",")[0].strip()
+            # Take the first IP in the chain; only that hop is decoded
+            first_hop = forwarded_for.partition(b",")[0].strip()
+            if first_hop:
+                return first_hop.decode("latin-1")
 
         # Check X-Real-IP header
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = headers.get(_X_REAL_IP)
         if real_ip:
-            return real_ip
+            return real_ip.decode("latin-1")
 
         # Fall back to direct client
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
 
         return None
 
-    def _should_audit(self, request: Request) -> bool:
-        """Determine if this request should be audited."""
-        # Check if path is excluded
-        for excluded_path in self.exclude_paths:
-            if request.url.path.startswith(excluded_path):
-                return False
+    def _should_audit(self, path: str) -> bool:
+        """Determine if a request to this path should be audited."""
+        if path in self.exclude_paths:
+            return False
 
-        return True
+        if self._exclude_prefix_re is not None:
+            return self._exclude_prefix_re.match(path) is None
 
-    async def dispatch(self, request: Request, call_next):
+        return not path.startswith(self._exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and capture audit context."""
-        # Generate request ID
-        request_id = str(uuid4())
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._lifespan_receive(receive), send)
+            return
 
-        # Extract client information
-        client_ip = self._get_client_ip(request)
-        user_agent = request.headers.get("user-agent")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Extract user/authentication information
-        user_info = self.user_extractor(request)
+        # Generate request ID (96 random bits; no UUID object needed)
+        request_id = token_hex(12)
+        request_id_header = (_X_REQUEST_ID, request_id.encode("latin-1"))
 
-        # Set context variables
-        _request_id.set(request_id)
-        _actor_id.set(user_info.get("actor_id", "system"))
-        _actor_type.set(user_info.get("actor_type", ActorType.SYSTEM))
-        _actor_email.set(user_info.get("actor_email"))
-        _actor_ip.set(client_ip)
-        _actor_user_agent.set(user_agent)
-        _organization_id.set(user_info.get("organization_id"))
-        _session_id.set(user_info.get("session_id"))
+        # Extract client information
+        headers = _audit_headers(scope["headers"])
+        client_ip = self._get_client_ip(scope, headers)
+        user_agent = headers.get(_USER_AGENT)
+        if user_agent is not None:
+            user_agent = user_agent.decode("latin-1")
 
-        # Store in request state for easy access
-        request.state.audit_context = get_request_context()
+        # Extract user/authentication information
+        if self.user_extractor is not None:
+            user_info = self.user_extractor(HTTPConnection(scope))
+        else:
+            user_info = self._default_user_extractor(headers)
+
+        # Build the request context once and publish it
+        audit_context = RequestContext(
+            request_id=request_id,
+            actor_id=user_info.get("actor_id", "system"),
+            actor_type=user_info.get("actor_type", ActorType.SYSTEM),
+            actor_email=user_info.get("actor_email"),
+            actor_ip=client_ip,
+            actor_user_agent=user_agent,
+            organization_id=user_info.get("organization_id"),
+            session_id=user_info.get("session_id"),
+        )
+        _request_ctx.set(audit_context)
+        set_current_request_id(request_id)
+
+        # Store in request state for easy access (request.state.audit_context)
+        scope.setdefault("state", {})["audit_context"] = audit_context
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                message["headers"] = [*message.get("headers", ()), request_id_header]
+            await send(message)
 
         # Process request
-        response = await call_next(request)
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-
-        # Capture API access event if enabled
-        if self.audit_service and self.capture_api_access and self._should_audit(request):
-            # Determine severity based on status code
-            if response.status_code >= 500:
-                severity = Severity.CRITICAL
-            elif response.status_code >= 400:
-                severity = Severity.WARNING
-            else:
-                severity = Severity.INFO
-
-            # Capture event asynchronously (fire and forget)
-            if user_info.get("organization_id"):
-                try:
-                    await self.audit_service.capture_event(
-                        organization_id=user_info["organization_id"],
-                        event_category=EventCategory.DATA,
-                        event_type="api.access",
-                        resource_type="api",
-                        resource_id=request.url.path,
-                        action=self._method_to_action(request.method),
-                        actor_type=user_info.get("actor_type", ActorType.SYSTEM),
-                        actor_id=user_info.get("actor_id", "system"),
-                        actor_email=user_info.get("actor_email"),
-                        actor_ip=client_ip,
-                        actor_user_agent=user_agent,
-                        request_id=request_id,
-                        session_id=user_info.get("session_id"),
-                        event_severity=severity,
-                        metadata={
-                            "method": request.method,
-                            "path": request.url.path,
-                            "status_code": response.status_code,
-                        }
-                    )
-                except Exception as e:
-                    # Don't let audit failures break the request
-                    print(f"AuditMiddleware: Error capturing event: {e}")
-
-        return response
+        await self.app(scope, receive, send_wrapper)
+
+        # Capture API access event if enabled, without delaying the response
+        path = scope["path"]
+        if (
+            self.audit_service
+            and self.capture_api_access
+            and user_info.get("organization_id")
+            and self._should_audit(path)
+        ):
+            await self._enqueue_capture((
+                user_info, scope["method"], path, status_code,
+                client_ip, user_agent, request_id,
+            ))
+
+    async def _enqueue_capture(self, capture: tuple) -> None:
+        """Queue an API access capture, starting the worker if needed."""
+        worker = self._capture_worker
+        if worker is None or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+            old_queue = self._capture_queue
+            self._capture_queue = asyncio.Queue(maxsize=self.max_pending_captures)
+
+            # Carry over captures the previous worker never recorded
+            if old_queue is not None:
+                while not old_queue.empty():
+                    self._capture_queue.put_nowait(old_queue.get_nowait())
+
+            # Started in an empty context, so the long-lived worker does not
+            # keep (and expose to enrichment callbacks) the request context
+            # and request ID of the request that happened to start it
+            self._capture_worker = asyncio.create_task(
+                self._process_captures(), context=Context()
+            )
+
+        # Only waits when the queue is full
+        await self._capture_queue.put(capture)
+
+    async def _process_captures(self) -> None:
+        """Background worker that records queued API access captures."""
+        queue = self._capture_queue
+        while True:
+            capture = await queue.get()
+            try:
+                await self._capture_api_access(*capture)
+            finally:
+                queue.task_done()
+
+    async def flush_captures(self) -> None:
+        """Wait until every queued API access capture has been recorded."""
+        if self._capture_queue is not None and not self._capture_worker.done():
+            await self._capture_queue.join()
+
+    async def stop_capture_worker(self) -> None:
+        """Record outstanding captures, then stop the capture worker."""
+        await self.flush_captures()
+
+        worker, self._capture_worker = self._capture_worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    def _lifespan_receive(self, receive: Receive) -> Receive:
+        """Wrap lifespan receive so queued captures drain before shutdown."""
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                # Record outstanding captures while the app (and its audit
+                # service) is still running, and stop the worker before the
+                # loop closes
+                await self.stop_capture_worker()
+            return message
+
+        return receive_wrapper
+
+    async def _capture_api_access(
+        self,
+        user_info: Dict[str, Any],
+        method: str,
+        path: str,
+        status_code: int,
+        client_ip: Optional[str],
+        user_agent: Optional[str],
+        request_id: str
+    ) -> None:
+        """Record an api.access event for a completed request."""
+        # Determine severity based on status code
+        if status_code >= 500:
+            severity = Severity.CRITICAL
+        elif status_code >= 400:
+            severity = Severity.WARNING
+        else:
+            severity = Severity.INFO
+
+        try:
+            await self.audit_service.capture_event(
+                organization_id=user_info["organization_id"],
+                event_category=EventCategory.DATA,
+                event_type="api.access",
+                resource_type="api",
+                resource_id=path,
+                action=self._method_to_action(method),
+                actor_type=user_info.get("actor_type", ActorType.SYSTEM),
+                actor_id=user_info.get("actor_id", "system"),
+                actor_email=user_info.get("actor_email"),
+                actor_ip=client_ip,
+                actor_user_agent=user_agent,
+                request_id=request_id,
+                session_id=user_info.get("session_id"),
+                event_severity=severity,
+                metadata={
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
+                }
+            )
+        except Exception:
+            # Don't let audit failures break the request
+            logger.exception("AuditMiddleware: Error capturing event")
 
     def _method_to_action(self, method: str) -> Action:
         """Map HTTP method to audit action."""
-        method = method.upper()
-        if method == "POST":
-            return Action.CREATE
-        elif method == "GET":
-            return Action.READ
-        elif method in ["PUT", "PATCH"]:
-            return Action.UPDATE
-        elif method == "DELETE":
-            return Action.DELETE
-        else:
-            return Action.READ
+        # ASGI servers already upper-case scope["method"]
+        if not method.isupper():
+            method = method.upper()
+        return _METHOD_TO_ACTION.get(method, Action.READ)
 
 
 # Dependency injection helper for FastAPI routes
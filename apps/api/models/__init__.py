@@ -15,6 +15,7 @@ from .audit_verification import (
     ChainVerificationResult,
     TamperingIndicator,
     MerkleNode,
+    MerkleLevel,
     MerkleRoot,
     MerkleProof,
     TimestampToken,
@@ -37,6 +38,7 @@ __all__ = [
     "ChainVerificationResult",
     "TamperingIndicator",
     "MerkleNode",
+    "MerkleLevel",
     "MerkleRoot",
     "MerkleProof",
     "TimestampToken",
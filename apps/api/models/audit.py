@@ -6,13 +6,17 @@ significant events in the AgentTrace platform for compliance and security purpos
 """
 
 import hashlib
+import hmac
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Dict, Any
+from secrets import token_hex
+from typing import Any, ClassVar, Dict, Optional, Tuple
 from uuid import uuid4
 
+import orjson
+
 
 class ActorType(str, Enum):
     """Type of actor performing the action."""
@@ -46,6 +50,38 @@ class Action(str, Enum):
     EXPORT = "export"
 
 
+# Marker fed to the event hash for None fields; never a valid length prefix
+_HASH_NONE = b"-"
+
+# Pre-encoded "<length>:" prefixes for the short fields that make up most of
+# an event, so hashing doesn't format one per field
+_HASH_LENGTH_PREFIXES = tuple(b"%d:" % n for n in range(256))
+
+# orjson options giving a canonical encoding of state dictionaries
+_STATE_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# orjson options for encoding events as to_dict() would: naive timestamps
+# are taken as UTC, and non-string keys in state dictionaries are
+# stringified as json.dumps did
+EVENT_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+# AuditEvent/AuditEventFilter fields typed as one of the enums above
+_ENUM_FIELDS = ("actor_type", "event_category", "event_severity", "action")
+
+
+def _enum_value(value: Any) -> Any:
+    """Return an enum member's value, or the value unchanged."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _state_json(state: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """Canonically encode a state dictionary for hashing."""
+    if state is None:
+        return None
+    return orjson.dumps(state, default=str, option=_STATE_JSON_OPTIONS)
+
+
 # Event type constants organized by category
 class AuthEventTypes:
     """Authentication and authorization event types."""
@@ -118,7 +154,7 @@ class EvalEventTypes:
     BENCHMARK_COMPLETED = "benchmark.completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEvent:
     """
     Immutable audit event for compliance tracking.
@@ -156,8 +192,20 @@ class AuditEvent:
 
         hash: SHA-256 hash of event content
         previous_hash: Hash of previous event (blockchain-style chaining)
+        hash_version: Version of the scheme ``hash`` was computed with
     """
 
+    # Current hash scheme, stored with each event as ``hash_version`` so
+    # verifiers recompute the digest the event was written with. Both use
+    # SHA-256, which runs on the CPU's SHA extensions through OpenSSL and
+    # beats BLAKE3 for inputs this small:
+    #   1: SHA-256 of the sorted-key JSON of all other fields
+    #   2: SHA-256 of the length-prefixed field stream of _compute_hash()
+    HASH_VERSION: ClassVar[int] = 2
+
+    # Column order of CSV exports, matching to_tuple(); set below the class
+    CSV_COLUMNS: ClassVar[Tuple[str, ...]] = ()
+
     # Event identification
     event_id: str
     timestamp: datetime
@@ -193,6 +241,7 @@ class AuditEvent:
     # Integrity
     hash: str = field(default="", init=False)
     previous_hash: str = ""
+    hash_version: int = HASH_VERSION
 
     def __post_init__(self):
         """Validate and initialize the audit event."""
@@ -207,7 +256,7 @@ class AuditEvent:
 
         # Generate request_id if not provided
         if not self.request_id:
-            self.request_id = str(uuid4())
+            self.request_id = token_hex(12)
 
         # Compute hash after all fields are set
         self.hash = self._compute_hash()
@@ -217,28 +266,75 @@ class AuditEvent:
         Compute SHA-256 hash of event content for integrity verification.
 
         The hash includes all event data except the hash field itself,
-        creating a cryptographic fingerprint of the event.
+        creating a cryptographic fingerprint of the event. Events with an
+        older ``hash_version`` are hashed with that version's scheme.
+
+        Version 2 is computed here: fields are fed to
+        the hasher in a fixed order, each length-prefixed so content cannot
+        shift between adjacent fields; None is encoded distinctly from "".
+        Only the state dictionaries are JSON-encoded (with sorted keys).
+        Everything reaches the OpenSSL-backed hasher as small bytes chunks,
+        so no large intermediate string is built.
 
         Returns:
             Hexadecimal SHA-256 hash string
+
+        Raises:
+            ValueError: If ``hash_version`` is not a known scheme
         """
-        # Create a copy of the event data without the hash field
+        if self.hash_version == 1:
+            return self._compute_hash_v1()
+        if self.hash_version != 2:
+            raise ValueError(f"Unsupported hash version: {self.hash_version}")
+
+        digest = hashlib.sha256()
+        update = digest.update
+
+        for value in (
+            self.event_id,
+            # Same text as isoformat(), but produced as bytes by orjson
+            orjson.dumps(self.timestamp)[1:-1],
+            self.organization_id,
+            self.project_id,
+            _enum_value(self.actor_type),
+            self.actor_id,
+            self.actor_email,
+            self.actor_ip,
+            self.actor_user_agent,
+            _enum_value(self.event_category),
+            self.event_type,
+            _enum_value(self.event_severity),
+            self.resource_type,
+            self.resource_id,
+            self.resource_name,
+            _enum_value(self.action),
+            _state_json(self.previous_state),
+            _state_json(self.new_state),
+            self.request_id,
+            self.session_id,
+            self.previous_hash,
+        ):
+            if value is None:
+                update(_HASH_NONE)
+                continue
+            if isinstance(value, str):
+                value = value.encode("utf-8")
+            length = len(value)
+            update(_HASH_LENGTH_PREFIXES[length] if length < 256 else b"%d:" % length)
+            update(value)
+
+        return digest.hexdigest()
+
+    def _compute_hash_v1(self) -> str:
+        """Compute a version 1 hash: SHA-256 of the event's sorted-key JSON."""
         event_data = asdict(self)
-        event_data.pop('hash', None)
+        event_data.pop('hash')
+        event_data.pop('hash_version')
+        event_data['timestamp'] = self.timestamp.isoformat()
+        for key in _ENUM_FIELDS:
+            event_data[key] = _enum_value(event_data[key])
 
-        # Convert datetime to ISO format for consistent hashing
-        if isinstance(event_data['timestamp'], datetime):
-            event_data['timestamp'] = event_data['timestamp'].isoformat()
-
-        # Convert enums to their string values
-        for key, value in event_data.items():
-            if isinstance(value, Enum):
-                event_data[key] = value.value
-
-        # Create deterministic JSON string (sorted keys)
         json_str = json.dumps(event_data, sort_keys=True, default=str)
-
-        # Compute SHA-256 hash
         return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
 
     def verify_hash(self) -> bool:
@@ -248,7 +344,7 @@ class AuditEvent:
         Returns:
             True if the stored hash matches the computed hash
         """
-        return self.hash == self._compute_hash()
+        return hmac.compare_digest(self.hash, self._compute_hash())
 
     def verify_chain(self, previous_event: Optional['AuditEvent']) -> bool:
         """
@@ -264,7 +360,7 @@ class AuditEvent:
             # First event in chain should have empty previous_hash
             return self.previous_hash == ""
 
-        return self.previous_hash == previous_event.hash
+        return hmac.compare_digest(self.previous_hash, previous_event.hash)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -279,24 +375,83 @@ class AuditEvent:
         if isinstance(data['timestamp'], datetime):
             data['timestamp'] = data['timestamp'].isoformat()
 
-        # Convert enums to their string values
-        for key, value in data.items():
-            if isinstance(value, Enum):
-                data[key] = value.value
+        # Convert enums to their string values; only these fields hold enums
+        for key in _ENUM_FIELDS:
+            data[key] = _enum_value(data[key])
 
         return data
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Return the event's values in field declaration order.
+
+        Values are converted as in to_dict() (ISO timestamp, enum values),
+        but no dictionary is built and state dictionaries are not copied.
+
+        Returns:
+            Tuple of field values, aligned with ``CSV_COLUMNS``
+        """
+        return (
+            self.event_id,
+            self.timestamp.isoformat(),
+            self.organization_id,
+            self.project_id,
+            _enum_value(self.actor_type),
+            self.actor_id,
+            self.actor_email,
+            self.actor_ip,
+            self.actor_user_agent,
+            _enum_value(self.event_category),
+            self.event_type,
+            _enum_value(self.event_severity),
+            self.resource_type,
+            self.resource_id,
+            self.resource_name,
+            _enum_value(self.action),
+            self.previous_state,
+            self.new_state,
+            self.request_id,
+            self.session_id,
+            self.hash,
+            self.previous_hash,
+            self.hash_version,
+        )
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the audit event straight to JSON bytes.
+
+        orjson encodes the dataclass, enums and timestamp natively, so no
+        intermediate dictionary is built. The output has the same keys and
+        values as to_dict().
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return orjson.dumps(self, default=str, option=EVENT_JSON_OPTIONS)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AuditEvent':
         """
         Create an AuditEvent from a dictionary.
 
+        A stored ``hash`` (hex string or raw digest bytes) is kept rather
+        than recomputed, so verify_hash() detects content that was altered
+        after the event was written. A stored hash without a
+        ``hash_version`` is taken to be version 1.
+
         Args:
             data: Dictionary containing event data
 
         Returns:
             AuditEvent instance
         """
+        data = dict(data)
+        stored_hash = data.pop('hash', None)
+        if stored_hash and 'hash_version' not in data:
+            # Stored before hash versions were recorded
+            data['hash_version'] = 1
+
         # Convert string timestamp to datetime
         if isinstance(data.get('timestamp'), str):
             data['timestamp'] = datetime.fromisoformat(data['timestamp'])
@@ -311,7 +466,10 @@ class AuditEvent:
         if isinstance(data.get('action'), str):
             data['action'] = Action(data['action'])
 
-        return cls(**data)
+        event = cls(**data)
+        if stored_hash:
+            event.hash = stored_hash.hex() if isinstance(stored_hash, bytes) else stored_hash
+        return event
 
     def __repr__(self) -> str:
         """String representation of the audit event."""
@@ -325,7 +483,10 @@ class AuditEvent:
         )
 
 
-@dataclass
+AuditEvent.CSV_COLUMNS = tuple(f.name for f in fields(AuditEvent))
+
+
+@dataclass(slots=True)
 class AuditEventFilter:
     """
     Filter criteria for querying audit events.
@@ -358,20 +519,50 @@ class AuditEventFilter:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert filter to dictionary, excluding None values."""
-        data = asdict(self)
-
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
+        data = {}
+        for name in _FILTER_FIELD_NAMES:
+            value = getattr(self, name)
+            if value is None:
+                continue
 
-        # Convert datetime to ISO format
-        if 'start_time' in data and isinstance(data['start_time'], datetime):
-            data['start_time'] = data['start_time'].isoformat()
-        if 'end_time' in data and isinstance(data['end_time'], datetime):
-            data['end_time'] = data['end_time'].isoformat()
+            # Convert datetimes to ISO format and enums to their string values
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, Enum):
+                value = value.value
 
-        # Convert enums to their string values
-        for key, value in data.items():
-            if isinstance(value, Enum):
-                data[key] = value.value
+            data[name] = value
 
         return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AuditEventFilter':
+        """
+        Create a filter from a dictionary produced by to_dict().
+
+        Args:
+            data: Dictionary containing filter criteria
+
+        Returns:
+            AuditEventFilter instance
+        """
+        data = dict(data)
+
+        for key in ('start_time', 'end_time'):
+            if isinstance(data.get(key), str):
+                data[key] = datetime.fromisoformat(data[key])
+
+        if isinstance(data.get('actor_type'), str):
+            data['actor_type'] = ActorType(data['actor_type'])
+        if isinstance(data.get('event_category'), str):
+            data['event_category'] = EventCategory(data['event_category'])
+        if isinstance(data.get('event_severity'), str):
+            data['event_severity'] = Severity(data['event_severity'])
+        if isinstance(data.get('action'), str):
+            data['action'] = Action(data['action'])
+
+        return cls(**data)
+
+
+# AuditEventFilter field names, resolved once for to_dict()
+_FILTER_FIELD_NAMES = tuple(f.name for f in fields(AuditEventFilter))
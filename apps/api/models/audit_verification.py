@@ -5,10 +5,14 @@ Data structures for cryptographic verification of audit trails.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from datetime import datetime, date, timezone
+from functools import partial
+from typing import List, NamedTuple, Optional, Dict, Any
 from enum import Enum
 
+# Timestamp factory; a partial avoids a Python frame per instance
+_utcnow = partial(datetime.now, timezone.utc)
+
 
 class VerificationStatus(str, Enum):
     """Status of verification result."""
@@ -28,7 +32,7 @@ class TamperingType(str, Enum):
     DUPLICATE_EVENT = "duplicate_event"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainVerificationResult:
     """
     Result of hash chain verification.
@@ -54,12 +58,13 @@ class ChainVerificationResult:
     broken_links: List[str] = field(default_factory=list)
     hash_mismatches: List[str] = field(default_factory=list)
     errors: List[Dict[str, Any]] = field(default_factory=list)
-    verified_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    verified_at: datetime = field(default_factory=_utcnow)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
+        # _value_ is the plain instance attribute behind the .value property
         return {
-            "status": self.status.value,
+            "status": self.status._value_,
             "total_events": self.total_events,
             "valid_events": self.valid_events,
             "invalid_events": self.invalid_events,
@@ -72,7 +77,7 @@ class ChainVerificationResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TamperingIndicator:
     """
     Indicator of potential tampering.
@@ -90,13 +95,13 @@ class TamperingIndicator:
     severity: int
     description: str
     evidence: Dict[str, Any]
-    detected_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    detected_at: datetime = field(default_factory=_utcnow)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "event_id": self.event_id,
-            "tampering_type": self.tampering_type.value,
+            "tampering_type": self.tampering_type._value_,
             "severity": self.severity,
             "description": self.description,
             "evidence": self.evidence,
@@ -104,7 +109,7 @@ class TamperingIndicator:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MerkleNode:
     """
     Node in Merkle tree.
@@ -125,23 +130,70 @@ class MerkleNode:
         return self.left is None and self.right is None
 
 
-@dataclass
+class MerkleLevel(NamedTuple):
+    """
+    One level of interior Merkle tree hashes, stored contiguously.
+
+    Attributes:
+        hashes: Concatenated hex-encoded digests, ``n`` entries of equal width
+        n: Number of hashes in the level
+    """
+    hashes: bytes
+    n: int
+
+    def hash_at(self, index: int) -> str:
+        """Return the hex digest at ``index``."""
+        width = len(self.hashes) // self.n
+        return self.hashes[index * width:(index + 1) * width].decode("ascii")
+
+
+@dataclass(slots=True)
 class MerkleRoot:
     """
     Root of Merkle tree.
 
+    The tree is stored level by level: leaf hashes and event IDs as parallel
+    lists, interior levels as contiguous buffers. ``tree`` materializes
+    ``MerkleNode`` objects only when first accessed.
+
     Attributes:
         root_hash: Hash of root node
-        tree: Root node of tree
         event_count: Number of events in tree
         created_at: When tree was created
         metadata: Additional metadata
+        leaf_event_ids: Event ID of each leaf, in tree order
+        leaf_hashes: Hash of each leaf, in tree order
+        levels: Interior levels from just above the leaves up to the root
     """
     root_hash: str
-    tree: MerkleNode
     event_count: int
-    created_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = field(default_factory=_utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    leaf_event_ids: List[str] = field(default_factory=list, repr=False)
+    leaf_hashes: List[str] = field(default_factory=list, repr=False)
+    levels: List[MerkleLevel] = field(default_factory=list, repr=False)
+    _tree: Optional[MerkleNode] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def tree(self) -> MerkleNode:
+        """Root node of the tree, built from the stored levels on first access."""
+        if self._tree is None:
+            nodes = [
+                MerkleNode(hash_value, None, None, event_id)
+                for event_id, hash_value in zip(self.leaf_event_ids, self.leaf_hashes)
+            ]
+            for level in self.levels:
+                count = len(nodes)
+                nodes = [
+                    MerkleNode(
+                        level.hash_at(i),
+                        nodes[2 * i],
+                        nodes[2 * i + 1] if 2 * i + 1 < count else None,
+                    )
+                    for i in range(level.n)
+                ]
+            self._tree = nodes[0] if nodes else MerkleNode(hash=self.root_hash)
+        return self._tree
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -153,7 +205,7 @@ class MerkleRoot:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MerkleProof:
     """
     Merkle proof for event inclusion.
@@ -182,7 +234,7 @@ class MerkleProof:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TimestampToken:
     """
     RFC 3161 timestamp token.
@@ -218,7 +270,7 @@ class TimestampToken:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Checkpoint:
     """
     Daily audit checkpoint.
@@ -245,7 +297,7 @@ class Checkpoint:
     timestamp_token: Optional[TimestampToken] = None
     previous_checkpoint_hash: str = ""
     checkpoint_hash: str = ""
-    created_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    created_at: datetime = field(default_factory=_utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -265,7 +317,7 @@ class Checkpoint:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckpointVerificationResult:
     """
     Result of checkpoint verification.
@@ -287,12 +339,12 @@ class CheckpointVerificationResult:
     timestamp_valid: bool = False
     chain_valid: bool = False
     errors: List[str] = field(default_factory=list)
-    verified_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    verified_at: datetime = field(default_factory=_utcnow)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "status": self.status.value,
+            "status": self.status._value_,
             "checkpoint_date": self.checkpoint_date.isoformat(),
             "checkpoint_hash_valid": self.checkpoint_hash_valid,
             "merkle_root_valid": self.merkle_root_valid,
@@ -303,7 +355,7 @@ class CheckpointVerificationResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationReport:
     """
     Comprehensive verification report.
@@ -323,7 +375,7 @@ class VerificationReport:
     tampering_indicators: List[TamperingIndicator] = field(default_factory=list)
     checkpoints_verified: List[CheckpointVerificationResult] = field(default_factory=list)
     overall_status: VerificationStatus = VerificationStatus.UNKNOWN
-    generated_at: datetime = field(default_factory=lambda: datetime.utcnow())
+    generated_at: datetime = field(default_factory=_utcnow)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -336,6 +388,6 @@ class VerificationReport:
             "chain_result": self.chain_result.to_dict(),
             "tampering_indicators": [ti.to_dict() for ti in self.tampering_indicators],
             "checkpoints_verified": [cv.to_dict() for cv in self.checkpoints_verified],
-            "overall_status": self.overall_status.value,
+            "overall_status": self.overall_status._value_,
             "generated_at": self.generated_at.isoformat()
         }
@@ -5,10 +5,45 @@ These models provide validation and serialization for the API.
 """
 
 from typing import Optional, Any, Literal
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 
 
+# OpenAPI examples, built once and shared by the models that embed a span
+_SPAN_EXAMPLE = {
+    "trace_id": "550e8400-e29b-41d4-a716-446655440000",
+    "span_id": "550e8400-e29b-41d4-a716-446655440001",
+    "parent_span_id": None,
+    "name": "llm_call",
+    "start_time": "2024-01-01T00:00:00Z",
+    "end_time": "2024-01-01T00:00:01Z",
+    "duration": 1.0,
+    "status": "ok",
+    "span_type": "llm_call",
+    "framework": "langchain",
+    "llm": {
+        "model": "gpt-4",
+        "provider": "openai",
+        "usage": {
+            "prompt_tokens": 10,
+            "completion_tokens": 20,
+            "total_tokens": 30,
+        },
+    },
+    "attributes": {"temperature": 0.7},
+    "tags": ["production"],
+}
+
+_MINIMAL_SPAN_EXAMPLE = {
+    "trace_id": "550e8400-e29b-41d4-a716-446655440000",
+    "span_id": "550e8400-e29b-41d4-a716-446655440001",
+    "name": "llm_call",
+    "start_time": "2024-01-01T00:00:00Z",
+    "span_type": "llm_call",
+    "framework": "langchain",
+}
+
+
 # Request Models
 
 class SpanRequest(BaseModel):
@@ -83,42 +118,20 @@ class SpanRequest(BaseModel):
     tags: list[str] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
-    @validator("trace_id", "span_id", "parent_span_id")
-    def validate_id_format(cls, v):
+    @field_validator("trace_id", "span_id", "parent_span_id", mode="after")
+    @classmethod
+    def validate_id_format(cls, v: Optional[str]) -> Optional[str]:
         """Validate ID format (should be UUID)."""
-        if v is None:
-            return v
         # Basic validation - could be stricter
-        if not v or len(v) < 8:
+        if v is not None and len(v) < 8:
             raise ValueError("Invalid ID format")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "trace_id": "550e8400-e29b-41d4-a716-446655440000",
-                "span_id": "550e8400-e29b-41d4-a716-446655440001",
-                "parent_span_id": None,
-                "name": "llm_call",
-                "start_time": "2024-01-01T00:00:00Z",
-                "end_time": "2024-01-01T00:00:01Z",
-                "duration": 1.0,
-                "status": "ok",
-                "span_type": "llm_call",
-                "framework": "langchain",
-                "llm": {
-                    "model": "gpt-4",
-                    "provider": "openai",
-                    "usage": {
-                        "prompt_tokens": 10,
-                        "completion_tokens": 20,
-                        "total_tokens": 30,
-                    },
-                },
-                "attributes": {"temperature": 0.7},
-                "tags": ["production"],
-            }
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": _SPAN_EXAMPLE
         }
+    )
 
 
 class BatchSpanRequest(BaseModel):
@@ -130,25 +143,17 @@ class BatchSpanRequest(BaseModel):
 
     project_id: str = Field(..., description="Project identifier")
     environment: str = Field("development", description="Environment name")
-    spans: list[SpanRequest] = Field(..., min_items=1, description="Array of spans")
+    spans: list[SpanRequest] = Field(..., min_length=1, description="Array of spans")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "project_id": "my-project",
                 "environment": "production",
-                "spans": [
-                    {
-                        "trace_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "span_id": "550e8400-e29b-41d4-a716-446655440001",
-                        "name": "llm_call",
-                        "start_time": "2024-01-01T00:00:00Z",
-                        "span_type": "llm_call",
-                        "framework": "langchain",
-                    }
-                ],
+                "spans": [_MINIMAL_SPAN_EXAMPLE],
             }
         }
+    )
 
 
 class SingleSpanRequest(BaseModel):
@@ -162,21 +167,15 @@ class SingleSpanRequest(BaseModel):
     environment: str = Field("development", description="Environment name")
     span: SpanRequest = Field(..., description="Span data")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "project_id": "my-project",
                 "environment": "production",
-                "span": {
-                    "trace_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "span_id": "550e8400-e29b-41d4-a716-446655440001",
-                    "name": "llm_call",
-                    "start_time": "2024-01-01T00:00:00Z",
-                    "span_type": "llm_call",
-                    "framework": "langchain",
-                },
+                "span": _MINIMAL_SPAN_EXAMPLE,
             }
         }
+    )
 
 
 # Response Models
@@ -203,8 +202,8 @@ class IngestionResponse(BaseModel):
     errors: list[SpanError] = Field(default_factory=list, description="Error details")
     message: Optional[str] = Field(None, description="Additional message")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "accepted": 98,
                 "rejected": 2,
@@ -224,6 +223,7 @@ class IngestionResponse(BaseModel):
                 "message": "Partial success",
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -238,8 +238,8 @@ class HealthResponse(BaseModel):
     processed_total: int = Field(..., description="Total spans processed")
     errors_total: int = Field(..., description="Total errors")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "version": "1.0.0",
@@ -249,6 +249,7 @@ class HealthResponse(BaseModel):
                 "errors_total": 10,
             }
         }
+    )
 
 
 class MetricsResponse(BaseModel):
@@ -264,8 +265,8 @@ class MetricsResponse(BaseModel):
     )
     storage_errors_total: int = Field(..., description="Total storage errors")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "spans_received_total": 1000000,
                 "spans_accepted_total": 998000,
@@ -276,3 +277,4 @@ class MetricsResponse(BaseModel):
                 "storage_errors_total": 5,
             }
         }
+    )
@@ -0,0 +1,114 @@
+"""
+msgspec mirrors of the span ingestion request models.
+
+These structs decode request bodies straight from JSON bytes and are what
+the ingestion pipeline carries. The Pydantic models in ``requests`` remain
+the source of the OpenAPI schema and of detailed validation error reports,
+so the two must be kept in sync.
+"""
+
+from typing import Annotated, Any, Literal, Optional, Union
+
+import msgspec
+
+from .requests import SpanRequest
+
+# Same rule as SpanRequest.validate_id_format
+SpanId = Annotated[str, msgspec.Meta(min_length=8)]
+
+
+class SpanRequestFast(msgspec.Struct, kw_only=True):
+    """
+    Decoded span, mirroring ``SpanRequest`` field for field (and in the
+    same order, so stored span dicts are unchanged).
+    """
+
+    # Core OpenTelemetry fields
+    trace_id: SpanId
+    span_id: SpanId
+    parent_span_id: Optional[SpanId] = None
+    name: Annotated[str, msgspec.Meta(min_length=1, max_length=256)]
+    start_time: str
+    end_time: Optional[str] = None
+    duration: Optional[Annotated[float, msgspec.Meta(ge=0)]] = None
+
+    # Status
+    status: Literal["unset", "ok", "error"] = "unset"
+    status_message: Optional[Annotated[str, msgspec.Meta(max_length=1024)]] = None
+
+    # AI agent fields
+    span_type: Literal[
+        "llm_call",
+        "embedding",
+        "agent_step",
+        "chain",
+        "workflow",
+        "tool_call",
+        "retrieval",
+        "search",
+        "preprocessing",
+        "postprocessing",
+        "transformation",
+        "memory_read",
+        "memory_write",
+        "span",
+        "root",
+    ]
+
+    framework: Literal[
+        "langchain",
+        "crewai",
+        "autogen",
+        "openai_agents",
+        "llamaindex",
+        "semantic_kernel",
+        "haystack",
+        "custom",
+        "unknown",
+    ] = "unknown"
+
+    # Input/Output
+    input: Optional[Any] = None
+    output: Optional[Any] = None
+
+    # Type-specific metadata
+    llm: Optional[dict] = None
+    tool: Optional[dict] = None
+    retrieval: Optional[dict] = None
+
+    # OpenTelemetry context
+    attributes: dict[str, Any] = msgspec.field(default_factory=dict)
+    events: list[dict] = msgspec.field(default_factory=list)
+    links: list[dict] = msgspec.field(default_factory=list)
+
+    # Error
+    error: Optional[dict] = None
+
+    # Metadata
+    tags: list[str] = msgspec.field(default_factory=list)
+    metadata: dict[str, Any] = msgspec.field(default_factory=dict)
+
+
+class BatchSpanRequestFast(msgspec.Struct, kw_only=True):
+    """
+    Decoded batch ingestion request, mirroring ``BatchSpanRequest``.
+    """
+
+    project_id: str
+    environment: str = "development"
+    spans: Annotated[list[SpanRequestFast], msgspec.Meta(min_length=1)]
+
+
+class SingleSpanRequestFast(msgspec.Struct, kw_only=True):
+    """
+    Decoded single span ingestion request, mirroring ``SingleSpanRequest``.
+    """
+
+    project_id: str
+    environment: str = "development"
+    span: SpanRequestFast
+
+
+# A span as the ingestion pipeline receives it: a msgspec struct decoded on
+# the request path, or a Pydantic model from callers that build their own
+AnySpanRequest = Union[SpanRequest, SpanRequestFast]
@@ -5,8 +5,14 @@ Provides service health status and Prometheus-compatible metrics.
 """
 
 import logging
-from fastapi import APIRouter, Depends
+import time
+from typing import Callable, Dict, Tuple
 
+import orjson
+from fastapi import APIRouter, Depends, Response
+from pydantic import BaseModel
+
+from ..config import get_settings
 from ..models.requests import HealthResponse, MetricsResponse
 from ..services.ingestion import IngestionService
 from .traces import get_ingestion_service
@@ -15,33 +21,57 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["health"])
 
+# Pre-serialized body for the load balancer health check
+_SIMPLE_HEALTH_BODY = orjson.dumps({"status": "ok"})
 
-@router.get(
-    "/v1/health",
-    response_model=HealthResponse,
-    summary="Health check",
-    description="Get service health status and basic metrics.",
-)
-async def health_check(
-    service: IngestionService = Depends(get_ingestion_service),
-) -> HealthResponse:
+# endpoint -> (service, expires_at, rendered JSON body)
+_response_cache: Dict[str, Tuple[IngestionService, float, bytes]] = {}
+
+
+def _cached_json(
+    key: str,
+    service: IngestionService,
+    build: Callable[[IngestionService], BaseModel],
+) -> Response:
     """
-    Health check endpoint.
+    Serve a rendered response, rebuilding it at most once per TTL.
 
-    Returns service status, uptime, and basic metrics.
+    Health checks arrive far more often than the stats meaningfully change,
+    so the rendered body is reused for ``HEALTH_CACHE_TTL`` seconds. The
+    build is synchronous, so concurrent requests cannot interleave with it
+    and no lock is needed. A fresh ``Response`` wraps the cached bytes on
+    every request because middleware may mutate response headers in place.
 
     Args:
-        service: Injected ingestion service
+        key: Cache key for the endpoint
+        service: Ingestion service the response describes
+        build: Builds the response model from the service
 
     Returns:
-        HealthResponse: Health status and metrics
+        Response: JSON response with the cached body
+    """
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] is not service or now >= entry[1]:
+        body = orjson.dumps(build(service).model_dump())
+        entry = (service, now + get_settings().health_cache_ttl, body)
+        _response_cache[key] = entry
+    return Response(content=entry[2], media_type="application/json")
+
+
+def _build_health(service: IngestionService) -> HealthResponse:
+    """
+    Build the health response from current service stats.
+
+    The values come straight from the service with the declared types, so
+    the model is constructed without re-running field validation.
     """
     stats = service.get_stats()
     health_status = service.get_health_status()
 
     logger.debug(f"Health check: status={health_status}")
 
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status=health_status,
         version="1.0.0",  # TODO: Load from package version
         uptime=stats["uptime_seconds"],
@@ -51,6 +81,46 @@ async def health_check(
     )
 
 
+def _build_metrics(service: IngestionService) -> MetricsResponse:
+    """Build the metrics response from current service stats, unvalidated."""
+    stats = service.get_stats()
+
+    logger.debug("Metrics requested")
+
+    return MetricsResponse.model_construct(
+        spans_received_total=stats["spans_received_total"],
+        spans_accepted_total=stats["spans_accepted_total"],
+        spans_rejected_total=stats["spans_rejected_total"],
+        batches_processed_total=stats["batches_processed_total"],
+        queue_size_current=stats["queue_size_current"],
+        processing_duration_seconds=stats["processing_duration_seconds"],
+        storage_errors_total=stats["storage_errors_total"],
+    )
+
+
+@router.get(
+    "/v1/health",
+    response_model=HealthResponse,
+    summary="Health check",
+    description="Get service health status and basic metrics.",
+)
+async def health_check(
+    service: IngestionService = Depends(get_ingestion_service),
+) -> Response:
+    """
+    Health check endpoint.
+
+    Returns service status, uptime, and basic metrics.
+
+    Args:
+        service: Injected ingestion service
+
+    Returns:
+        Response: Serialized HealthResponse, cached for a short TTL
+    """
+    return _cached_json("health", service, _build_health)
+
+
 @router.get(
     "/v1/metrics",
     response_model=MetricsResponse,
@@ -59,7 +129,7 @@ async def health_check(
 )
 async def get_metrics(
     service: IngestionService = Depends(get_ingestion_service),
-) -> MetricsResponse:
+) -> Response:
     """
     Metrics endpoint.
 
@@ -69,21 +139,9 @@ async def get_metrics(
         service: Injected ingestion service
 
     Returns:
-        MetricsResponse: Detailed metrics
+        Response: Serialized MetricsResponse, cached for a short TTL
     """
-    stats = service.get_stats()
-
-    logger.debug("Metrics requested")
-
-    return MetricsResponse(
-        spans_received_total=stats["spans_received_total"],
-        spans_accepted_total=stats["spans_accepted_total"],
-        spans_rejected_total=stats["spans_rejected_total"],
-        batches_processed_total=stats["batches_processed_total"],
-        queue_size_current=stats["queue_size_current"],
-        processing_duration_seconds=stats["processing_duration_seconds"],
-        storage_errors_total=stats["storage_errors_total"],
-    )
+    return _cached_json("metrics", service, _build_metrics)
 
 
 @router.get(
@@ -93,7 +151,7 @@ async def get_metrics(
     summary="Simple health check",
     description="Simple health check without auth (for load balancers).",
 )
-async def simple_health() -> dict:
+async def simple_health() -> Response:
     """
     Simple health check endpoint.
 
@@ -101,6 +159,6 @@ async def simple_health() -> dict:
     Useful for load balancers and simple monitoring.
 
     Returns:
-        dict: Simple status message
+        Response: Pre-serialized simple status message
     """
-    return {"status": "ok"}
+    return Response(content=_SIMPLE_HEALTH_BODY, media_type="application/json")
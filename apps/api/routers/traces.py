@@ -5,9 +5,11 @@ Handles span ingestion with validation and error handling.
 """
 
 import logging
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
-from pydantic import ValidationError
+from typing import Any, Dict, Type, TypeVar
+import msgspec
+from fastapi import APIRouter, HTTPException, Request, status, Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 
 from ..models.requests import (
     BatchSpanRequest,
@@ -16,12 +18,15 @@ from ..models.requests import (
     IngestionResponse,
     SpanError,
 )
+from ..models.requests_fast import BatchSpanRequestFast, SingleSpanRequestFast
 from ..services.ingestion import IngestionService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/traces", tags=["traces"])
 
+T = TypeVar("T")
+
 # Global ingestion service instance (set in main.py)
 _ingestion_service: IngestionService = None
 
@@ -57,6 +62,74 @@ def get_ingestion_service() -> IngestionService:
     return _ingestion_service
 
 
+def _request_body_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build an OpenAPI request body from a Pydantic model.
+
+    Endpoints that decode their own body still document it with the
+    Pydantic model; nested definitions are inlined so the schema stands
+    alone inside the path operation.
+
+    Args:
+        model: Pydantic model describing the body
+
+    Returns:
+        Value for the operation's ``requestBody``
+    """
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None:
+                return inline(definitions[ref.rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return {
+        "required": True,
+        "content": {"application/json": {"schema": inline(schema)}},
+    }
+
+
+def _decode_body(body: bytes, fast_type: Type[T], model: Type[BaseModel]) -> T:
+    """
+    Decode a request body into a msgspec struct.
+
+    Valid bodies are decoded by msgspec in one pass. Anything msgspec
+    rejects is re-validated with the Pydantic model, which reports every
+    error in FastAPI's format and accepts the inputs its lax mode coerces.
+
+    Args:
+        body: Raw JSON request body
+        fast_type: msgspec struct to decode into
+        model: Equivalent Pydantic model
+
+    Returns:
+        Decoded struct
+
+    Raises:
+        RequestValidationError: If the body fails Pydantic validation
+    """
+    try:
+        return msgspec.json.decode(body, type=fast_type, strict=False)
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        pass
+
+    try:
+        parsed = model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+
+    return msgspec.convert(parsed.model_dump(), type=fast_type, strict=False)
+
+
 @router.post(
     "",
     response_model=IngestionResponse,
@@ -64,62 +137,55 @@ def get_ingestion_service() -> IngestionService:
     summary="Batch span ingestion",
     description="Ingest multiple spans in a single request. "
     "Accepts partial batches - valid spans are accepted, invalid ones rejected.",
+    openapi_extra={"requestBody": _request_body_schema(BatchSpanRequest)},
 )
 async def ingest_batch(
-    request: BatchSpanRequest,
+    raw_request: Request,
     service: IngestionService = Depends(get_ingestion_service),
 ) -> IngestionResponse:
     """
     Ingest a batch of spans.
 
-    Returns counts and error details for partial success.
+    Returns counts and error details for partial success. The body is
+    decoded with msgspec rather than bound by FastAPI.
 
     Args:
-        request: Batch span request with project_id, environment, and spans
+        raw_request: Request carrying a ``BatchSpanRequest`` JSON body
         service: Injected ingestion service
 
     Returns:
         IngestionResponse: Accepted/rejected counts with error details
     """
-    accepted = 0
-    rejected = 0
-    errors: List[SpanError] = []
+    request = _decode_body(
+        await raw_request.body(), BatchSpanRequestFast, BatchSpanRequest
+    )
+    spans = request.spans
 
     logger.info(
-        f"Received batch ingestion request: {len(request.spans)} spans "
+        f"Received batch ingestion request: {len(spans)} spans "
         f"for project {request.project_id}/{request.environment}"
     )
 
-    # Process each span
-    for index, span in enumerate(request.spans):
-        try:
-            # Attempt to ingest span
-            await service.ingest_span(span, request.project_id, request.environment)
-            accepted += 1
-
-        except asyncio.QueueFull:
-            # Queue is full
-            rejected += 1
-            errors.append(
-                SpanError(
-                    span_id=span.span_id,
-                    index=index,
-                    error="Ingestion queue is full, please retry later",
-                )
-            )
-            logger.warning(f"Rejected span {span.span_id}: queue full")
+    try:
+        # One bulk enqueue; spans that do not fit are rejected in order
+        accepted = await service.ingest_spans(
+            spans, request.project_id, request.environment
+        )
+        error = "Ingestion queue is full, please retry later"
+        if accepted < len(spans):
+            logger.warning(f"Rejected {len(spans) - accepted} spans: queue full")
 
-        except Exception as e:
-            # Unexpected error
-            rejected += 1
-            errors.append(
-                SpanError(
-                    span_id=getattr(span, "span_id", None),
-                    index=index,
-                    error=f"Failed to ingest span: {str(e)}",
-                )
-            )
-            logger.error(f"Error ingesting span at index {index}: {e}", exc_info=True)
+    except Exception as e:
+        # Unexpected error
+        accepted = 0
+        error = f"Failed to ingest span: {str(e)}"
+        logger.error(f"Error ingesting batch: {e}", exc_info=True)
+
+    errors = [
+        SpanError(span_id=span.span_id, index=index, error=error)
+        for index, span in enumerate(spans[accepted:], start=accepted)
+    ]
+    rejected = len(errors)
 
     # Prepare response
     message = None
@@ -146,21 +212,25 @@ async def ingest_batch(
     status_code=status.HTTP_202_ACCEPTED,
     summary="Single span ingestion",
     description="Ingest a single span.",
+    openapi_extra={"requestBody": _request_body_schema(SingleSpanRequest)},
 )
 async def ingest_single(
-    request: SingleSpanRequest,
+    raw_request: Request,
     service: IngestionService = Depends(get_ingestion_service),
 ) -> IngestionResponse:
     """
     Ingest a single span.
 
     Args:
-        request: Single span request with project_id, environment, and span
+        raw_request: Request carrying a ``SingleSpanRequest`` JSON body
         service: Injected ingestion service
 
     Returns:
         IngestionResponse: Acceptance status with error details if failed
     """
+    request = _decode_body(
+        await raw_request.body(), SingleSpanRequestFast, SingleSpanRequest
+    )
     logger.info(
         f"Received single span ingestion: {request.span.span_id} "
         f"for project {request.project_id}/{request.environment}"
@@ -168,40 +238,31 @@ async def ingest_single(
 
     try:
         # Ingest span
-        await service.ingest_span(
-            request.span, request.project_id, request.environment
+        accepted = await service.ingest_spans(
+            [request.span], request.project_id, request.environment
         )
 
-        logger.info(f"Successfully ingested span {request.span.span_id}")
-
-        return IngestionResponse(
-            accepted=1,
-            rejected=0,
-            errors=[],
-            message="Span accepted",
+    except Exception as e:
+        # Unexpected error
+        logger.error(
+            f"Error ingesting span {request.span.span_id}: {e}", exc_info=True
         )
 
-    except asyncio.QueueFull:
-        # Queue is full
-        logger.warning(f"Rejected span {request.span.span_id}: queue full")
-
         return IngestionResponse(
             accepted=0,
             rejected=1,
             errors=[
                 SpanError(
                     span_id=request.span.span_id,
-                    error="Ingestion queue is full, please retry later",
+                    error=f"Failed to ingest span: {str(e)}",
                 )
             ],
             message="Span rejected",
         )
 
-    except Exception as e:
-        # Unexpected error
-        logger.error(
-            f"Error ingesting span {request.span.span_id}: {e}", exc_info=True
-        )
+    if not accepted:
+        # Queue is full
+        logger.warning(f"Rejected span {request.span.span_id}: queue full")
 
         return IngestionResponse(
             accepted=0,
@@ -209,12 +270,17 @@ async def ingest_single(
             errors=[
                 SpanError(
                     span_id=request.span.span_id,
-                    error=f"Failed to ingest span: {str(e)}",
+                    error="Ingestion queue is full, please retry later",
                 )
             ],
             message="Span rejected",
         )
 
+    logger.info(f"Successfully ingested span {request.span.span_id}")
 
-# Import asyncio for queue handling
-import asyncio
+    return IngestionResponse(
+        accepted=1,
+        rejected=0,
+        errors=[],
+        message="Span accepted",
+    )
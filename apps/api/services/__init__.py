@@ -2,10 +2,17 @@
 
 from .audit_storage import AuditStorage, LocalAuditStorage, S3AuditStorage
 from .audit import AuditService
-from .audit_export import AuditExportService, ExportFormat, ExportJob, ExportStatus
+from .audit_export import (
+    AuditExportService,
+    ExportFormat,
+    ExportJob,
+    ExportQueueFull,
+    ExportStatus
+)
 from .audit_verification import (
     AuditChain,
     AuditMerkleTree,
+    IncrementalMerkle,
     TimestampAuthority,
     AuditCheckpoint
 )
@@ -21,10 +28,12 @@ __all__ = [
     "AuditExportService",
     "ExportFormat",
     "ExportJob",
+    "ExportQueueFull",
     "ExportStatus",
     # Verification
     "AuditChain",
     "AuditMerkleTree",
+    "IncrementalMerkle",
     "TimestampAuthority",
     "AuditCheckpoint",
 ]
@@ -0,0 +1,60 @@
+"""
+Batched SHA-256 helpers for Merkle tree construction.
+
+Each Merkle level is a run of independent, equally sized messages (the
+concatenated hex digests of two children), so a whole level can be packed
+into one contiguous buffer and digested in a single call instead of
+allocating a string per node.
+"""
+
+import hashlib
+
+#: Size in bytes of one hex-encoded SHA-256 digest.
+HEX_DIGEST_SIZE = 64
+
+#: Size in bytes of one left||right pair of hex-encoded digests.
+PAIR_SIZE = 2 * HEX_DIGEST_SIZE
+
+
+def hash_pairs(buf: bytes, pair_size: int = PAIR_SIZE) -> bytes:
+    """
+    Digest every fixed-size pair in a contiguous buffer.
+
+    Args:
+        buf: ``n * pair_size`` bytes of concatenated left||right pairs
+        pair_size: Size of a single pair in bytes
+
+    Returns:
+        ``n * 32`` bytes holding the raw SHA-256 digest of each pair, in order
+
+    Raises:
+        ValueError: If the buffer is not a whole number of pairs
+    """
+    if len(buf) % pair_size:
+        raise ValueError(
+            f"buffer length {len(buf)} is not a multiple of {pair_size}"
+        )
+
+    sha256 = hashlib.sha256
+    return b"".join([
+        sha256(buf[i:i + pair_size]).digest()
+        for i in range(0, len(buf), pair_size)
+    ])
+
+
+def hash_level(level: bytes) -> bytes:
+    """
+    Compute the next Merkle level from a level of hex-encoded digests.
+
+    An odd trailing node is paired with itself, matching the duplication
+    rule used by ``AuditMerkleTree``.
+
+    Args:
+        level: ``n * 64`` bytes of concatenated hex digests
+
+    Returns:
+        ``ceil(n / 2) * 64`` bytes of concatenated hex digests
+    """
+    if (len(level) // HEX_DIGEST_SIZE) % 2:
+        level += level[-HEX_DIGEST_SIZE:]
+    return hash_pairs(level).hex().encode("ascii")
@@ -0,0 +1,65 @@
+"""
+Pooled UUID4 string generation.
+
+``str(uuid4())`` makes a urandom call and builds a ``UUID`` object for every
+identifier. The pool reads randomness for many identifiers in one call and
+formats the version 4 strings directly, handing them out one at a time.
+"""
+
+import os
+from collections import deque
+
+#: Identifiers generated per refill.
+POOL_SIZE = 1024
+
+# Masks forcing the RFC 4122 version (4) and variant (10xx) bits
+_CLEAR_MASK = ~((0xF000 << 64) | (0xC000 << 48)) & ((1 << 128) - 1)
+_SET_MASK = (0x4000 << 64) | (0x8000 << 48)
+
+
+def generate_uuid4_strings(count: int) -> list:
+    """
+    Generate random version 4 UUIDs in canonical string form.
+
+    Args:
+        count: Number of identifiers to generate
+
+    Returns:
+        List of ``count`` strings formatted like ``str(uuid.uuid4())``
+    """
+    buf = os.urandom(16 * count)
+    from_bytes = int.from_bytes
+    ids = []
+    for i in range(0, len(buf), 16):
+        h = "%032x" % (from_bytes(buf[i:i + 16], "big") & _CLEAR_MASK | _SET_MASK)
+        ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return ids
+
+
+class UUIDPool:
+    """
+    Hands out pre-generated UUID4 strings, refilling in batches when empty.
+    """
+
+    def __init__(self, size: int = POOL_SIZE):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Identifiers generated per refill
+        """
+        self.size = size
+        self._ids: deque = deque()
+
+    def next(self) -> str:
+        """
+        Return an unused UUID4 string.
+
+        Returns:
+            Identifier formatted like ``str(uuid.uuid4())``
+        """
+        try:
+            return self._ids.popleft()
+        except IndexError:
+            self._ids.extend(generate_uuid4_strings(self.size))
+            return self._ids.popleft()
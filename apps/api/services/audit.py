@@ -7,12 +7,18 @@ hash chain maintenance, batch writing, and event deduplication.
 """
 
 import asyncio
-from collections import defaultdict
+import dataclasses
+import logging
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Callable
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional, Any, Callable, Set, Tuple
 from functools import wraps
-from uuid import uuid4
+from secrets import token_hex
+
+import orjson
 
 from ..models.audit import (
     AuditEvent,
@@ -21,8 +27,35 @@ from ..models.audit import (
     EventCategory,
     Severity,
     Action,
+    EVENT_JSON_OPTIONS,
 )
+from ._uuid_pool import UUIDPool
 from .audit_storage import AuditStorage, LocalAuditStorage
+from .audit_verification import IncrementalMerkle
+
+logger = logging.getLogger(__name__)
+
+#: Worker threads for CPU-bound enrichment callbacks
+ENRICHMENT_WORKERS = 4
+
+# Severities in increasing order, for min_severity filtering
+_SEVERITY_RANK = {Severity.INFO: 0, Severity.WARNING: 1, Severity.CRITICAL: 2}
+
+# Request ID of the current HTTP request, published by AuditMiddleware.
+# Events captured without an explicit request_id inherit it.
+_current_request_id: ContextVar[Optional[str]] = ContextVar(
+    "audit_request_id", default=None
+)
+
+
+def set_current_request_id(request_id: Optional[str]) -> None:
+    """
+    Set the request ID inherited by events captured in this context.
+
+    Args:
+        request_id: Correlation ID of the current request, or None
+    """
+    _current_request_id.set(request_id)
 
 
 class AuditService:
@@ -44,7 +77,8 @@ class AuditService:
         batch_size: int = 100,
         batch_interval: float = 5.0,
         enable_deduplication: bool = True,
-        deduplication_window: int = 60
+        deduplication_window: int = 60,
+        min_severity: Severity = Severity.INFO
     ):
         """
         Initialize the audit service.
@@ -55,31 +89,56 @@ class AuditService:
             batch_interval: Time in seconds between batch writes
             enable_deduplication: Whether to deduplicate events
             deduplication_window: Time window in seconds for deduplication
+            min_severity: Lowest severity that audit_action and audit_context
+                record; calls below it skip capture entirely
         """
         self.storage = storage
         self.batch_size = batch_size
         self.batch_interval = batch_interval
         self.enable_deduplication = enable_deduplication
         self.deduplication_window = deduplication_window
+        self.min_severity = min_severity
 
-        # Event queue for batching
-        self._event_queue: List[AuditEvent] = []
-        self._queue_lock = asyncio.Lock()
+        # Event queue for batching; set _flush_event once a batch is full
+        self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._flush_event = asyncio.Event()
+
+        # Event IDs, generated in batches
+        self._event_ids = UUIDPool()
 
         # Background task for batch processing
         self._batch_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
         self._running = False
 
-        # Hash chain tracking per organization
+        # Hash chain tracking per organization. capture_event links an event
+        # to the head and advances it with no await in between (relinking
+        # after enrichment), so no lock is needed.
         self._last_event_hash: Dict[str, str] = {}
-        self._hash_lock = asyncio.Lock()
 
-        # Deduplication tracking
-        self._recent_events: Dict[str, datetime] = {}
-        self._dedup_lock = asyncio.Lock()
+        # Per-organization future of the most recent capture that reserved a
+        # chain position. Once CPU-bound callbacks are registered, each
+        # capture publishes only after the one before it, so the chain
+        # stays in capture (timestamp) order however enrichment finishes.
+        self._chain_tails: Dict[str, asyncio.Future] = {}
+
+        # Rolling Merkle root over each organization's chain, advanced
+        # together with the chain head
+        self._chain_accumulators: Dict[str, IncrementalMerkle] = {}
+
+        # Per-organization write version, bumped for every captured event so
+        # callers can tell when cached query results may be stale
+        self._org_versions: Dict[str, int] = defaultdict(int)
 
-        # Enrichment callbacks
-        self._enrichment_callbacks: List[Callable[[AuditEvent], AuditEvent]] = []
+        # Deduplication tracking, oldest first so expiry pops from the front
+        self._recent_events: "OrderedDict[str, datetime]" = OrderedDict()
+
+        # Enrichment callbacks; an immutable tuple, replaced on registration,
+        # so a capture iterates a stable snapshot
+        self._enrichment_callbacks: Tuple[Callable[[AuditEvent], AuditEvent], ...] = ()
+        # Callbacks registered as CPU-bound run on this pool, off the loop
+        self._cpu_bound_callbacks: Set[Callable[[AuditEvent], AuditEvent]] = set()
+        self._enrichment_executor: Optional[ThreadPoolExecutor] = None
 
     async def start(self):
         """Start the audit service background tasks."""
@@ -88,7 +147,7 @@ class AuditService:
 
         self._running = True
         self._batch_task = asyncio.create_task(self._batch_processor())
-        print("AuditService: Background batch processor started")
+        logger.info("AuditService: Background batch processor started")
 
     async def stop(self):
         """Stop the audit service and flush remaining events."""
@@ -106,47 +165,80 @@ class AuditService:
 
         # Flush remaining events
         await self._flush_queue()
-        print("AuditService: Stopped and flushed remaining events")
+
+        if self._enrichment_executor is not None:
+            self._enrichment_executor.shutdown(wait=False)
+            self._enrichment_executor = None
+        logger.info("AuditService: Stopped and flushed remaining events")
 
     async def _batch_processor(self):
-        """Background task that processes event batches periodically."""
+        """Background task that flushes when a batch fills or the interval ends."""
         while self._running:
             try:
-                await asyncio.sleep(self.batch_interval)
+                try:
+                    await asyncio.wait_for(
+                        self._flush_event.wait(), timeout=self.batch_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_event.clear()
                 await self._flush_queue()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"AuditService: Error in batch processor: {e}")
+                logger.error("AuditService: Error in batch processor: %s", e)
 
     async def _flush_queue(self):
         """Flush the event queue to storage."""
-        async with self._queue_lock:
-            if not self._event_queue:
-                return
-
-            events_to_write = self._event_queue.copy()
-            self._event_queue.clear()
+        # Drain without awaiting, so no other task can interleave
+        queue = self._event_queue
+        events_to_write = [queue.get_nowait() for _ in range(queue.qsize())]
+        if not events_to_write:
+            return
 
         # Write batch to storage
         try:
             written = await self.storage.write_events_batch(events_to_write)
             if written != len(events_to_write):
-                print(f"AuditService: Warning - only {written}/{len(events_to_write)} events written")
+                logger.warning(
+                    "AuditService: Only %d/%d events written",
+                    written, len(events_to_write)
+                )
         except Exception as e:
-            print(f"AuditService: Error writing batch: {e}")
+            logger.error("AuditService: Error writing batch: %s", e)
             # TODO: Implement retry logic or dead letter queue
 
-    def add_enrichment_callback(self, callback: Callable[[AuditEvent], AuditEvent]):
+    def add_enrichment_callback(
+        self,
+        callback: Callable[[AuditEvent], AuditEvent],
+        cpu_bound: bool = False
+    ):
         """
         Add a callback function to enrich audit events.
 
         The callback receives an AuditEvent and returns an enriched AuditEvent.
+        CPU-bound callbacks (GeoIP lookups, signing, ...) run on a small
+        thread pool so they do not stall captures for other organizations.
+        Events still join their organization's chain in capture order and
+        keep their capture time: CPU-bound callbacks cannot change
+        ``timestamp``.
 
         Args:
             callback: Function that enriches audit events
+            cpu_bound: Run the callback in a worker thread
         """
-        self._enrichment_callbacks.append(callback)
+        self._enrichment_callbacks += (callback,)
+        if cpu_bound:
+            self._cpu_bound_callbacks.add(callback)
+
+    def _get_enrichment_executor(self) -> ThreadPoolExecutor:
+        """Return the enrichment thread pool, creating it on first use."""
+        if self._enrichment_executor is None:
+            self._enrichment_executor = ThreadPoolExecutor(
+                max_workers=ENRICHMENT_WORKERS,
+                thread_name_prefix="audit-enrichment"
+            )
+        return self._enrichment_executor
 
     async def capture_event(
         self,
@@ -196,7 +288,8 @@ class AuditService:
             resource_name: Human-readable resource name
             previous_state: State before the action
             new_state: State after the action
-            request_id: Correlation ID for request tracking
+            request_id: Correlation ID for request tracking; defaults to
+                the current request's ID, or a fresh one outside a request
             session_id: Session identifier
             event_severity: Severity level (INFO, WARNING, CRITICAL)
             metadata: Additional metadata
@@ -205,15 +298,14 @@ class AuditService:
             The event_id of the captured event
         """
         # Generate event ID and timestamp
-        event_id = str(uuid4())
+        event_id = self._event_ids.next()
         timestamp = datetime.now(timezone.utc)
 
         if not request_id:
-            request_id = str(uuid4())
+            request_id = _current_request_id.get() or token_hex(12)
 
         # Get previous hash for chain
-        async with self._hash_lock:
-            previous_hash = self._last_event_hash.get(organization_id, "")
+        previous_hash = self._last_event_hash.get(organization_id, "")
 
         # Create event
         event = AuditEvent(
@@ -240,84 +332,194 @@ class AuditService:
             previous_hash=previous_hash
         )
 
-        # Check for duplicate
+        # Check for duplicate, recording the event for later checks
         if self.enable_deduplication:
-            if await self._is_duplicate(event):
-                print(f"AuditService: Duplicate event detected, skipping: {event_id}")
+            if self._check_and_track(self._dedup_key(event), event.timestamp):
+                logger.debug(
+                    "AuditService: Duplicate event detected, skipping: %s", event_id
+                )
                 return event_id
 
-        # Apply enrichment callbacks
-        for callback in self._enrichment_callbacks:
-            try:
-                event = callback(event)
-            except Exception as e:
-                print(f"AuditService: Error in enrichment callback: {e}")
+        callbacks = self._enrichment_callbacks
+        cpu_bound_callbacks = self._cpu_bound_callbacks
 
-        # Update hash chain
-        async with self._hash_lock:
+        # Reserve the next chain position before any callback runs off the
+        # loop; it is published once every earlier capture has been
+        predecessor = self._chain_tails.get(organization_id)
+        position: Optional[asyncio.Future] = None
+        if cpu_bound_callbacks or predecessor is not None:
+            position = asyncio.get_running_loop().create_future()
+            self._chain_tails[organization_id] = position
+
+        try:
+            # Apply enrichment callbacks
+            offloaded = False
+            for callback in callbacks:
+                try:
+                    if callback in cpu_bound_callbacks:
+                        event = await asyncio.get_running_loop().run_in_executor(
+                            self._get_enrichment_executor(), callback, event
+                        )
+                        offloaded = True
+                    else:
+                        event = callback(event)
+                except Exception as e:
+                    logger.warning("AuditService: Error in enrichment callback: %s", e)
+
+            if predecessor is not None and not predecessor.done():
+                # Shielded: cancelling this capture must not cancel the
+                # earlier one's future, which later captures rely on
+                await asyncio.shield(predecessor)
+
+            # Callbacks may have changed hashed fields, and earlier captures
+            # may have advanced the chain meanwhile: link to the current head
+            # and hash the final content in one step
+            if callbacks:
+                if offloaded:
+                    # The chain is in capture order, so keep the capture time
+                    event.timestamp = timestamp
+                event.previous_hash = self._last_event_hash.get(organization_id, "")
+                event.hash = event._compute_hash()
+
+            # Update hash chain
             self._last_event_hash[organization_id] = event.hash
+            accumulator = self._chain_accumulators.get(organization_id)
+            if accumulator is None:
+                accumulator = self._chain_accumulators[organization_id] = IncrementalMerkle()
+            accumulator.append(event.hash)
+
+            self._org_versions[organization_id] += 1
+
+            # Add to queue
+            self._event_queue.put_nowait(event)
+        finally:
+            if position is not None:
+                if predecessor is None or predecessor.done():
+                    self._release_chain_position(organization_id, position)
+                else:
+                    # Cancelled before publishing: the next capture must
+                    # still wait for the earlier ones
+                    predecessor.add_done_callback(
+                        lambda _: self._release_chain_position(organization_id, position)
+                    )
+
+        # Flush if batch size reached
+        if self._event_queue.qsize() >= self.batch_size:
+            if self._running:
+                self._flush_event.set()
+            elif self._flush_task is None or self._flush_task.done():
+                # Without the batch processor, one pending flush drains
+                # every event queued before it runs
+                self._flush_task = asyncio.create_task(self._flush_queue())
 
-        # Add to queue
-        async with self._queue_lock:
-            self._event_queue.append(event)
+        return event_id
 
-            # Flush if batch size reached
-            if len(self._event_queue) >= self.batch_size:
-                asyncio.create_task(self._flush_queue())
+    def _release_chain_position(self, organization_id: str, position: asyncio.Future):
+        """Let the capture that reserved the chain position after ``position`` publish."""
+        position.set_result(None)
+        if self._chain_tails.get(organization_id) is position:
+            del self._chain_tails[organization_id]
 
-        # Track for deduplication
-        if self.enable_deduplication:
-            await self._track_event(event)
+    @staticmethod
+    def _dedup_key(event: AuditEvent) -> str:
+        """
+        Build the deduplication key for an event.
 
-        return event_id
+        Events are considered duplicates if they have the same organization,
+        event type, resource, and action.
+        """
+        # _value_ skips the enum's .value property descriptor
+        return (
+            f"{event.organization_id}:"
+            f"{event.event_type}:"
+            f"{event.resource_type}:"
+            f"{event.resource_id}:"
+            f"{event.action._value_}"
+        )
 
-    async def _is_duplicate(self, event: AuditEvent) -> bool:
+    def _check_and_track(self, dedup_key: str, timestamp: datetime) -> bool:
         """
-        Check if an event is a duplicate within the deduplication window.
+        Check an event against the deduplication window and record it.
 
-        Events are considered duplicates if they have the same organization,
-        event type, resource, and action within the time window.
+        Args:
+            dedup_key: Key from ``_dedup_key``
+            timestamp: Event timestamp
+
+        Returns:
+            True if the event is a duplicate and was not recorded
         """
-        async with self._dedup_lock:
-            dedup_key = (
-                f"{event.organization_id}:"
-                f"{event.event_type}:"
-                f"{event.resource_type}:"
-                f"{event.resource_id}:"
-                f"{event.action.value}"
-            )
+        recent_events = self._recent_events
 
-            if dedup_key in self._recent_events:
-                last_time = self._recent_events[dedup_key]
-                time_diff = (event.timestamp - last_time).total_seconds()
+        last_time = recent_events.get(dedup_key)
+        if last_time is not None:
+            time_diff = (timestamp - last_time).total_seconds()
 
-                if time_diff < self.deduplication_window:
-                    return True
+            if time_diff < self.deduplication_window:
+                return True
 
-            return False
+        recent_events[dedup_key] = timestamp
+        recent_events.move_to_end(dedup_key)
 
-    async def _track_event(self, event: AuditEvent):
-        """Track an event for deduplication."""
-        async with self._dedup_lock:
-            dedup_key = (
-                f"{event.organization_id}:"
-                f"{event.event_type}:"
-                f"{event.resource_type}:"
-                f"{event.resource_id}:"
-                f"{event.action.value}"
-            )
+        # Clean up old entries; only the expired prefix is visited. The
+        # event was stamped just now, so its timestamp serves as the clock.
+        cutoff = timestamp - timedelta(seconds=self.deduplication_window)
+        while recent_events:
+            if next(iter(recent_events.values())) >= cutoff:
+                break
+            recent_events.popitem(last=False)
 
-            self._recent_events[dedup_key] = event.timestamp
+        return False
 
-            # Clean up old entries
-            now = datetime.now(timezone.utc)
-            keys_to_remove = [
-                key for key, timestamp in self._recent_events.items()
-                if (now - timestamp).total_seconds() > self.deduplication_window
-            ]
+    def records_severity(self, severity: Severity) -> bool:
+        """
+        Check whether events of a severity meet ``min_severity``.
 
-            for key in keys_to_remove:
-                del self._recent_events[key]
+        Args:
+            severity: Severity of the event about to be captured
+
+        Returns:
+            True if the event should be captured
+        """
+        return _SEVERITY_RANK[severity] >= _SEVERITY_RANK[self.min_severity]
+
+    def get_org_version(self, organization_id: str) -> int:
+        """
+        Get the write version of an organization's audit log.
+
+        The version increases every time an event is captured for the
+        organization, so a cached query result is still current while the
+        version it was computed at is unchanged.
+
+        Args:
+            organization_id: Organization identifier
+
+        Returns:
+            Monotonically increasing version number
+        """
+        return self._org_versions.get(organization_id, 0)
+
+    def get_chain_checkpoint(self, organization_id: str) -> Dict[str, Any]:
+        """
+        Get a checkpoint of the hash chain captured by this service.
+
+        The Merkle root is maintained incrementally as events are captured,
+        so this costs O(log n) and does not read or re-hash stored events.
+        The root matches ``AuditMerkleTree.build_tree`` over the same events
+        in chain order.
+
+        Args:
+            organization_id: Organization identifier
+
+        Returns:
+            Dictionary with the Merkle root, event count and chain head hash
+        """
+        accumulator = self._chain_accumulators.get(organization_id) or IncrementalMerkle()
+        return {
+            "organization_id": organization_id,
+            "merkle_root": accumulator.root(),
+            "event_count": accumulator.count,
+            "last_event_hash": self._last_event_hash.get(organization_id, ""),
+        }
 
     async def get_event(self, event_id: str) -> Optional[AuditEvent]:
         """
@@ -343,6 +545,42 @@ class AuditService:
         """
         return await self.storage.query_events(filter)
 
+    async def stream_events(
+        self,
+        filter: AuditEventFilter,
+        page_size: int = 1000
+    ) -> AsyncIterator[AuditEvent]:
+        """
+        Iterate over matching audit events one page at a time.
+
+        Honors the filter's limit and offset, but never holds more than
+        ``page_size`` events in memory, so large exports can be streamed.
+
+        Args:
+            filter: Filter criteria for the query
+            page_size: Number of events fetched from storage per query
+
+        Yields:
+            Matching audit events in storage order
+        """
+        remaining = filter.limit
+        offset = filter.offset
+
+        while remaining > 0:
+            page_filter = dataclasses.replace(
+                filter, limit=min(page_size, remaining), offset=offset
+            )
+            page = await self.storage.query_events(page_filter)
+
+            for event in page:
+                yield event
+
+            if len(page) < page_filter.limit:
+                break
+
+            remaining -= len(page)
+            offset += len(page)
+
     async def verify_integrity(
         self, organization_id: str,
         start_time: Optional[datetime] = None,
@@ -381,12 +619,10 @@ class AuditService:
         events = await self.query_events(filter)
 
         if format == "json":
-            import json
-            return json.dumps(
-                [event.to_dict() for event in events],
-                indent=2,
-                default=str
-            )
+            # orjson serializes the dataclasses directly, skipping to_dict()
+            return orjson.dumps(
+                events, default=str, option=EVENT_JSON_OPTIONS | orjson.OPT_INDENT_2
+            ).decode("utf-8")
         elif format == "csv":
             import csv
             import io
@@ -395,13 +631,9 @@ class AuditService:
             if not events:
                 return ""
 
-            # Get all field names from first event
-            fieldnames = list(events[0].to_dict().keys())
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for event in events:
-                writer.writerow(event.to_dict())
+            writer = csv.writer(output)
+            writer.writerow(AuditEvent.CSV_COLUMNS)
+            writer.writerows(event.to_tuple() for event in events)
 
             return output.getvalue()
         else:
@@ -442,8 +674,9 @@ def audit_action(
             # For now, this is a placeholder
             audit_service = kwargs.pop('_audit_service', None)
 
-            if audit_service is None:
-                # If no audit service provided, just call the function
+            if audit_service is None or not audit_service.records_severity(severity):
+                # If no audit service provided, or the severity is filtered
+                # out, just call the function
                 return await func(*args, **kwargs)
 
             # Extract parameters
@@ -481,6 +714,16 @@ def audit_action(
     return decorator
 
 
+class _AuditContext:
+    """Before/after state collected inside an ``audit_context`` block."""
+
+    __slots__ = ("before", "after")
+
+    def __init__(self):
+        self.before: Optional[Dict[str, Any]] = None
+        self.after: Optional[Dict[str, Any]] = None
+
+
 @asynccontextmanager
 async def audit_context(
     audit_service: AuditService,
@@ -520,12 +763,11 @@ async def audit_context(
     The context manager will automatically capture an audit event with
     the before and after states.
     """
-    class AuditContext:
-        def __init__(self):
-            self.before: Optional[Dict[str, Any]] = None
-            self.after: Optional[Dict[str, Any]] = None
+    ctx = _AuditContext()
 
-    ctx = AuditContext()
+    if not audit_service.records_severity(severity):
+        yield ctx
+        return
 
     try:
         yield ctx
@@ -6,16 +6,24 @@ Handles async generation and management of audit log exports.
 
 import asyncio
 import csv
+import heapq
 import io
-import json
+import logging
+import os
+import sqlite3
+import struct
 import tempfile
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from itertools import islice
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, Iterator, List, Set, Tuple
+from dataclasses import dataclass, field, replace
 from uuid import uuid4
 
+import orjson
+
 try:
     import pyarrow as pa
     import pyarrow.parquet as pq
@@ -27,16 +35,70 @@ try:
     from cryptography.hazmat.primitives import serialization
     from cryptography.hazmat.primitives.asymmetric import rsa, padding
     from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
     HAS_CRYPTO = True
 except ImportError:
     HAS_CRYPTO = False
 
-from ..models.audit import AuditEvent, AuditEventFilter
+from ..models.audit import EVENT_JSON_OPTIONS, AuditEvent, AuditEventFilter
+
+logger = logging.getLogger(__name__)
+
+# Bytes encrypted per step when encrypting an export file
+ENCRYPT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Export jobs processed concurrently
+EXPORT_WORKERS = 4
+
+# Export jobs allowed to wait in the queue
+MAX_QUEUED_EXPORTS = 100
+
+# Events fetched from the audit service per batch
+EXPORT_BATCH_SIZE = 10_000
+
+# Rows per Parquet row group; statistics are kept per row group, so this is
+# the granularity at which readers can skip data
+PARQUET_ROW_GROUP_SIZE = 50_000
+
+# Parquet column positions in AuditEvent.to_tuple() that need conversion
+_TIMESTAMP_COLUMN = AuditEvent.CSV_COLUMNS.index("timestamp")
+_STATE_COLUMNS = (
+    AuditEvent.CSV_COLUMNS.index("previous_state"),
+    AuditEvent.CSV_COLUMNS.index("new_state"),
+)
+
+if HAS_PARQUET:
+    # Parquet export schema, in AuditEvent field order. Every other column
+    # holds text; state dictionaries have no fixed shape and are stored as
+    # JSON text.
+    _PARQUET_COLUMN_TYPES = {
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "hash_version": pa.int16(),
+    }
+    _PARQUET_SCHEMA = pa.schema([
+        (name, _PARQUET_COLUMN_TYPES.get(name, pa.string()))
+        for name in AuditEvent.CSV_COLUMNS
+    ])
+
+# Low-cardinality Parquet columns worth dictionary encoding; identifiers and
+# hashes are unique per event and would only grow the dictionary pages
+_PARQUET_DICTIONARY_COLUMNS = [
+    "organization_id",
+    "project_id",
+    "actor_type",
+    "actor_id",
+    "event_category",
+    "event_type",
+    "event_severity",
+    "resource_type",
+    "action",
+]
 
 
 class ExportFormat(str, Enum):
     """Export format types."""
     JSON = "json"
+    NDJSON = "ndjson"
     CSV = "csv"
     PARQUET = "parquet"
 
@@ -82,7 +144,7 @@ class ExportJob:
     encryption_enabled: bool = False
     encryption_public_key: Optional[str] = None
     status: ExportStatus = ExportStatus.PENDING
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     file_path: Optional[str] = None
@@ -109,44 +171,249 @@ class ExportJob:
             "expires_at": self.expires_at.isoformat() if self.expires_at else None
         }
 
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Convert to a dictionary holding the complete job state.
+
+        Unlike to_dict(), which is the API view, the record includes the
+        filter, requester, encryption key and file path so the job can be
+        restored with from_record().
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        record = self.to_dict()
+        record.update(
+            actor_id=self.actor_id,
+            filter=self.filter.to_dict(),
+            encryption_public_key=self.encryption_public_key,
+            file_path=self.file_path,
+        )
+        return record
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'ExportJob':
+        """
+        Restore a job from a dictionary produced by to_record().
+
+        Args:
+            record: Complete job state
+
+        Returns:
+            ExportJob instance
+        """
+        data = dict(record)
+        data["filter"] = AuditEventFilter.from_dict(data["filter"])
+        data["format"] = ExportFormat(data["format"])
+        data["status"] = ExportStatus(data["status"])
+        for key in ("created_at", "started_at", "completed_at", "expires_at"):
+            if data[key] is not None:
+                data[key] = datetime.fromisoformat(data[key])
+        return cls(**data)
+
+
+def _batched(events: Iterable[AuditEvent], size: int) -> Iterator[List[AuditEvent]]:
+    """Split an event iterable into lists of at most ``size`` events."""
+    events = iter(events)
+    while batch := list(islice(events, size)):
+        yield batch
+
+
+async def _next_batch(events: AsyncIterator[AuditEvent], size: int) -> List[AuditEvent]:
+    """Take up to ``size`` events from an async event stream."""
+    batch = []
+    async for event in events:
+        batch.append(event)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+def _events_from_loop(
+    events: AsyncIterator[AuditEvent],
+    loop: asyncio.AbstractEventLoop
+) -> Iterator[AuditEvent]:
+    """
+    Iterate an async event stream from a worker thread.
+
+    Each batch is fetched on the event loop, so only one batch of events is
+    held at a time and the thread crosses to the loop once per batch.
+
+    Args:
+        events: Async event stream owned by ``loop``
+        loop: Event loop running the stream
+
+    Yields:
+        Events in stream order
+    """
+    while True:
+        batch = asyncio.run_coroutine_threadsafe(
+            _next_batch(events, EXPORT_BATCH_SIZE), loop
+        ).result()
+        if not batch:
+            return
+        yield from batch
+
+
+class ExportQueueFull(Exception):
+    """Exception raised when the export queue cannot accept another job."""
+
+    pass
+
+
+class ExportJobStore:
+    """
+    SQLite-backed store for export job metadata.
+
+    Jobs are kept as JSON records keyed by export ID, so completed exports
+    and their files stay reachable across restarts. The database runs in
+    WAL mode; job updates are rare and small.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the job database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self._db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the database connection, reopening it after close()."""
+        if self._conn is None:
+            conn = sqlite3.connect(
+                str(self._db_path), isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "export_id TEXT PRIMARY KEY, data BLOB NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def save(self, job: ExportJob):
+        """
+        Insert or update a job.
+
+        Args:
+            job: Job to persist
+        """
+        self._connection().execute(
+            "INSERT OR REPLACE INTO jobs (export_id, data) VALUES (?, ?)",
+            (job.export_id, orjson.dumps(job.to_record())),
+        )
+
+    def load_all(self) -> List[ExportJob]:
+        """
+        Load every stored job.
+
+        Returns:
+            List of stored jobs
+        """
+        return [
+            ExportJob.from_record(orjson.loads(data))
+            for (data,) in self._connection().execute("SELECT data FROM jobs")
+        ]
+
+    def close(self):
+        """Close the database connection. The next save or load reopens it."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
 
 class AuditExportService:
     """
     Service for managing audit log exports.
 
     Handles async export generation, encryption, and cleanup.
+
+    An export directory belongs to a single service instance: on startup,
+    every pending or processing job found in its job store is marked as
+    interrupted, so several processes must not share one directory.
     """
 
-    def __init__(self, export_dir: str = "./exports", expiration_hours: int = 24):
+    def __init__(
+        self,
+        export_dir: str = "./exports",
+        expiration_hours: int = 24,
+        concurrency: int = EXPORT_WORKERS,
+        max_queued_exports: int = MAX_QUEUED_EXPORTS
+    ):
         """
         Initialize export service.
 
         Args:
-            export_dir: Directory for storing export files
+            export_dir: Directory for storing export files and the job store,
+                not shared with other processes
             expiration_hours: Hours before exports are deleted
+            concurrency: Number of export jobs processed at the same time
+            max_queued_exports: Number of jobs allowed to wait for a worker
         """
         self.export_dir = Path(export_dir)
         self.export_dir.mkdir(parents=True, exist_ok=True)
         self.expiration_hours = expiration_hours
+        self.concurrency = concurrency
 
-        # In-memory store (replace with database in production)
+        # Jobs by ID, persisted to the job store on every state change
+        self._store = ExportJobStore(self.export_dir / "jobs.db")
         self._jobs: Dict[str, ExportJob] = {}
+        # (expires_at, export_id) of completed jobs, earliest first
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        for job in self._store.load_all():
+            if job.status in (ExportStatus.PENDING, ExportStatus.PROCESSING):
+                # The queue did not survive the restart
+                job.status = ExportStatus.FAILED
+                job.error_message = "Export interrupted by service restart"
+                job.completed_at = datetime.now(timezone.utc)
+                self._store.save(job)
+            elif job.status == ExportStatus.COMPLETED and job.expires_at:
+                self._expiry_heap.append((job.expires_at, job.export_id))
+            self._jobs[job.export_id] = job
+        heapq.heapify(self._expiry_heap)
 
         # Background task for processing
         self._processing = False
-        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued_exports)
+        self._workers: List[asyncio.Task] = []
+        # Running jobs, referenced here so they outlive a cancelled worker
+        self._job_tasks: Set[asyncio.Task] = set()
 
     async def start(self):
-        """Start the export processor."""
+        """
+        Start the export processor.
+
+        Starts ``concurrency`` workers draining the queue, so a large export
+        does not hold up the jobs queued behind it.
+        """
         if self._processing:
             return
 
         self._processing = True
-        asyncio.create_task(self._process_queue())
+        self._workers = [
+            asyncio.create_task(self._process_queue())
+            for _ in range(self.concurrency)
+        ]
 
     async def stop(self):
-        """Stop the export processor."""
+        """
+        Stop the export processor.
+
+        Jobs already running still complete; stop() waits for them, then
+        closes the job store.
+        """
         self._processing = False
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await asyncio.gather(*self._job_tasks, return_exceptions=True)
+        self._store.close()
 
     async def create_export(
         self,
@@ -170,6 +437,10 @@ class AuditExportService:
 
         Returns:
             ExportJob instance
+
+        Raises:
+            ValueError: If the format is not supported
+            ExportQueueFull: If too many jobs are already waiting
         """
         export_id = f"exp_{uuid4().hex[:16]}"
 
@@ -177,6 +448,11 @@ class AuditExportService:
         if format == ExportFormat.PARQUET and not HAS_PARQUET:
             raise ValueError("Parquet export requires pyarrow library")
 
+        # Reject before the job is stored, so a flood of requests cannot grow
+        # the queue or the job table without bound
+        if self._queue.full():
+            raise ExportQueueFull("Export queue full")
+
         # Create job
         job = ExportJob(
             export_id=export_id,
@@ -191,9 +467,10 @@ class AuditExportService:
 
         # Store job
         self._jobs[export_id] = job
+        self._store.save(job)
 
-        # Queue for processing
-        await self._queue.put(export_id)
+        # Queue for processing; checked above, and nothing awaited since
+        self._queue.put_nowait(export_id)
 
         return job
 
@@ -222,10 +499,14 @@ class AuditExportService:
                 # Process job
                 job = self._jobs.get(export_id)
                 if job:
-                    await self._process_export(job)
+                    # Shielded so stopping the worker does not abandon the job
+                    task = asyncio.create_task(self._process_export(job))
+                    self._job_tasks.add(task)
+                    task.add_done_callback(self._job_tasks.discard)
+                    await asyncio.shield(task)
 
-            except Exception as e:
-                print(f"Error in export processor: {e}")
+            except Exception:
+                logger.exception("Error in export processor")
 
     async def _process_export(self, job: ExportJob):
         """
@@ -238,6 +519,7 @@ class AuditExportService:
             # Update status
             job.status = ExportStatus.PROCESSING
             job.started_at = datetime.now(timezone.utc)
+            self._store.save(job)
 
             # Get audit service
             from ..services.audit import get_audit_service
@@ -246,23 +528,40 @@ class AuditExportService:
             if not audit_service:
                 raise Exception("Audit service not available")
 
-            # Query events
-            events = await audit_service.query_events(job.filter)
-            job.event_count = len(events)
+            # Stream events page by page rather than loading the whole result.
+            # Pages are offsets into newest-first results, so an open-ended
+            # range is capped at the start time to keep new events from
+            # shifting pages mid-export
+            filter = job.filter
+            if filter.end_time is None:
+                filter = replace(filter, end_time=job.started_at)
+            events = _events_from_loop(
+                audit_service.stream_events(filter, page_size=EXPORT_BATCH_SIZE),
+                asyncio.get_running_loop()
+            )
 
             # Generate export file
             file_path = self.export_dir / f"{job.export_id}.{job.format.value}"
 
+            # Serialization and file writes block, so they run in a worker
+            # thread and the event loop keeps serving requests meanwhile
             if job.format == ExportFormat.JSON:
-                await self._export_json(events, file_path, job.include_verification)
+                exporter = self._export_json
+            elif job.format == ExportFormat.NDJSON:
+                exporter = self._export_ndjson
             elif job.format == ExportFormat.CSV:
-                await self._export_csv(events, file_path, job.include_verification)
+                exporter = self._export_csv
             elif job.format == ExportFormat.PARQUET:
-                await self._export_parquet(events, file_path, job.include_verification)
+                exporter = self._export_parquet
+            job.event_count = await asyncio.to_thread(
+                exporter, events, file_path, job.include_verification
+            )
 
             # Encrypt if requested
             if job.encryption_enabled and job.encryption_public_key:
-                file_path = await self._encrypt_file(file_path, job.encryption_public_key)
+                file_path = await asyncio.to_thread(
+                    self._encrypt_file, file_path, job.encryption_public_key
+                )
 
             # Update job
             job.file_path = str(file_path)
@@ -273,105 +572,234 @@ class AuditExportService:
             # Set expiration
             from datetime import timedelta
             job.expires_at = job.completed_at + timedelta(hours=self.expiration_hours)
+            heapq.heappush(self._expiry_heap, (job.expires_at, job.export_id))
 
         except Exception as e:
+            logger.exception("Export %s failed", job.export_id)
             job.status = ExportStatus.FAILED
             job.error_message = str(e)
             job.completed_at = datetime.now(timezone.utc)
 
-    async def _export_json(
+        self._store.save(job)
+
+    def _export_json(
         self,
-        events: List[AuditEvent],
+        events: Iterable[AuditEvent],
         file_path: Path,
         include_verification: bool
-    ):
-        """Export events as JSON."""
-        data = []
+    ) -> int:
+        """
+        Export events as a JSON array, one event per line.
+
+        Events are serialized and written one at a time as they are
+        iterated, so the export never holds the full result.
+
+        Returns:
+            Number of events written
+        """
+        count = 0
+
+        with open(file_path, 'wb') as f:
+            f.write(b"[")
+            separator = b"\n"
+
+            for payload in self._json_payloads(events, include_verification):
+                f.write(separator)
+                f.write(payload)
+                separator = b",\n"
+                count += 1
+
+            f.write(b"\n]\n")
+
+        return count
+
+    def _export_ndjson(
+        self,
+        events: Iterable[AuditEvent],
+        file_path: Path,
+        include_verification: bool
+    ) -> int:
+        """
+        Export events as newline-delimited JSON, one event object per line.
+
+        Unlike a JSON array, consumers can parse the file line by line.
+
+        Returns:
+            Number of events written
+        """
+        count = 0
+
+        with open(file_path, 'wb') as f:
+            for payload in self._json_payloads(events, include_verification):
+                f.write(payload)
+                f.write(b"\n")
+                count += 1
+
+        return count
+
+    @staticmethod
+    def _json_payloads(
+        events: Iterable[AuditEvent],
+        include_verification: bool
+    ) -> Iterator[bytes]:
+        """
+        Encode each event as a compact JSON object.
+
+        orjson serializes the dataclass directly, so no to_dict() copy is
+        built per event. Verification info is spliced in as a final
+        ``_verification`` member, giving the same bytes as encoding
+        to_dict() with that key added.
+        """
+        dumps = orjson.dumps
 
         for event in events:
-            event_dict = event.to_dict()
+            payload = dumps(event, default=str, option=EVENT_JSON_OPTIONS)
 
             if include_verification:
-                # Add verification info
-                event_dict["_verification"] = {
+                verification = dumps({
                     "hash": event.hash,
                     "previous_hash": event.previous_hash,
                     "hash_valid": event.verify_hash()
-                }
-
-            data.append(event_dict)
+                })
+                payload = b"".join((payload[:-1], b',"_verification":', verification, b"}"))
 
-        # Write to file
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+            yield payload
 
-    async def _export_csv(
+    def _export_csv(
         self,
-        events: List[AuditEvent],
+        events: Iterable[AuditEvent],
         file_path: Path,
         include_verification: bool
-    ):
-        """Export events as CSV."""
-        if not events:
+    ) -> int:
+        """
+        Export events as CSV.
+
+        Returns:
+            Number of events written
+        """
+        batches = _batched(events, EXPORT_BATCH_SIZE)
+        batch = next(batches, None)
+
+        if batch is None:
             # Create empty CSV
             with open(file_path, 'w') as f:
                 f.write("")
-            return
-
-        # Get field names from first event
-        first_event = events[0].to_dict()
-        fieldnames = list(first_event.keys())
+            return 0
 
+        # Columns in field order, as to_dict() would produce them
+        fieldnames = AuditEvent.CSV_COLUMNS
         if include_verification:
-            fieldnames.extend(["hash", "previous_hash", "hash_valid"])
+            fieldnames += ("hash", "previous_hash", "hash_valid")
 
-        # Write CSV
-        with open(file_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        count = 0
 
-            for event in events:
-                row = event.to_dict()
+        # Write CSV; tuples skip DictWriter's per-row dictionary lookups
+        with open(file_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
 
+            while batch is not None:
                 if include_verification:
-                    row["hash"] = event.hash
-                    row["previous_hash"] = event.previous_hash
-                    row["hash_valid"] = event.verify_hash()
-
-                writer.writerow(row)
-
-    async def _export_parquet(
+                    writer.writerows(
+                        event.to_tuple() + (event.hash, event.previous_hash, event.verify_hash())
+                        for event in batch
+                    )
+                else:
+                    writer.writerows(event.to_tuple() for event in batch)
+                count += len(batch)
+                batch = next(batches, None)
+
+        return count
+
+    def _export_parquet(
         self,
-        events: List[AuditEvent],
+        events: Iterable[AuditEvent],
         file_path: Path,
         include_verification: bool
-    ):
-        """Export events as Parquet."""
+    ) -> int:
+        """
+        Export events as Parquet.
+
+        Events are converted and written one row group of
+        ``PARQUET_ROW_GROUP_SIZE`` events at a time.
+
+        Returns:
+            Number of events written
+        """
         if not HAS_PARQUET:
             raise Exception("Parquet export requires pyarrow")
 
-        # Convert events to list of dicts
-        data = []
-        for event in events:
-            event_dict = event.to_dict()
-
-            if include_verification:
-                event_dict["hash"] = event.hash
-                event_dict["previous_hash"] = event.previous_hash
-                event_dict["hash_valid"] = event.verify_hash()
+        schema = _PARQUET_SCHEMA
+        if include_verification:
+            schema = schema.append(pa.field("hash_valid", pa.bool_()))
+
+        count = 0
+        with pq.ParquetWriter(
+            file_path,
+            schema,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=_PARQUET_DICTIONARY_COLUMNS,
+            data_page_size=1 << 20,
+            write_statistics=True
+        ) as writer:
+            for batch in _batched(events, PARQUET_ROW_GROUP_SIZE):
+                writer.write_table(
+                    self._parquet_table(batch, schema, include_verification),
+                    row_group_size=PARQUET_ROW_GROUP_SIZE
+                )
+                count += len(batch)
+
+        return count
+
+    @staticmethod
+    def _parquet_table(
+        events: List[AuditEvent],
+        schema: "pa.Schema",
+        include_verification: bool
+    ) -> "pa.Table":
+        """
+        Build a Parquet table for a batch of events.
 
-            data.append(event_dict)
+        The table is built column by column against a fixed schema, so Arrow
+        neither infers types nor converts row dictionaries.
+        """
+        # Transpose event tuples into one sequence per column
+        columns = list(zip(*[event.to_tuple() for event in events]))
+
+        columns[_TIMESTAMP_COLUMN] = [event.timestamp for event in events]
+        dumps = orjson.dumps
+        for index in _STATE_COLUMNS:
+            columns[index] = [
+                None if state is None
+                else dumps(state, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+                for state in columns[index]
+            ]
+
+        arrays = [
+            pa.array(column, type=column_field.type)
+            for column, column_field in zip(columns, _PARQUET_SCHEMA)
+        ]
 
-        # Create PyArrow table
-        table = pa.Table.from_pylist(data)
+        if include_verification:
+            arrays.append(pa.array([event.verify_hash() for event in events], type=pa.bool_()))
 
-        # Write to Parquet file
-        pq.write_table(table, file_path, compression='snappy')
+        return pa.Table.from_arrays(arrays, schema=schema)
 
-    async def _encrypt_file(self, file_path: Path, public_key_pem: str) -> Path:
+    def _encrypt_file(self, file_path: Path, public_key_pem: str) -> Path:
         """
         Encrypt export file.
 
+        Uses hybrid encryption: the file is encrypted with a random 256-bit
+        AES-GCM key, and that key is wrapped with the recipient's RSA public
+        key (OAEP, SHA-256). The encrypted file is laid out as::
+
+            [4-byte big-endian wrapped key length][wrapped key]
+            [12-byte nonce][ciphertext][16-byte GCM tag]
+
+        The file is encrypted in ``ENCRYPT_CHUNK_SIZE`` pieces, so memory use
+        does not grow with the export size.
+
         Args:
             file_path: Path to file to encrypt
             public_key_pem: Public key in PEM format
@@ -390,14 +818,13 @@ class AuditExportService:
             backend=default_backend()
         )
 
-        # Read original file
-        with open(file_path, 'rb') as f:
-            plaintext = f.read()
+        # Encrypt the content with a one-time AES key; RSA only wraps the key
+        key = os.urandom(32)
+        nonce = os.urandom(12)
+        encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
 
-        # Encrypt (Note: For large files, use hybrid encryption with AES)
-        # This is simplified - production should use symmetric encryption
-        ciphertext = public_key.encrypt(
-            plaintext[:245],  # RSA has size limits
+        wrapped_key = public_key.encrypt(
+            key,
             padding.OAEP(
                 mgf=padding.MGF1(algorithm=hashes.SHA256()),
                 algorithm=hashes.SHA256(),
@@ -408,7 +835,16 @@ class AuditExportService:
         # Write encrypted file
         encrypted_path = file_path.with_suffix(file_path.suffix + '.enc')
         with open(encrypted_path, 'wb') as f:
-            f.write(ciphertext)
+            f.write(struct.pack(">I", len(wrapped_key)))
+            f.write(wrapped_key)
+            f.write(nonce)
+
+            with open(file_path, 'rb') as src:
+                while chunk := src.read(ENCRYPT_CHUNK_SIZE):
+                    f.write(encryptor.update(chunk))
+
+            f.write(encryptor.finalize())
+            f.write(encryptor.tag)
 
         # Remove original
         file_path.unlink()
@@ -441,19 +877,35 @@ class AuditExportService:
         return file_path
 
     async def cleanup_expired(self):
-        """Remove expired export files."""
+        """
+        Remove expired export files.
+
+        Only jobs whose expiry has passed are popped from the expiry heap,
+        so the cost depends on the number of expired jobs, not all jobs.
+        """
         now = datetime.now(timezone.utc)
+        heap = self._expiry_heap
+
+        while heap and heap[0][0] < now:
+            _, export_id = heapq.heappop(heap)
+            job = self._jobs.get(export_id)
+            if not job or job.status == ExportStatus.EXPIRED or not job.expires_at:
+                continue
 
-        for export_id, job in list(self._jobs.items()):
-            if job.expires_at and job.expires_at < now:
-                # Delete file
-                if job.file_path:
-                    file_path = Path(job.file_path)
-                    if file_path.exists():
-                        file_path.unlink()
+            if job.expires_at >= now:
+                # Expiry was extended after the entry was queued
+                heapq.heappush(heap, (job.expires_at, export_id))
+                continue
 
-                # Update status
-                job.status = ExportStatus.EXPIRED
+            # Delete file
+            if job.file_path:
+                file_path = Path(job.file_path)
+                if file_path.exists():
+                    file_path.unlink()
+
+            # Update status
+            job.status = ExportStatus.EXPIRED
+            self._store.save(job)
 
-                # Remove from memory (or mark as archived in database)
-                # For now, keep in memory with EXPIRED status
+            # Remove from memory (or mark as archived in database)
+            # For now, keep in memory with EXPIRED status
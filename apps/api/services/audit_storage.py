@@ -18,13 +18,6 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 from uuid import uuid4
 
-try:
-    import boto3
-    from botocore.exceptions import ClientError
-    HAS_BOTO3 = True
-except ImportError:
-    HAS_BOTO3 = False
-
 from ..models.audit import AuditEvent, AuditEventFilter
 
 
@@ -155,8 +148,8 @@ class LocalAuditStorage(AuditStorage):
                 return False
 
             # Write event as JSON
-            with open(event_path, 'w', encoding='utf-8') as f:
-                json.dump(event.to_dict(), f, indent=2, default=str)
+            with open(event_path, 'wb') as f:
+                f.write(event.to_json_bytes())
 
             # Make file read-only (simulates WORM)
             os.chmod(event_path, 0o444)
@@ -389,7 +382,13 @@ class S3AuditStorage(AuditStorage):
             secret_key: AWS secret key (optional)
             retention_days: Object Lock retention period in days
         """
-        if not HAS_BOTO3:
+        # Imported lazily so local-only deployments never load boto3
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+
+            self.ClientError = ClientError
+        except ImportError:
             raise ImportError(
                 "boto3 is required for S3AuditStorage. "
                 "Install it with: pip install boto3"
@@ -418,7 +417,7 @@ class S3AuditStorage(AuditStorage):
             )
             if response['ObjectLockConfiguration']['ObjectLockEnabled'] != 'Enabled':
                 print(f"Warning: Object Lock is not enabled on bucket {self.bucket_name}")
-        except ClientError as e:
+        except self.ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'ObjectLockConfigurationNotFoundError':
                 print(f"Warning: Object Lock is not configured on bucket {self.bucket_name}")
@@ -442,7 +441,7 @@ class S3AuditStorage(AuditStorage):
             )
 
             # Serialize event to JSON
-            event_json = json.dumps(event.to_dict(), indent=2, default=str)
+            event_json = event.to_json_bytes()
 
             # Calculate retention date
             from datetime import timedelta
@@ -455,7 +454,7 @@ class S3AuditStorage(AuditStorage):
                 lambda: self.s3_client.put_object(
                     Bucket=self.bucket_name,
                     Key=s3_key,
-                    Body=event_json.encode('utf-8'),
+                    Body=event_json,
                     ContentType='application/json',
                     ObjectLockMode='COMPLIANCE',
                     ObjectLockRetainUntilDate=retention_date,
@@ -547,7 +546,7 @@ class S3AuditStorage(AuditStorage):
                         )
                         if retention.get('Retention', {}).get('Mode') == 'COMPLIANCE':
                             locked_objects += 1
-                    except ClientError:
+                    except self.ClientError:
                         # Object may not have retention set
                         pass
 
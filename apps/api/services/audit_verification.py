@@ -14,7 +14,7 @@ import hashlib
 import json
 import math
 from datetime import datetime, date, timezone, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import AsyncIterable, List, Optional, Dict, Any
 import base64
 
 try:
@@ -33,10 +33,11 @@ except ImportError:
     HAS_CRYPTOGRAPHY = False
 
 from ..models.audit import AuditEvent, AuditEventFilter
+from ._hash_batch import HEX_DIGEST_SIZE, hash_level
 from ..models.audit_verification import (
     ChainVerificationResult,
     TamperingIndicator,
-    MerkleNode,
+    MerkleLevel,
     MerkleRoot,
     MerkleProof,
     TimestampToken,
@@ -48,6 +49,10 @@ from ..models.audit_verification import (
 )
 
 
+#: Upper bound on error entries kept by streaming chain verification
+MAX_CHAIN_ERRORS = 10_000
+
+
 class AuditChain:
     """
     Maintains cryptographic integrity of audit events using hash chaining.
@@ -68,6 +73,12 @@ class AuditChain:
         - Resource information
         - Action and states
         - Request context
+        - Previous event's hash (the chain link)
+
+        This is the same single-pass digest ``AuditEvent`` stores in
+        ``event.hash``, so verification recomputes exactly what was written.
+        Each step depends on the previous hash and cannot be batched; the
+        OpenSSL-backed hasher uses SHA-NI where the CPU supports it.
 
         Args:
             event: The audit event to hash
@@ -75,33 +86,7 @@ class AuditChain:
         Returns:
             Hexadecimal SHA-256 hash string
         """
-        # Create deterministic representation
-        hash_data = {
-            "event_id": event.event_id,
-            "timestamp": event.timestamp.isoformat(),
-            "organization_id": event.organization_id,
-            "project_id": event.project_id,
-            "actor_type": event.actor_type.value,
-            "actor_id": event.actor_id,
-            "actor_email": event.actor_email,
-            "event_category": event.event_category.value,
-            "event_type": event.event_type,
-            "event_severity": event.event_severity.value,
-            "resource_type": event.resource_type,
-            "resource_id": event.resource_id,
-            "resource_name": event.resource_name,
-            "action": event.action.value,
-            "previous_state": event.previous_state,
-            "new_state": event.new_state,
-            "request_id": event.request_id,
-            "session_id": event.session_id,
-        }
-
-        # Convert to JSON with sorted keys for determinism
-        json_str = json.dumps(hash_data, sort_keys=True, default=str)
-
-        # Compute SHA-256 hash
-        return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+        return event._compute_hash()
 
     @staticmethod
     def link_to_chain(event: AuditEvent, previous_event: Optional[AuditEvent]) -> str:
@@ -190,16 +175,8 @@ class AuditChain:
 
             valid_events += 1
 
-        # Determine overall status
-        if invalid_events == 0:
-            status = VerificationStatus.VALID
-        elif valid_events == 0:
-            status = VerificationStatus.INVALID
-        else:
-            status = VerificationStatus.INCOMPLETE
-
         return ChainVerificationResult(
-            status=status,
+            status=self._chain_status(valid_events, invalid_events),
             total_events=total_events,
             valid_events=valid_events,
             invalid_events=invalid_events,
@@ -210,6 +187,113 @@ class AuditChain:
             errors=errors
         )
 
+    @staticmethod
+    def _chain_status(valid_events: int, invalid_events: int) -> VerificationStatus:
+        """Derive the overall chain status from per-event counts."""
+        if invalid_events == 0:
+            return VerificationStatus.VALID
+        if valid_events == 0:
+            return VerificationStatus.INVALID
+        return VerificationStatus.INCOMPLETE
+
+    async def verify_chain_streaming(
+        self,
+        events: AsyncIterable[AuditEvent],
+        max_errors: int = MAX_CHAIN_ERRORS
+    ) -> ChainVerificationResult:
+        """
+        Verify integrity of an event sequence without loading it into memory.
+
+        Performs the same checks as ``verify_chain`` but consumes events
+        newest first, the order ``AuditService.stream_events`` yields them,
+        holding only the most recent unlinked event between pages. Counters
+        cover every event, while the error lists are capped; an
+        ``errors_truncated`` entry records how many errors were dropped.
+
+        To verify only the tail of a chain (e.g. for health checks), stream
+        with a filter limit of N; the oldest streamed event is then treated
+        as the start of the chain.
+
+        Args:
+            events: Events in newest-first order
+            max_errors: Maximum number of error entries to keep
+
+        Returns:
+            ChainVerificationResult with detailed verification information
+        """
+        compute_hash = self.compute_event_hash
+        total_events = 0
+        valid_events = 0
+        invalid_events = 0
+        broken_links = []
+        hash_mismatches = []
+        errors = []
+        omitted_errors = 0
+        newest_event_id = None
+        oldest_event_id = None
+        # Newer event with a valid hash whose link has not been checked yet
+        unlinked = None
+
+        def record(event_ids, event_id, error_type, expected, actual):
+            nonlocal omitted_errors
+            if len(errors) >= max_errors:
+                omitted_errors += 1
+                return
+            event_ids.append(event_id)
+            errors.append({
+                "event_id": event_id,
+                "type": error_type,
+                "expected": expected,
+                "actual": actual
+            })
+
+        async for event in events:
+            total_events += 1
+            oldest_event_id = event.event_id
+            if newest_event_id is None:
+                newest_event_id = event.event_id
+
+            # This event precedes the unlinked one in the chain
+            if unlinked is not None:
+                if unlinked.previous_hash != event.hash:
+                    invalid_events += 1
+                    record(
+                        broken_links, unlinked.event_id, "chain_break",
+                        event.hash, unlinked.previous_hash
+                    )
+                else:
+                    valid_events += 1
+                unlinked = None
+
+            computed_hash = compute_hash(event)
+            if computed_hash != event.hash:
+                invalid_events += 1
+                record(
+                    hash_mismatches, event.event_id, "hash_mismatch",
+                    computed_hash, event.hash
+                )
+            else:
+                unlinked = event
+
+        # The oldest event has no predecessor in range
+        if unlinked is not None:
+            valid_events += 1
+
+        if omitted_errors:
+            errors.append({"type": "errors_truncated", "omitted": omitted_errors})
+
+        return ChainVerificationResult(
+            status=self._chain_status(valid_events, invalid_events),
+            total_events=total_events,
+            valid_events=valid_events,
+            invalid_events=invalid_events,
+            first_event_id=oldest_event_id,
+            last_event_id=newest_event_id,
+            broken_links=broken_links,
+            hash_mismatches=hash_mismatches,
+            errors=errors
+        )
+
     def find_tampering(self, events: List[AuditEvent]) -> List[TamperingIndicator]:
         """
         Detect potential tampering in audit log.
@@ -234,6 +318,15 @@ class AuditChain:
         # Sort by timestamp
         sorted_events = sorted(events, key=lambda e: e.timestamp)
 
+        # Chain predecessor of each event, found through its previous_hash.
+        # Timestamp order is checked along the chain: neighbours in the
+        # sorted list are in order by construction.
+        by_hash = {event.hash: event for event in events}
+
+        # Anything later than this is in the future
+        now = datetime.now(timezone.utc)
+        future_cutoff = now + timedelta(hours=1)
+
         # Check each event
         for i, event in enumerate(sorted_events):
             # Check hash mismatch
@@ -266,24 +359,22 @@ class AuditChain:
                         }
                     ))
 
-            # Check timestamp anomaly (event timestamp before previous event)
-            if i > 0:
-                previous_event = sorted_events[i - 1]
-                if event.timestamp < previous_event.timestamp:
-                    indicators.append(TamperingIndicator(
-                        event_id=event.event_id,
-                        tampering_type=TamperingType.TIMESTAMP_ANOMALY,
-                        severity=8,
-                        description=f"Event timestamp is before previous event",
-                        evidence={
-                            "event_timestamp": event.timestamp.isoformat(),
-                            "previous_timestamp": previous_event.timestamp.isoformat()
-                        }
-                    ))
+            # Check timestamp anomaly (event timestamp before its chain predecessor)
+            predecessor = by_hash.get(event.previous_hash)
+            if predecessor is not None and event.timestamp < predecessor.timestamp:
+                indicators.append(TamperingIndicator(
+                    event_id=event.event_id,
+                    tampering_type=TamperingType.TIMESTAMP_ANOMALY,
+                    severity=8,
+                    description=f"Event timestamp is before previous event",
+                    evidence={
+                        "event_timestamp": event.timestamp.isoformat(),
+                        "previous_timestamp": predecessor.timestamp.isoformat()
+                    }
+                ))
 
             # Check for suspicious timestamp (too far in future)
-            now = datetime.now(timezone.utc)
-            if event.timestamp > now + timedelta(hours=1):
+            if event.timestamp > future_cutoff:
                 indicators.append(TamperingIndicator(
                     event_id=event.event_id,
                     tampering_type=TamperingType.TIMESTAMP_ANOMALY,
@@ -312,50 +403,41 @@ class AuditMerkleTree:
         combined = left + right
         return hashlib.sha256(combined.encode('utf-8')).hexdigest()
 
-    def _build_tree_recursive(self, hashes: List[Tuple[str, str]]) -> MerkleNode:
+    def _build_levels(self, leaf_hashes: List[str]) -> List[MerkleLevel]:
         """
-        Recursively build Merkle tree from leaf hashes.
+        Build the interior levels of a Merkle tree bottom-up.
+
+        Each level is one contiguous buffer digested with a single
+        ``hash_pairs`` call. For an odd number of nodes the last node is
+        paired with itself.
 
         Args:
-            hashes: List of (event_id, hash) tuples
+            leaf_hashes: Leaf hashes in event order
 
         Returns:
-            Root node of the tree
-        """
-        if len(hashes) == 1:
-            # Leaf node
-            event_id, hash_value = hashes[0]
-            return MerkleNode(hash=hash_value, event_id=event_id)
-
-        # Build parent nodes
-        parent_hashes = []
-
-        for i in range(0, len(hashes), 2):
-            left_id, left_hash = hashes[i]
-
-            if i + 1 < len(hashes):
-                right_id, right_hash = hashes[i + 1]
-            else:
-                # Odd number of nodes: duplicate the last one
-                right_id, right_hash = left_id, left_hash
-
-            # Create parent node
-            parent_hash = self._hash_pair(left_hash, right_hash)
-            parent_hashes.append((f"{left_id}+{right_id}", parent_hash))
-
-        # Recursively build upper levels
-        if len(parent_hashes) == 1:
-            # This is the root
-            _, root_hash = parent_hashes[0]
-            left_node = self._build_tree_recursive([hashes[i] for i in range(0, len(hashes), 2)])
-            if len(hashes) > 1:
-                right_node = self._build_tree_recursive([hashes[i] for i in range(1, len(hashes), 2)])
-            else:
-                right_node = None
-
-            return MerkleNode(hash=root_hash, left=left_node, right=right_node)
+            Levels from just above the leaves up to the root (empty for a
+            single leaf)
+        """
+        levels = []
+        if len(leaf_hashes) < 2:
+            return levels
+
+        if any(len(h) != HEX_DIGEST_SIZE for h in leaf_hashes):
+            # Irregular leaf hashes cannot be packed into fixed-size pairs
+            last = len(leaf_hashes) - 1
+            level = "".join([
+                self._hash_pair(leaf_hashes[i], leaf_hashes[min(i + 1, last)])
+                for i in range(0, len(leaf_hashes), 2)
+            ]).encode("ascii")
         else:
-            return self._build_tree_recursive(parent_hashes)
+            level = hash_level("".join(leaf_hashes).encode("ascii"))
+
+        while True:
+            count = len(level) // HEX_DIGEST_SIZE
+            levels.append(MerkleLevel(level, count))
+            if count == 1:
+                return levels
+            level = hash_level(level)
 
     def build_tree(self, events: List[AuditEvent]) -> MerkleRoot:
         """
@@ -365,26 +447,20 @@ class AuditMerkleTree:
             events: List of audit events
 
         Returns:
-            MerkleRoot containing the tree and root hash
+            MerkleRoot containing the tree levels and root hash
         """
         if not events:
             # Empty tree
-            empty_hash = hashlib.sha256(b"").hexdigest()
             return MerkleRoot(
-                root_hash=empty_hash,
-                tree=MerkleNode(hash=empty_hash),
+                root_hash=hashlib.sha256(b"").hexdigest(),
                 event_count=0
             )
 
-        # Extract hashes
-        hashes = [(event.event_id, event.hash) for event in events]
-
-        # Build tree
-        tree = self._build_tree_recursive(hashes)
+        leaf_hashes = [event.hash for event in events]
+        levels = self._build_levels(leaf_hashes)
 
         return MerkleRoot(
-            root_hash=tree.hash,
-            tree=tree,
+            root_hash=levels[-1].hash_at(0) if levels else leaf_hashes[0],
             event_count=len(events),
             metadata={
                 "first_event_id": events[0].event_id,
@@ -393,54 +469,20 @@ class AuditMerkleTree:
                     "start": events[0].timestamp.isoformat(),
                     "end": events[-1].timestamp.isoformat()
                 }
-            }
+            },
+            leaf_event_ids=[event.event_id for event in events],
+            leaf_hashes=leaf_hashes,
+            levels=levels
         )
 
-    def _find_event_path(
-        self, node: MerkleNode, target_event_id: str, path: List[Tuple[str, str]]
-    ) -> Optional[List[Tuple[str, str]]]:
-        """
-        Find path from leaf to root for a specific event.
-
-        Args:
-            node: Current node in traversal
-            target_event_id: Event ID to find
-            path: Current path (list of (hash, direction) tuples)
-
-        Returns:
-            Path from leaf to root, or None if not found
-        """
-        if node.is_leaf():
-            if node.event_id == target_event_id:
-                return path
-            return None
-
-        # Search left subtree
-        if node.left:
-            left_path = self._find_event_path(
-                node.left,
-                target_event_id,
-                path + [(node.right.hash if node.right else node.left.hash, "right")]
-            )
-            if left_path is not None:
-                return left_path
-
-        # Search right subtree
-        if node.right:
-            right_path = self._find_event_path(
-                node.right,
-                target_event_id,
-                path + [(node.left.hash if node.left else node.right.hash, "left")]
-            )
-            if right_path is not None:
-                return right_path
-
-        return None
-
     def generate_proof(self, event: AuditEvent, tree: MerkleRoot) -> Optional[MerkleProof]:
         """
         Generate inclusion proof for a single event.
 
+        Walks the stored levels by index: at each level the sibling of node
+        ``i`` is ``i ^ 1`` and its parent is ``i >> 1``, so no ``MerkleNode``
+        objects are needed. A missing sibling (odd level) is the node itself.
+
         Args:
             event: Event to generate proof for
             tree: Merkle tree root
@@ -448,15 +490,30 @@ class AuditMerkleTree:
         Returns:
             MerkleProof for the event, or None if event not in tree
         """
-        # Find path from leaf to root
-        path = self._find_event_path(tree.tree, event.event_id, [])
-
-        if path is None:
+        try:
+            index = tree.leaf_event_ids.index(event.event_id)
+        except ValueError:
             return None
 
-        # Extract proof hashes and directions
-        proof_hashes = [h for h, _ in path]
-        proof_directions = [d for _, d in path]
+        proof_hashes = []
+        proof_directions = []
+
+        # A single-leaf tree has an empty proof: the leaf is the root
+        if tree.levels:
+            leaf_hashes = tree.leaf_hashes
+            sibling = index ^ 1
+            proof_hashes.append(
+                leaf_hashes[sibling] if sibling < len(leaf_hashes) else leaf_hashes[index]
+            )
+            proof_directions.append("left" if sibling < index else "right")
+            index >>= 1
+
+            # Every interior level below the root
+            for level in tree.levels[:-1]:
+                sibling = index ^ 1
+                proof_hashes.append(level.hash_at(sibling if sibling < level.n else index))
+                proof_directions.append("left" if sibling < index else "right")
+                index >>= 1
 
         return MerkleProof(
             event_id=event.event_id,
@@ -499,6 +556,74 @@ class AuditMerkleTree:
         return current_hash == root.root_hash
 
 
+class IncrementalMerkle:
+    """
+    Append-only Merkle accumulator over an event hash chain.
+
+    Keeps one pending subtree root per level (the binary representation of
+    the leaf count), so appending a leaf costs O(1) amortized and O(log n)
+    worst case, and the root is available in O(log n) without replaying the
+    chain. Roots match ``AuditMerkleTree.build_tree`` over the same leaves,
+    including its rule of pairing an odd trailing node with itself.
+    """
+
+    __slots__ = ("count", "_frontier")
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        # _frontier[i] is the root of a complete 2**i-leaf subtree awaiting
+        # its right sibling, or None
+        self._frontier: List[Optional[str]] = []
+
+    def append(self, leaf_hash: str) -> None:
+        """
+        Add the next leaf to the accumulator.
+
+        Args:
+            leaf_hash: Hash of the event appended to the chain
+        """
+        frontier = self._frontier
+        carry = leaf_hash
+        level = 0
+        while level < len(frontier) and frontier[level] is not None:
+            carry = AuditMerkleTree._hash_pair(frontier[level], carry)
+            frontier[level] = None
+            level += 1
+        if level == len(frontier):
+            frontier.append(carry)
+        else:
+            frontier[level] = carry
+        self.count += 1
+
+    def root(self) -> str:
+        """
+        Return the Merkle root of all leaves appended so far.
+
+        Returns:
+            Root hash, or the SHA-256 of empty input if no leaves were added
+        """
+        if not self.count:
+            return hashlib.sha256(b"").hexdigest()
+
+        hash_pair = AuditMerkleTree._hash_pair
+        frontier = self._frontier
+        top = len(frontier) - 1
+        carry: Optional[str] = None
+        for level in range(top):
+            pending = frontier[level]
+            if pending is not None:
+                carry = hash_pair(pending, carry if carry is not None else pending)
+            elif carry is not None:
+                # Odd trailing node at this level, paired with itself
+                carry = hash_pair(carry, carry)
+
+        if carry is None:
+            # Leaf count is a power of two: one complete tree
+            return frontier[top]
+        return hash_pair(frontier[top], carry)
+
+
 class TimestampAuthority:
     """
     Integration with RFC 3161 timestamping authorities.
@@ -11,7 +11,7 @@ from typing import List, Dict, Any
 from collections import defaultdict
 from dataclasses import dataclass, field
 
-from ..models.requests import SpanRequest
+from ..models.requests_fast import AnySpanRequest
 from .storage import StorageBackend
 
 logger = logging.getLogger(__name__)
@@ -57,7 +57,7 @@ class IngestionService:
     Usage:
         service = IngestionService(storage, batch_size=1000, flush_interval=5.0)
         await service.start()
-        await service.ingest_span(span, project_id, environment)
+        await service.ingest_spans(spans, project_id, environment)
         await service.shutdown()
     """
 
@@ -83,11 +83,13 @@ class IngestionService:
         self.max_queue_size = max_queue_size
 
         # Batches organized by (project_id, environment)
-        self.batches: Dict[tuple, List[SpanRequest]] = defaultdict(list)
+        self.batches: Dict[tuple, List[AnySpanRequest]] = defaultdict(list)
         self.batch_timestamps: Dict[tuple, float] = {}
 
-        # Queue for incoming spans
-        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        # Queue of (spans, project_id, environment) chunks; capacity is
+        # enforced in spans via queued_spans rather than by the queue itself
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.queued_spans = 0
 
         # Worker task
         self.worker_task: asyncio.Task = None
@@ -114,8 +116,41 @@ class IngestionService:
             self.worker_task = asyncio.create_task(self._worker_loop())
             logger.info("Started ingestion worker")
 
+    async def ingest_spans(
+        self, spans: List[AnySpanRequest], project_id: str, environment: str
+    ) -> int:
+        """
+        Ingest multiple spans with a single queue operation (non-blocking).
+
+        Accepts as many spans as fit in the queue, in order; the rest are
+        rejected.
+
+        Args:
+            spans: Spans to ingest
+            project_id: Project identifier
+            environment: Environment name
+
+        Returns:
+            int: Number of spans accepted (always a prefix of ``spans``)
+        """
+        room = max(0, self.max_queue_size - self.queued_spans)
+        accepted = min(room, len(spans))
+
+        if accepted:
+            chunk = spans if accepted == len(spans) else spans[:accepted]
+            self.queue.put_nowait((chunk, project_id, environment))
+            self.queued_spans += accepted
+            self.stats.spans_received += accepted
+
+        rejected = len(spans) - accepted
+        if rejected:
+            logger.warning(f"Ingestion queue is full, dropping {rejected} spans")
+            self.stats.spans_rejected += rejected
+
+        return accepted
+
     async def ingest_span(
-        self, span: SpanRequest, project_id: str, environment: str
+        self, span: AnySpanRequest, project_id: str, environment: str
     ) -> None:
         """
         Ingest a single span (async, non-blocking).
@@ -130,17 +165,11 @@ class IngestionService:
         Raises:
             asyncio.QueueFull: If queue is full
         """
-        try:
-            # Non-blocking put
-            self.queue.put_nowait((span, project_id, environment))
-            self.stats.spans_received += 1
-        except asyncio.QueueFull:
-            logger.warning("Ingestion queue is full, dropping span")
-            self.stats.spans_rejected += 1
-            raise
+        if not await self.ingest_spans([span], project_id, environment):
+            raise asyncio.QueueFull
 
     async def ingest_batch(
-        self, spans: List[SpanRequest], project_id: str, environment: str
+        self, spans: List[AnySpanRequest], project_id: str, environment: str
     ) -> None:
         """
         Ingest multiple spans (async, non-blocking).
@@ -153,8 +182,8 @@ class IngestionService:
         Raises:
             asyncio.QueueFull: If queue is full
         """
-        for span in spans:
-            await self.ingest_span(span, project_id, environment)
+        if await self.ingest_spans(spans, project_id, environment) < len(spans):
+            raise asyncio.QueueFull
 
     async def _worker_loop(self) -> None:
         """
@@ -168,12 +197,13 @@ class IngestionService:
             try:
                 # Process queued spans with timeout
                 try:
-                    span, project_id, environment = await asyncio.wait_for(
+                    spans, project_id, environment = await asyncio.wait_for(
                         self.queue.get(), timeout=1.0
                     )
+                    self.queued_spans -= len(spans)
 
                     # Add to batch
-                    await self._add_to_batch(span, project_id, environment)
+                    await self._add_to_batch(spans, project_id, environment)
 
                 except asyncio.TimeoutError:
                     # No items in queue, check for time-based flush
@@ -191,13 +221,13 @@ class IngestionService:
         logger.info("Worker loop stopped")
 
     async def _add_to_batch(
-        self, span: SpanRequest, project_id: str, environment: str
+        self, spans: List[AnySpanRequest], project_id: str, environment: str
     ) -> None:
         """
-        Add span to appropriate batch.
+        Add spans to appropriate batch.
 
         Args:
-            span: Span to add
+            spans: Spans to add
             project_id: Project identifier
             environment: Environment name
         """
@@ -208,12 +238,12 @@ class IngestionService:
             if batch_key not in self.batch_timestamps:
                 self.batch_timestamps[batch_key] = time.time()
 
-            # Add span to batch
-            self.batches[batch_key].append(span)
-            self.stats.spans_accepted += 1
+            # Add spans to batch
+            self.batches[batch_key].extend(spans)
+            self.stats.spans_accepted += len(spans)
 
             logger.debug(
-                f"Added span to batch {batch_key}, "
+                f"Added {len(spans)} spans to batch {batch_key}, "
                 f"batch size: {len(self.batches[batch_key])}"
             )
 
@@ -337,7 +367,7 @@ class IngestionService:
             "spans_rejected_total": self.stats.spans_rejected,
             "batches_processed_total": self.stats.batches_processed,
             "storage_errors_total": self.stats.storage_errors,
-            "queue_size_current": self.queue.qsize(),
+            "queue_size_current": self.queued_spans,
             "processing_duration_seconds": self.stats.average_processing_time,
             "uptime_seconds": self.stats.uptime,
         }
@@ -349,7 +379,7 @@ class IngestionService:
         Returns:
             str: 'healthy', 'degraded', or 'unhealthy'
         """
-        queue_size = self.queue.qsize()
+        queue_size = self.queued_spans
         error_rate = (
             self.stats.spans_rejected / max(1, self.stats.spans_received)
             if self.stats.spans_received > 0
@@ -7,16 +7,25 @@ Provides pluggable storage backends (local file system, S3, etc.)
 import json
 import os
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional
 import logging
 
-from ..models.requests import SpanRequest
+import msgspec
+
+from ..models.requests_fast import AnySpanRequest
 
 logger = logging.getLogger(__name__)
 
 
+def _span_to_dict(span: AnySpanRequest) -> dict:
+    """Convert a span (Pydantic model or msgspec struct) to a plain dict."""
+    if isinstance(span, msgspec.Struct):
+        return msgspec.structs.asdict(span)
+    return span.model_dump()
+
+
 class StorageBackend(ABC):
     """
     Abstract base class for storage backends.
@@ -26,7 +35,7 @@ class StorageBackend(ABC):
 
     @abstractmethod
     async def store(
-        self, spans: List[SpanRequest], project_id: str, environment: str
+        self, spans: List[AnySpanRequest], project_id: str, environment: str
     ) -> None:
         """
         Store spans to the backend.
@@ -84,7 +93,7 @@ class LocalFileStorage(StorageBackend):
         logger.info(f"Initialized LocalFileStorage at {self.base_path}")
 
     async def store(
-        self, spans: List[SpanRequest], project_id: str, environment: str
+        self, spans: List[AnySpanRequest], project_id: str, environment: str
     ) -> None:
         """
         Store spans to local file system.
@@ -106,10 +115,12 @@ class LocalFileStorage(StorageBackend):
                 trace_id = span.trace_id
                 if trace_id not in traces:
                     traces[trace_id] = []
-                traces[trace_id].append(span.dict())
+                traces[trace_id].append(_span_to_dict(span))
 
-            # Store each trace
-            today = datetime.utcnow().strftime("%Y-%m-%d")
+            # Store each trace; one timestamp covers the whole flush
+            now = datetime.now(timezone.utc)
+            today = now.strftime("%Y-%m-%d")
+            stored_at = now.isoformat()
 
             for trace_id, trace_spans in traces.items():
                 # Create directory structure
@@ -124,7 +135,7 @@ class LocalFileStorage(StorageBackend):
                     "trace_id": trace_id,
                     "project_id": project_id,
                     "environment": environment,
-                    "stored_at": datetime.utcnow().isoformat(),
+                    "stored_at": stored_at,
                     "span_count": len(trace_spans),
                     "spans": trace_spans,
                 }
@@ -135,7 +146,7 @@ class LocalFileStorage(StorageBackend):
                         existing_data = json.load(f)
                     existing_data["spans"].extend(trace_spans)
                     existing_data["span_count"] = len(existing_data["spans"])
-                    existing_data["updated_at"] = datetime.utcnow().isoformat()
+                    existing_data["updated_at"] = stored_at
                     trace_data = existing_data
 
                 with open(trace_file, "w") as f:
@@ -231,7 +242,7 @@ class S3Storage(StorageBackend):
         logger.info(f"Initialized S3Storage for bucket {bucket} in {region}")
 
     async def store(
-        self, spans: List[SpanRequest], project_id: str, environment: str
+        self, spans: List[AnySpanRequest], project_id: str, environment: str
     ) -> None:
         """
         Store spans to S3.
@@ -253,10 +264,12 @@ class S3Storage(StorageBackend):
                 trace_id = span.trace_id
                 if trace_id not in traces:
                     traces[trace_id] = []
-                traces[trace_id].append(span.dict())
+                traces[trace_id].append(_span_to_dict(span))
 
-            # Upload each trace
-            today = datetime.utcnow().strftime("%Y-%m-%d")
+            # Upload each trace; one timestamp covers the whole flush
+            now = datetime.now(timezone.utc)
+            today = now.strftime("%Y-%m-%d")
+            stored_at = now.isoformat()
 
             for trace_id, trace_spans in traces.items():
                 # Create S3 key
@@ -266,7 +279,7 @@ class S3Storage(StorageBackend):
                     "trace_id": trace_id,
                     "project_id": project_id,
                     "environment": environment,
-                    "stored_at": datetime.utcnow().isoformat(),
+                    "stored_at": stored_at,
                     "span_count": len(trace_spans),
                     "spans": trace_spans,
                 }
@@ -10,7 +10,7 @@ from typing import Optional, List, Dict, Any
 from collections import defaultdict, Counter
 
 from fastapi import APIRouter, HTTPException, Query, Depends, Response, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from ....models.audit import (
@@ -22,7 +22,7 @@ from ....models.audit import (
     Severity
 )
 from ....services.audit import get_audit_service
-from ....services.audit_export import AuditExportService, ExportFormat, ExportJob
+from ....services.audit_export import AuditExportService, ExportFormat, ExportJob, ExportQueueFull
 from ....services.audit_verification import AuditChain
 from ...utils.pagination import PaginationCursor, PaginatedResponse
 from ...middleware.access_control import (
@@ -35,7 +35,11 @@ from ...middleware.access_control import (
 )
 
 
-router = APIRouter(prefix="/v1/audit", tags=["Audit Trail"])
+router = APIRouter(
+    prefix="/v1/audit",
+    tags=["Audit Trail"],
+    default_response_class=ORJSONResponse
+)
 
 
 # Initialize services
@@ -614,14 +618,20 @@ async def create_export(request: ExportRequest, current_user: User = Depends(req
     filter = AuditEventFilter(**filter_dict)
 
     # Create export job
-    job = await export_service.create_export(
-        organization_id=request.organization_id,
-        actor_id=current_user.user_id,
-        filter=filter,
-        format=request.format,
-        include_verification=request.include_verification,
-        encryption_config=request.encryption
-    )
+    try:
+        job = await export_service.create_export(
+            organization_id=request.organization_id,
+            actor_id=current_user.user_id,
+            filter=filter,
+            format=request.format,
+            include_verification=request.include_verification,
+            encryption_config=request.encryption
+        )
+    except ExportQueueFull:
+        raise HTTPException(
+            status_code=429,
+            detail="Export queue full, retry later"
+        )
 
     return job.to_dict()
 
@@ -692,6 +702,7 @@ async def download_export(export_id: str, current_user: User = Depends(require_a
     # Determine content type
     content_type_map = {
         "json": "application/json",
+        "ndjson": "application/x-ndjson",
         "csv": "text/csv",
         "parquet": "application/octet-stream"
     }
@@ -4,9 +4,15 @@ Audit Verification API Routes
 FastAPI endpoints for cryptographic verification of audit trails.
 """
 
+import dataclasses
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, date, timedelta, timezone
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query, Depends
+from typing import Optional, List, Tuple
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from ....models.audit import AuditEventFilter
@@ -14,7 +20,7 @@ from ....models.audit_verification import (
     VerificationStatus,
     VerificationReport
 )
-from ....services.audit import get_audit_service
+from ....services.audit import AuditService, get_audit_service
 from ....services.audit_verification import (
     AuditChain,
     AuditMerkleTree,
@@ -23,7 +29,12 @@ from ....services.audit_verification import (
 )
 
 
-router = APIRouter(prefix="/v1/audit", tags=["Audit Verification"])
+# Reports can carry thousands of indicators; render them with orjson
+router = APIRouter(
+    prefix="/v1/audit",
+    tags=["Audit Verification"],
+    default_response_class=ORJSONResponse
+)
 
 
 # Pydantic models for API
@@ -61,6 +72,17 @@ _merkle_tree = AuditMerkleTree()
 _timestamp_authority = TimestampAuthority()
 _checkpoint_service: Optional[AuditCheckpoint] = None
 
+#: Seconds a rendered verification report is reused. Bounds how long a
+#: window with a defaulted start, or tampering with already-verified
+#: events, can go unnoticed by a polling client.
+REPORT_CACHE_TTL = 60.0
+
+#: Maximum number of rendered verification reports kept
+REPORT_CACHE_SIZE = 256
+
+# query + newest event hash -> (service, expires_at, rendered body, ETag)
+_report_cache: "OrderedDict[tuple, Tuple[AuditService, float, bytes, str]]" = OrderedDict()
+
 
 def get_checkpoint_service() -> AuditCheckpoint:
     """Get checkpoint service instance."""
@@ -76,12 +98,71 @@ def get_checkpoint_service() -> AuditCheckpoint:
     return _checkpoint_service
 
 
+async def _verify_events(
+    audit_service: AuditService,
+    filter: AuditEventFilter,
+    include_tampering: bool
+) -> VerifyResponse:
+    """
+    Run chain verification (and optionally tampering analysis) for a filter.
+
+    Args:
+        audit_service: Service to read events from
+        filter: Events to verify
+        include_tampering: Whether to run tampering analysis
+
+    Returns:
+        VerifyResponse describing the verification result
+    """
+    if not include_tampering:
+        # Chain-only verification streams pages instead of loading every event
+        chain_result = await _audit_chain.verify_chain_streaming(
+            audit_service.stream_events(filter)
+        )
+        return VerifyResponse(
+            status=chain_result.status.value,
+            chain_result=chain_result.to_dict(),
+            message=f"Verified {chain_result.total_events} events: {chain_result.status.value}"
+        )
+
+    events = await audit_service.query_events(filter)
+
+    if not events:
+        return VerifyResponse(
+            status="valid",
+            chain_result={
+                "status": "valid",
+                "total_events": 0,
+                "message": "No events found in time range"
+            },
+            message="No events found to verify"
+        )
+
+    # Verify chain
+    chain_result = _audit_chain.verify_chain(events)
+
+    # Check for tampering if requested
+    tampering_indicators = []
+    if include_tampering:
+        indicators = _audit_chain.find_tampering(events)
+        tampering_indicators = [ind.to_dict() for ind in indicators]
+
+    return VerifyResponse(
+        status=chain_result.status.value,
+        chain_result=chain_result.to_dict(),
+        tampering_indicators=tampering_indicators,
+        message=f"Verified {len(events)} events: {chain_result.status.value}"
+    )
+
+
 @router.get("/verify", response_model=VerifyResponse)
 async def verify_audit_trail(
+    request: Request,
     organization_id: str = Query(..., description="Organization ID to verify"),
     start_time: Optional[datetime] = Query(None, description="Start of time range (ISO 8601)"),
     end_time: Optional[datetime] = Query(None, description="End of time range (ISO 8601)"),
-    include_tampering: bool = Query(True, description="Include tampering analysis")
+    include_tampering: bool = Query(True, description="Include tampering analysis"),
+    last_n: Optional[int] = Query(None, ge=1, description="Only verify the most recent N events")
 ):
     """
     Verify integrity of audit log for a time range.
@@ -91,7 +172,9 @@ async def verify_audit_trail(
     - Event hash validation
     - Tampering detection (optional)
 
-    Returns a detailed verification report.
+    Returns a detailed verification report. Reports are cached per query
+    and newest event in range for ``REPORT_CACHE_TTL`` seconds and carry an
+    ETag; a matching ``If-None-Match`` gets a 304 without a body.
 
     **Example:**
     ```
@@ -102,6 +185,9 @@ async def verify_audit_trail(
     if not audit_service:
         raise HTTPException(status_code=503, detail="Audit service not available")
 
+    # Defaulted bounds stay out of the cache key so polling can hit it
+    cache_key = (organization_id, start_time, end_time, include_tampering, last_n)
+
     # Default time range: last 30 days
     if not start_time:
         start_time = datetime.now(timezone.utc) - timedelta(days=30)
@@ -113,36 +199,33 @@ async def verify_audit_trail(
         organization_id=organization_id,
         start_time=start_time,
         end_time=end_time,
-        limit=100000
+        limit=last_n or 100000
     )
 
-    events = await audit_service.query_events(filter)
-
-    if not events:
-        return VerifyResponse(
-            status="valid",
-            chain_result={
-                "status": "valid",
-                "total_events": 0,
-                "message": "No events found in time range"
-            },
-            message="No events found to verify"
-        )
-
-    # Verify chain
-    chain_result = _audit_chain.verify_chain(events)
-
-    # Check for tampering if requested
-    tampering_indicators = []
-    if include_tampering:
-        indicators = _audit_chain.find_tampering(events)
-        tampering_indicators = [ind.to_dict() for ind in indicators]
-
-    return VerifyResponse(
-        status=chain_result.status.value,
-        chain_result=chain_result.to_dict(),
-        tampering_indicators=tampering_indicators,
-        message=f"Verified {len(events)} events: {chain_result.status.value}"
+    # The report only changes once a new event lands in the range
+    newest = await audit_service.query_events(dataclasses.replace(filter, limit=1))
+    cache_key += (newest[0].hash if newest else None,)
+
+    now = time.monotonic()
+    entry = _report_cache.get(cache_key)
+    if entry is None or entry[0] is not audit_service or now >= entry[1]:
+        report = await _verify_events(audit_service, filter, include_tampering)
+        body = orjson.dumps(report.model_dump())
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        entry = (audit_service, now + REPORT_CACHE_TTL, body, etag)
+        _report_cache[cache_key] = entry
+        if len(_report_cache) > REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+    else:
+        _report_cache.move_to_end(cache_key)
+
+    etag = entry[3]
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=entry[2],
+        media_type="application/json",
+        headers={"ETag": etag}
     )
 
 
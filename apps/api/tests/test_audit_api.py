@@ -18,7 +18,7 @@ from ..models.audit import (
 )
 from ..services.audit_storage import LocalAuditStorage
 from ..services.audit import AuditService, set_audit_service
-from ..services.audit_export import AuditExportService, ExportFormat
+from ..services.audit_export import AuditExportService, ExportFormat, ExportQueueFull
 from ..src.api.utils.pagination import PaginationCursor, PaginatedResponse
 
 
@@ -268,6 +268,239 @@ async def test_export_with_verification(audit_service, sample_events, temp_expor
     await export_service.stop()
 
 
+@pytest.mark.asyncio
+async def test_export_service_workers(audit_service, sample_events, temp_export_dir):
+    """Test concurrent export workers process every queued job."""
+    import asyncio
+
+    for event in sample_events[:3]:
+        await audit_service.capture_event(
+            organization_id=event.organization_id,
+            event_category=event.event_category,
+            event_type=event.event_type,
+            resource_type=event.resource_type,
+            resource_id=event.resource_id,
+            action=event.action
+        )
+    await asyncio.sleep(0.3)
+
+    export_service = AuditExportService(export_dir=temp_export_dir, concurrency=2)
+    await export_service.start()
+    assert len(export_service._workers) == 2
+
+    filter = AuditEventFilter(organization_id="org-123", limit=100)
+    jobs = [
+        await export_service.create_export(
+            organization_id="org-123",
+            actor_id="user-test",
+            filter=filter,
+            format=format
+        )
+        for format in (ExportFormat.JSON, ExportFormat.CSV, ExportFormat.JSON)
+    ]
+
+    await asyncio.sleep(1.0)
+    for job in jobs:
+        assert (await export_service.get_export(job.export_id)).status.value == "completed"
+
+    await export_service.stop()
+    assert export_service._workers == []
+    assert export_service._store._conn is None
+
+
+@pytest.mark.asyncio
+async def test_export_jobs_survive_restart(audit_service, sample_events, temp_export_dir):
+    """Test export jobs are restored from the job store after a restart."""
+    import asyncio
+
+    await audit_service.capture_event(
+        organization_id="org-123",
+        event_category=EventCategory.DATA,
+        event_type="trace.created",
+        resource_type="trace",
+        resource_id="trace-1",
+        action=Action.CREATE
+    )
+    await asyncio.sleep(0.3)
+
+    export_service = AuditExportService(export_dir=temp_export_dir)
+    await export_service.start()
+
+    filter = AuditEventFilter(
+        organization_id="org-123",
+        start_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        action=Action.CREATE
+    )
+    job = await export_service.create_export(
+        organization_id="org-123",
+        actor_id="user-test",
+        filter=filter,
+        format=ExportFormat.CSV
+    )
+    await asyncio.sleep(1.0)
+    await export_service.stop()
+
+    # Queued but never processed: interrupted by the restart
+    pending = await export_service.create_export(
+        organization_id="org-123",
+        actor_id="user-test",
+        filter=filter,
+        format=ExportFormat.JSON
+    )
+
+    restarted = AuditExportService(export_dir=temp_export_dir)
+
+    restored = await restarted.get_export(job.export_id)
+    assert restored.status.value == "completed"
+    assert restored.actor_id == "user-test"
+    assert restored.filter == filter
+    assert restored.expires_at == (await export_service.get_export(job.export_id)).expires_at
+    assert await restarted.get_export_file(job.export_id) == Path(job.file_path)
+
+    interrupted = await restarted.get_export(pending.export_id)
+    assert interrupted.status.value == "failed"
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_exports(audit_service, temp_export_dir):
+    """Test cleanup removes only exports whose expiry has passed."""
+    import asyncio
+
+    # Exports expire as soon as they complete
+    export_service = AuditExportService(export_dir=temp_export_dir, expiration_hours=0)
+    await export_service.start()
+
+    filter = AuditEventFilter(organization_id="org-123", limit=100)
+    jobs = [
+        await export_service.create_export(
+            organization_id="org-123",
+            actor_id="user-test",
+            filter=filter,
+            format=ExportFormat.JSON
+        )
+        for _ in range(2)
+    ]
+    await asyncio.sleep(1.0)
+    await export_service.stop()
+
+    expired, extended = jobs
+    extended.expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    await export_service.cleanup_expired()
+
+    assert expired.status.value == "expired"
+    assert not Path(expired.file_path).exists()
+    assert extended.status.value == "completed"
+    assert Path(extended.file_path).exists()
+    assert (extended.expires_at, extended.export_id) in export_service._expiry_heap
+
+
+@pytest.mark.asyncio
+async def test_export_queue_full(temp_export_dir):
+    """Test create_export rejects jobs once the queue is full."""
+    # Not started, so queued jobs are never drained
+    export_service = AuditExportService(export_dir=temp_export_dir, max_queued_exports=2)
+    filter = AuditEventFilter(organization_id="org-123")
+
+    for _ in range(2):
+        await export_service.create_export(
+            organization_id="org-123",
+            actor_id="user-test",
+            filter=filter,
+            format=ExportFormat.JSON
+        )
+
+    with pytest.raises(ExportQueueFull):
+        await export_service.create_export(
+            organization_id="org-123",
+            actor_id="user-test",
+            filter=filter,
+            format=ExportFormat.JSON
+        )
+
+    assert len(export_service._jobs) == 2
+
+
+@pytest.mark.asyncio
+async def test_export_streams_events_in_batches(audit_service, temp_export_dir, monkeypatch):
+    """Test exports stream every event when results span several batches."""
+    import asyncio
+    import csv
+    from ..services import audit_export
+
+    monkeypatch.setattr(audit_export, "EXPORT_BATCH_SIZE", 2)
+
+    for i in range(5):
+        await audit_service.capture_event(
+            organization_id="org-123",
+            event_category=EventCategory.DATA,
+            event_type="trace.created",
+            resource_type="trace",
+            resource_id=f"trace-{i}",
+            action=Action.CREATE
+        )
+    await asyncio.sleep(0.3)
+
+    export_service = AuditExportService(export_dir=temp_export_dir)
+    await export_service.start()
+
+    job = await export_service.create_export(
+        organization_id="org-123",
+        actor_id="user-test",
+        filter=AuditEventFilter(organization_id="org-123", limit=100),
+        format=ExportFormat.CSV
+    )
+    await asyncio.sleep(1.0)
+    await export_service.stop()
+
+    job = await export_service.get_export(job.export_id)
+    assert job.status.value == "completed"
+    assert job.event_count == 5
+
+    with open(job.file_path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert sorted(row["resource_id"] for row in rows) == [f"trace-{i}" for i in range(5)]
+
+
+def test_export_json_matches_to_dict(sample_events, temp_export_dir):
+    """Test JSON exports hold each event's to_dict() form."""
+    import json
+
+    export_service = AuditExportService(export_dir=temp_export_dir)
+    events = sample_events[:3]
+
+    plain_path = Path(temp_export_dir) / "plain.json"
+    export_service._export_json(events, plain_path, include_verification=False)
+    with open(plain_path) as f:
+        assert json.load(f) == [event.to_dict() for event in events]
+
+    empty_path = Path(temp_export_dir) / "empty.json"
+    export_service._export_json([], empty_path, include_verification=False)
+    with open(empty_path) as f:
+        assert json.load(f) == []
+
+    ndjson_path = Path(temp_export_dir) / "plain.ndjson"
+    assert export_service._export_ndjson(events, ndjson_path, include_verification=False) == 3
+    with open(ndjson_path) as f:
+        assert [json.loads(line) for line in f] == [event.to_dict() for event in events]
+
+    verified_path = Path(temp_export_dir) / "verified.json"
+    export_service._export_json(events, verified_path, include_verification=True)
+    with open(verified_path) as f:
+        exported = json.load(f)
+    assert exported == [
+        {
+            **event.to_dict(),
+            "_verification": {
+                "hash": event.hash,
+                "previous_hash": event.previous_hash,
+                "hash_valid": True
+            }
+        }
+        for event in events
+    ]
+
+
 # Access Control Tests
 
 def test_rate_limiter():
@@ -2,6 +2,7 @@
 Tests for audit event models.
 """
 
+import json
 import pytest
 from datetime import datetime, timezone
 from uuid import uuid4
@@ -113,6 +114,31 @@ def test_audit_event_hash_verification():
     assert event.verify_hash() is False
 
 
+def test_audit_event_hash_field_boundaries():
+    """Test that moving content between fields or None vs "" changes the hash."""
+    base = dict(
+        event_id="test-123",
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        organization_id="org-123",
+        event_category=EventCategory.DATA,
+        event_type=DataEventTypes.TRACE_CREATED,
+        action=Action.CREATE,
+        request_id="req-123"
+    )
+
+    event1 = AuditEvent(resource_type="trace", resource_id="abc", **base)
+    event2 = AuditEvent(resource_type="tracea", resource_id="bc", **base)
+    assert event1.hash != event2.hash
+
+    event3 = AuditEvent(resource_type="trace", resource_id="abc", project_id="", **base)
+    assert event1.hash != event3.hash
+
+    # State dictionaries hash the same regardless of key order
+    event4 = AuditEvent(resource_type="trace", new_state={"a": 1, "b": 2}, **base)
+    event5 = AuditEvent(resource_type="trace", new_state={"b": 2, "a": 1}, **base)
+    assert event4.hash == event5.hash
+
+
 def test_audit_event_chain_verification():
     """Test blockchain-style chain verification."""
     # Create first event
@@ -192,6 +218,51 @@ def test_audit_event_to_dict():
     assert "hash" in data
 
 
+def test_audit_event_to_json_bytes_matches_to_dict():
+    """Test that direct JSON serialization matches to_dict()."""
+    event = AuditEvent(
+        event_id="test-123",
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc),
+        organization_id="org-123",
+        actor_type=ActorType.USER,
+        event_category=EventCategory.DATA,
+        event_type=DataEventTypes.TRACE_CREATED,
+        resource_type="trace",
+        resource_id="trace-123",
+        action=Action.CREATE,
+        new_state={"name": "Trace"},
+        request_id="req-123"
+    )
+
+    assert json.loads(event.to_json_bytes()) == event.to_dict()
+
+    # Non-string state keys are stringified, as json.dumps(to_dict()) does
+    event.previous_state = {1: "a", None: "b"}
+    data = json.loads(event.to_json_bytes())
+    assert data == json.loads(json.dumps(event.to_dict()))
+    assert data["previous_state"] == {"1": "a", "null": "b"}
+
+
+def test_audit_event_to_tuple_matches_to_dict():
+    """Test that to_tuple() holds the to_dict() values in field order."""
+    event = AuditEvent(
+        event_id="test-123",
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        organization_id="org-123",
+        actor_type=ActorType.USER,
+        event_category=EventCategory.DATA,
+        event_type=DataEventTypes.TRACE_CREATED,
+        resource_type="trace",
+        resource_id="trace-123",
+        action=Action.CREATE,
+        new_state={"name": "Trace"},
+        request_id="req-123"
+    )
+
+    assert event.to_tuple() == tuple(event.to_dict().values())
+    assert AuditEvent.CSV_COLUMNS == tuple(event.to_dict())
+
+
 def test_audit_event_from_dict():
     """Test creation from dictionary."""
     data = {
@@ -229,6 +300,64 @@ def test_audit_event_from_dict():
     assert isinstance(event.timestamp, datetime)
 
 
+def test_audit_event_from_dict_keeps_stored_hash():
+    """Test that a stored hash survives loading and exposes tampering."""
+    event = AuditEvent(
+        event_id="test-123",
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        organization_id="org-123",
+        event_category=EventCategory.DATA,
+        event_type=DataEventTypes.TRACE_CREATED,
+        resource_type="trace",
+        resource_id="trace-123",
+        action=Action.CREATE,
+        request_id="req-123"
+    )
+    data = event.to_dict()
+
+    loaded = AuditEvent.from_dict(dict(data))
+    assert loaded.hash == event.hash
+    assert loaded.verify_hash() is True
+
+    # Raw digest bytes are accepted too
+    loaded = AuditEvent.from_dict({**data, "hash": bytes.fromhex(event.hash)})
+    assert loaded.hash == event.hash
+
+    tampered = AuditEvent.from_dict({**data, "resource_id": "trace-456"})
+    assert tampered.hash == event.hash
+    assert tampered.verify_hash() is False
+
+
+def test_audit_event_from_dict_verifies_version_1_hash():
+    """Test that events stored without a hash version verify with scheme 1."""
+    data = AuditEvent(
+        event_id="test-123",
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        organization_id="org-123",
+        event_category=EventCategory.DATA,
+        event_type=DataEventTypes.TRACE_CREATED,
+        resource_type="trace",
+        resource_id="trace-123",
+        action=Action.CREATE,
+        new_state={"name": "Trace"},
+        request_id="req-123"
+    ).to_dict()
+    assert data.pop("hash_version") == AuditEvent.HASH_VERSION
+
+    # Hash written by the original json.dumps-based scheme
+    data["hash"] = "da5f0a3fcd0392863c1fcb117fc8295d96ac5c9329fe7e16c3feec13c49bc8f3"
+
+    loaded = AuditEvent.from_dict(data)
+    assert loaded.hash_version == 1
+    assert loaded.verify_hash() is True
+
+    tampered = AuditEvent.from_dict({**data, "resource_id": "trace-456"})
+    assert tampered.verify_hash() is False
+
+    with pytest.raises(ValueError):
+        AuditEvent.from_dict({**data, "hash_version": 99})
+
+
 def test_audit_event_with_state():
     """Test audit event with previous and new state."""
     previous = {"name": "Old Name", "value": 100}
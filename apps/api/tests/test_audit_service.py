@@ -6,6 +6,9 @@ import pytest
 import asyncio
 import tempfile
 import shutil
+import threading
+import time
+import uuid
 from datetime import datetime, timezone
 
 from ..models.audit import (
@@ -17,7 +20,9 @@ from ..models.audit import (
     Action,
 )
 from ..services.audit_storage import LocalAuditStorage
-from ..services.audit import AuditService
+from ..services.audit import AuditService, audit_context, set_current_request_id
+from ..services._uuid_pool import UUIDPool
+from ..services.audit_verification import AuditMerkleTree
 
 
 @pytest.fixture
@@ -144,6 +149,60 @@ async def test_event_chain_maintenance(audit_service):
     assert result["total_events"] == 3
 
 
+@pytest.mark.asyncio
+async def test_concurrent_captures_keep_chains_linear(audit_service):
+    """Test concurrent captures for several orgs never fork a chain."""
+    await asyncio.gather(*(
+        audit_service.capture_event(
+            organization_id=f"org-{i % 2}",
+            event_category=EventCategory.DATA,
+            event_type="trace.created",
+            resource_type="trace",
+            resource_id=f"trace-{i}",
+            action=Action.CREATE
+        )
+        for i in range(20)
+    ))
+
+    await audit_service.stop()
+
+    for org_id in ("org-0", "org-1"):
+        events = await audit_service.query_events(
+            AuditEventFilter(organization_id=org_id)
+        )
+        previous_hashes = [event.previous_hash for event in events]
+        assert len(events) == 10
+        assert len(set(previous_hashes)) == 10
+
+
+@pytest.mark.asyncio
+async def test_chain_checkpoint_matches_merkle_tree(audit_service):
+    """Test the incremental chain checkpoint matches a full Merkle build."""
+    for i in range(7):
+        await audit_service.capture_event(
+            organization_id="org-123",
+            event_category=EventCategory.DATA,
+            event_type="trace.created",
+            resource_type="trace",
+            resource_id=f"trace-{i}",
+            action=Action.CREATE
+        )
+
+    await audit_service.stop()
+
+    events = await audit_service.query_events(
+        AuditEventFilter(organization_id="org-123")
+    )
+    events.sort(key=lambda e: e.timestamp)
+
+    checkpoint = audit_service.get_chain_checkpoint("org-123")
+    assert checkpoint["event_count"] == 7
+    assert checkpoint["last_event_hash"] == events[-1].hash
+    assert checkpoint["merkle_root"] == AuditMerkleTree().build_tree(events).root_hash
+
+    assert audit_service.get_chain_checkpoint("org-other")["event_count"] == 0
+
+
 @pytest.mark.asyncio
 async def test_batch_processing(audit_service):
     """Test batch processing of events."""
@@ -214,6 +273,46 @@ async def test_deduplication(audit_service):
     assert len(events) == 1
 
 
+@pytest.mark.asyncio
+async def test_org_version_tracks_captured_events(audit_service):
+    """Test that the org version only moves when an event is captured."""
+    assert audit_service.get_org_version("org-123") == 0
+
+    for _ in range(2):
+        await audit_service.capture_event(
+            organization_id="org-123",
+            event_category=EventCategory.DATA,
+            event_type="trace.viewed",
+            resource_type="trace",
+            resource_id="trace-123",
+            action=Action.READ
+        )
+
+    # Second capture is a duplicate and is skipped
+    assert audit_service.get_org_version("org-123") == 1
+    assert audit_service.get_org_version("org-456") == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_events_pages_through_results():
+    """Test that streaming pages through storage and honors limit/offset."""
+    stored = list(range(10))
+    queried = []
+
+    class PagedStorage:
+        async def query_events(self, filter):
+            queried.append((filter.offset, filter.limit))
+            return stored[filter.offset:filter.offset + filter.limit]
+
+    service = AuditService(storage=PagedStorage())
+    filter = AuditEventFilter(organization_id="org-123", limit=5, offset=3)
+
+    streamed = [event async for event in service.stream_events(filter, page_size=2)]
+
+    assert streamed == [3, 4, 5, 6, 7]
+    assert queried == [(3, 2), (5, 2), (7, 1)]
+
+
 @pytest.mark.asyncio
 async def test_deduplication_different_resources(audit_service):
     """Test that deduplication works per resource."""
@@ -283,6 +382,94 @@ async def test_enrichment_callback(audit_service):
     assert events[0].new_state.get("enriched") is True
     assert events[0].new_state.get("version") == "1.0"
 
+    # The stored hash covers the enriched content
+    result = await audit_service.verify_integrity("org-123")
+    assert result["valid"] is True
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_enrichment_keeps_chain_linear(audit_service):
+    """Test callbacks run off the loop still chain events in capture order."""
+    def tag_event(event: AuditEvent) -> AuditEvent:
+        # Earlier captures finish later
+        time.sleep(0.01 * (5 - int(event.resource_id[-1])))
+        event.actor_email = threading.current_thread().name
+        return event
+
+    audit_service.add_enrichment_callback(tag_event, cpu_bound=True)
+
+    await asyncio.gather(*(
+        audit_service.capture_event(
+            organization_id="org-123",
+            event_category=EventCategory.DATA,
+            event_type="trace.created",
+            resource_type="trace",
+            resource_id=f"trace-{i}",
+            action=Action.CREATE
+        )
+        for i in range(5)
+    ))
+
+    await audit_service.stop()
+
+    events = await audit_service.query_events(
+        AuditEventFilter(organization_id="org-123")
+    )
+    hashes = {event.hash for event in events}
+    linked = [event.previous_hash for event in events if event.previous_hash]
+
+    assert len(events) == 5
+    assert all(e.actor_email.startswith("audit-enrichment") for e in events)
+    assert len(set(linked)) == 4
+    assert set(linked) <= hashes
+
+    # Chain order is capture order, which is also timestamp order
+    chain = sorted(events, key=lambda e: e.timestamp)
+    assert [e.resource_id for e in chain] == [f"trace-{i}" for i in range(5)]
+    assert chain[0].previous_hash == ""
+    assert all(
+        later.previous_hash == earlier.hash
+        for earlier, later in zip(chain, chain[1:])
+    )
+
+    result = await audit_service.verify_integrity("org-123")
+    assert result["valid"] is True
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_enrichment_keeps_capture_timestamp(audit_service):
+    """Test an offloaded callback cannot change the capture timestamp."""
+    backdated = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    enriched_at = []
+
+    def backdate_event(event: AuditEvent) -> AuditEvent:
+        enriched_at.append(datetime.now(timezone.utc))
+        event.timestamp = backdated
+        return event
+
+    audit_service.add_enrichment_callback(backdate_event, cpu_bound=True)
+
+    before = datetime.now(timezone.utc)
+    await audit_service.capture_event(
+        organization_id="org-123",
+        event_category=EventCategory.DATA,
+        event_type="trace.imported",
+        resource_type="trace",
+        resource_id="trace-1",
+        action=Action.CREATE
+    )
+
+    await audit_service.stop()
+
+    events = await audit_service.query_events(
+        AuditEventFilter(organization_id="org-123")
+    )
+
+    assert len(events) == 1
+    assert before <= events[0].timestamp <= enriched_at[0]
+    assert events[0].verify_hash()
+    assert audit_service._chain_tails == {}
+
 
 @pytest.mark.asyncio
 async def test_capture_with_state(audit_service):
@@ -448,3 +635,72 @@ async def test_flush_on_stop(storage):
     events = await storage.query_events(filter)
 
     assert len(events) == 5
+
+
+def test_uuid_pool_generates_unique_uuid4_strings():
+    """Test pooled event IDs are distinct, canonical version 4 UUIDs."""
+    pool = UUIDPool(size=8)
+    ids = [pool.next() for _ in range(20)]
+
+    assert len(set(ids)) == 20
+    for event_id in ids:
+        parsed = uuid.UUID(event_id)
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+        assert str(parsed) == event_id
+
+
+@pytest.mark.asyncio
+async def test_audit_context_skips_events_below_min_severity(storage):
+    """Test audit_context only records events at or above min_severity."""
+    service = AuditService(storage=storage, min_severity=Severity.WARNING)
+    await service.start()
+
+    for i, severity in enumerate((Severity.INFO, Severity.CRITICAL)):
+        async with audit_context(
+            audit_service=service,
+            organization_id="org-123",
+            event_category=EventCategory.CONFIG,
+            event_type="project.updated",
+            resource_type="project",
+            resource_id=f"proj-{i}",
+            action=Action.UPDATE,
+            severity=severity
+        ) as ctx:
+            ctx.after = {"name": "New Name"}
+
+    await service.stop()
+
+    events = await storage.query_events(AuditEventFilter(organization_id="org-123"))
+    assert [event.event_severity for event in events] == [Severity.CRITICAL]
+
+
+@pytest.mark.asyncio
+async def test_capture_event_inherits_current_request_id(audit_service):
+    """Test events without a request_id take the current request's ID."""
+    set_current_request_id("req-from-middleware")
+
+    await audit_service.capture_event(
+        organization_id="org-123",
+        event_category=EventCategory.DATA,
+        event_type="trace.created",
+        resource_type="trace",
+        resource_id="trace-1",
+        action=Action.CREATE
+    )
+    await audit_service.capture_event(
+        organization_id="org-123",
+        event_category=EventCategory.DATA,
+        event_type="trace.created",
+        resource_type="trace",
+        resource_id="trace-2",
+        action=Action.CREATE,
+        request_id="req-explicit"
+    )
+
+    await audit_service.stop()
+
+    events = await audit_service.query_events(AuditEventFilter(organization_id="org-123"))
+    assert sorted(event.request_id for event in events) == [
+        "req-explicit", "req-from-middleware"
+    ]
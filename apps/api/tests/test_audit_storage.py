@@ -81,6 +81,20 @@ async def test_write_event_prevent_overwrite(storage, sample_event):
     assert result2 is False  # Should fail to prevent overwrite
 
 
+@pytest.mark.asyncio
+async def test_write_event_non_string_state_keys(storage, sample_event):
+    """Test that state dictionaries with non-string keys are stored."""
+    sample_event.new_state = {1: "a", 2: "b"}
+    sample_event.hash = sample_event._compute_hash()
+
+    result = await storage.write_event(sample_event)
+    assert result is True
+
+    retrieved = await storage.read_event(sample_event.event_id)
+    assert retrieved.new_state == {"1": "a", "2": "b"}
+    assert retrieved.verify_hash() is True
+
+
 @pytest.mark.asyncio
 async def test_write_events_batch(storage):
     """Test batch writing of events."""
@@ -4,6 +4,8 @@ Tests for audit verification system.
 
 import pytest
 from datetime import datetime, date, timezone, timedelta
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from ..models.audit import (
     AuditEvent,
@@ -22,6 +24,10 @@ from ..services.audit_verification import (
     TimestampAuthority,
     AuditCheckpoint
 )
+from ..services._hash_batch import hash_pairs
+from ..services.audit import AuditService, set_audit_service
+from ..services.audit_storage import LocalAuditStorage
+from ..src.api.routes import audit_verification as verification_routes
 
 
 @pytest.fixture
@@ -222,6 +228,47 @@ def test_verify_chain_broken_link(audit_chain, sample_events):
     assert "event-2" in result.broken_links
 
 
+async def _newest_first(events):
+    """Yield events newest first, as AuditService.stream_events does."""
+    for event in reversed(events):
+        yield event
+
+
+@pytest.mark.asyncio
+async def test_verify_chain_streaming_matches_verify_chain(audit_chain, sample_events):
+    """Test streaming verification agrees with in-memory verification."""
+    sample_events[2].hash = "tampered_hash"
+    sample_events[4].previous_hash = "wrong_hash"
+
+    expected = audit_chain.verify_chain(sample_events)
+    result = await audit_chain.verify_chain_streaming(_newest_first(sample_events))
+
+    assert result.status == expected.status
+    assert result.total_events == expected.total_events
+    assert result.valid_events == expected.valid_events
+    assert result.invalid_events == expected.invalid_events
+    assert sorted(result.hash_mismatches) == sorted(expected.hash_mismatches)
+    assert sorted(result.broken_links) == sorted(expected.broken_links)
+    assert result.first_event_id == "event-0"
+    assert result.last_event_id == "event-4"
+
+
+@pytest.mark.asyncio
+async def test_verify_chain_streaming_caps_errors(audit_chain, sample_events):
+    """Test streaming verification bounds the error lists."""
+    for event in sample_events:
+        event.hash = "tampered_hash"
+
+    result = await audit_chain.verify_chain_streaming(
+        _newest_first(sample_events), max_errors=2
+    )
+
+    assert result.status == VerificationStatus.INVALID
+    assert result.invalid_events == 5
+    assert len(result.hash_mismatches) == 2
+    assert result.errors[-1] == {"type": "errors_truncated", "omitted": 3}
+
+
 def test_find_tampering_none(audit_chain, sample_events):
     """Test tampering detection with valid events."""
     indicators = audit_chain.find_tampering(sample_events)
@@ -465,3 +512,125 @@ def test_merkle_tree_with_power_of_two_events(merkle_tree):
         proof = merkle_tree.generate_proof(event, root)
         assert proof is not None
         assert merkle_tree.verify_proof(event, proof, root) is True
+
+
+def test_merkle_tree_with_odd_event_count(merkle_tree, sample_events):
+    """Test Merkle tree duplicates the last node and proves every event."""
+    events = sample_events[:3]
+    root = merkle_tree.build_tree(events)
+
+    left = merkle_tree._hash_pair(events[0].hash, events[1].hash)
+    right = merkle_tree._hash_pair(events[2].hash, events[2].hash)
+    assert root.root_hash == merkle_tree._hash_pair(left, right)
+
+    for event in events:
+        proof = merkle_tree.generate_proof(event, root)
+        assert merkle_tree.verify_proof(event, proof, root) is True
+
+
+def test_hash_pairs_matches_hash_pair(merkle_tree, sample_events):
+    """Test batched pair hashing matches hashing each pair separately."""
+    hashes = [event.hash for event in sample_events[:4]]
+    digests = hash_pairs("".join(hashes).encode("ascii"))
+
+    assert digests.hex() == (
+        merkle_tree._hash_pair(hashes[0], hashes[1])
+        + merkle_tree._hash_pair(hashes[2], hashes[3])
+    )
+
+    with pytest.raises(ValueError):
+        hash_pairs(b"x" * 100)
+
+
+def test_build_tree_stores_levels(merkle_tree, sample_events):
+    """Test Merkle tree is stored as levels and materialized on demand."""
+    root = merkle_tree.build_tree(sample_events)
+
+    assert root.leaf_event_ids == [event.event_id for event in sample_events]
+    assert [level.n for level in root.levels] == [3, 2, 1]
+    assert root.levels[-1].hash_at(0) == root.root_hash
+
+    tree = root.tree
+    assert tree.hash == root.root_hash
+    assert tree.left.left.left.event_id == "event-0"
+    assert root.tree is tree
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 5])
+def test_generate_proof_every_leaf(merkle_tree, sample_events, count):
+    """Test index-based proofs verify for every leaf at every tree size."""
+    events = sample_events[:count]
+    root = merkle_tree.build_tree(events)
+
+    for event in events:
+        proof = merkle_tree.generate_proof(event, root)
+        assert merkle_tree.verify_proof(event, proof, root) is True
+
+
+@pytest.mark.asyncio
+async def test_verify_route_streams_chain(tmp_path, sample_events):
+    """Test the verify endpoint streams chain-only verification as JSON."""
+    storage = LocalAuditStorage(base_path=str(tmp_path))
+    await storage.write_events_batch(sample_events)
+    set_audit_service(AuditService(storage=storage))
+
+    app = FastAPI()
+    app.include_router(verification_routes.router)
+
+    try:
+        response = TestClient(app).get(
+            "/v1/audit/verify",
+            params={
+                "organization_id": "org-123",
+                "start_time": "2024-01-01T00:00:00Z",
+                "include_tampering": "false",
+            },
+        )
+    finally:
+        set_audit_service(None)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["status"] == "valid"
+    assert data["chain_result"]["total_events"] == 5
+
+
+@pytest.mark.asyncio
+async def test_verify_route_etag(tmp_path, sample_events):
+    """Test repeated verify requests are served from cache with an ETag."""
+    storage = LocalAuditStorage(base_path=str(tmp_path))
+    await storage.write_events_batch(sample_events[:4])
+    set_audit_service(AuditService(storage=storage))
+
+    app = FastAPI()
+    app.include_router(verification_routes.router)
+    client = TestClient(app)
+    params = {
+        "organization_id": "org-123",
+        "start_time": "2024-01-01T00:00:00Z",
+        "include_tampering": "false",
+    }
+
+    try:
+        first = client.get("/v1/audit/verify", params=params)
+        etag = first.headers["etag"]
+
+        cached = client.get(
+            "/v1/audit/verify", params=params, headers={"If-None-Match": etag}
+        )
+
+        # A new event in range invalidates the cached report
+        await storage.write_events_batch(sample_events[4:])
+        updated = client.get(
+            "/v1/audit/verify", params=params, headers={"If-None-Match": etag}
+        )
+    finally:
+        set_audit_service(None)
+
+    assert first.status_code == 200
+    assert first.json()["chain_result"]["total_events"] == 4
+    assert cached.status_code == 304
+    assert updated.status_code == 200
+    assert updated.headers["etag"] != etag
+    assert updated.json()["chain_result"]["total_events"] == 5
@@ -8,7 +8,7 @@ from fastapi.testclient import TestClient
 from ..ingestion_api import app
 from ..services.ingestion import IngestionService
 from ..services.storage import LocalFileStorage
-from ..routers import traces
+from ..routers import health, traces
 
 
 @pytest.fixture
@@ -116,6 +116,18 @@ class TestMetricsEndpoint:
         assert data["spans_accepted_total"] >= 1
 
 
+    def test_metrics_cached_briefly(self, client, ingestion_service):
+        """Test metrics are served from cache within the TTL."""
+        first = client.get("/v1/metrics").json()
+
+        ingestion_service.stats.spans_received += 5
+        assert client.get("/v1/metrics").json() == first
+
+        health._response_cache.clear()
+        data = client.get("/v1/metrics").json()
+        assert data["spans_received_total"] == first["spans_received_total"] + 5
+
+
 class TestRootEndpoint:
     """Tests for root endpoint."""
 
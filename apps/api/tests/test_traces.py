@@ -6,7 +6,9 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock
 import asyncio
+import msgspec
 
+from .. import ingestion_api
 from ..ingestion_api import app
 from ..services.ingestion import IngestionService
 from ..services.storage import LocalFileStorage
@@ -113,6 +115,56 @@ class TestBatchIngestion:
         data = response.json()
         assert "errors" in data or "detail" in data
 
+    def test_batch_ingestion_validation_error_truncated(self, client, monkeypatch):
+        """Test that 422 responses report at most MAX_VALIDATION_ERRORS errors."""
+        monkeypatch.setattr(
+            ingestion_api,
+            "SETTINGS",
+            msgspec.structs.replace(ingestion_api.SETTINGS, max_validation_errors=2),
+        )
+        request_data = {
+            "project_id": "test-project",
+            "environment": "test",
+            "spans": [{"name": "test-span"} for _ in range(5)],
+        }
+
+        response = client.post("/v1/traces", json=request_data)
+
+        assert response.status_code == 422
+        data = response.json()
+        assert len(data["errors"]) == 2
+        assert data["error_count"] > 2
+
+    def test_batch_ingestion_coerces_like_pydantic(self, client):
+        """Test the msgspec fast path accepts inputs Pydantic would coerce."""
+        request_data = {
+            "project_id": "test-project",
+            "spans": [
+                {
+                    "trace_id": "550e8400-e29b-41d4-a716-446655440000",
+                    "span_id": "550e8400-e29b-41d4-a716-446655440001",
+                    "name": "test-span",
+                    "start_time": "2024-01-01T00:00:00Z",
+                    "duration": "1.5",
+                    "span_type": "llm_call",
+                }
+            ],
+        }
+
+        response = client.post("/v1/traces", json=request_data)
+
+        assert response.status_code == 202
+        assert response.json()["accepted"] == 1
+
+    def test_batch_ingestion_documents_request_body(self, client):
+        """Test the batch body schema is still published in OpenAPI."""
+        schema = client.get("/openapi.json").json()
+        body = schema["paths"]["/v1/traces"]["post"]["requestBody"]
+
+        properties = body["content"]["application/json"]["schema"]["properties"]
+        assert "spans" in properties
+        assert "trace_id" in properties["spans"]["items"]["properties"]
+
     def test_batch_ingestion_empty_spans(self, client):
         """Test batch ingestion with empty spans array."""
         request_data = {
@@ -268,3 +320,17 @@ class TestPartialSuccess:
         assert len(data["errors"]) > 0
 
         await service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_ingest_spans_accepts_prefix(self, storage):
+        """Test bulk ingestion accepts the spans that fit and rejects the rest."""
+        service = IngestionService(storage=storage, max_queue_size=3)
+        spans = [object() for _ in range(5)]
+
+        accepted = await service.ingest_spans(spans, "test-project", "test")
+
+        assert accepted == 3
+        assert service.queued_spans == 3
+        assert service.queue.qsize() == 1
+        assert service.stats.spans_rejected == 2
+        assert await service.ingest_spans(spans[:1], "test-project", "test") == 0